@@ -1,3 +1,5 @@
+from importlib import import_module
+
 # === Non-bipartite ===
 from .stableRoommatesProblem import StableRoommatesProblem
 from .stableRoommatesProblem import StableRoommatesProblem as SR
@@ -21,20 +23,76 @@ from .stableMarriageProblemWithTies import StableMarriageProblemWithTies as SMT
 from .hospitalResidentsProblemWithTies import HospitalResidentsProblemWithTies
 from .hospitalResidentsProblemWithTies import HospitalResidentsProblemWithTies as HRT
 
-# === SPA-P ===
-
-from .studentProjectAllocationProjects import StudentProjectAllocationProjectsSingle
-from .studentProjectAllocationProjects import StudentProjectAllocationProjectsMultiple
+# === Compiled Instances ===
 
-from .studentProjectAllocationProjects import (
-    StudentProjectAllocationProjectsSingle as SPAP_Single,
+from .stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
 )
-from .studentProjectAllocationProjects import (
-    StudentProjectAllocationProjectsMultiple as SPAP_Multiple,
+from .stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
 )
-from .stableMatchings.studentProjectAllocation.SPA_P import utils as SPAP_utils
 
-from .stableMatchings.studentProjectAllocation.SPA_P import (
-    instanceGenerators as SPAP_instanceGenerators,
-)
-from .stableMatchings.studentProjectAllocation.SPA_P import instanceGenerators as SPAPIG
+# === Binary Instances ===
+
+from .binaryInstances.binaryPreferenceInstance import BinaryPreferenceInstance
+from .binaryInstances.binaryInstanceWriter import write_binary_instance
+
+# === Stability Checking ===
+
+from .stabilityCheckers.smStabilityChecker import SMStabilityChecker
+from .stabilityCheckers.hrStabilityChecker import HRStabilityChecker
+from .stabilityCheckers.spaStabilityChecker import SPAStabilityChecker
+from .stabilityCheckers.srStabilityChecker import SRStabilityChecker
+
+# === Lazily Loaded ===
+# imported on first use, so that importing the package does not pay for them: SPA-P
+# needs Gurobi, an optional extra, along with numpy and tqdm, and batch solving
+# needs multiprocessing
+
+_LAZY_EXPORTS = {
+    # --- Batch Solving ---
+    "BatchSolver": (".batchSolver", "BatchSolver"),
+    "BatchResult": (".batchSolver", "BatchResult"),
+    # --- SPA-P ---
+    "StudentProjectAllocationProjectsSingle": (
+        ".studentProjectAllocationProjects",
+        "StudentProjectAllocationProjectsSingle",
+    ),
+    "StudentProjectAllocationProjectsMultiple": (
+        ".studentProjectAllocationProjects",
+        "StudentProjectAllocationProjectsMultiple",
+    ),
+    "SPAP_Single": (
+        ".studentProjectAllocationProjects",
+        "StudentProjectAllocationProjectsSingle",
+    ),
+    "SPAP_Multiple": (
+        ".studentProjectAllocationProjects",
+        "StudentProjectAllocationProjectsMultiple",
+    ),
+    "SPAP_utils": (".stableMatchings.studentProjectAllocation.SPA_P.utils", None),
+    "SPAP_instanceGenerators": (
+        ".stableMatchings.studentProjectAllocation.SPA_P.instanceGenerators",
+        None,
+    ),
+    "SPAPIG": (
+        ".stableMatchings.studentProjectAllocation.SPA_P.instanceGenerators",
+        None,
+    ),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_EXPORTS[name]
+    module = import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    # later lookups find it directly, without calling this again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
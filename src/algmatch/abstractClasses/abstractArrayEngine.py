@@ -0,0 +1,78 @@
+"""
+Abstract class for solvers that run on integer-indexed array buffers rather than on
+the name-keyed preference dictionaries.
+
+The buffers are compiled from a preference instance, or read straight from a
+memory-mapped binary instance, in which case they are read-only.
+"""
+
+from array import array
+
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+
+
+class AbstractArrayEngine:
+    def compile_lists(self, proposers, proposer_names, receivers, receiver_names):
+        """
+        Utility. Builds flat buffers for one side from a cleaned, ranked instance.
+
+        :param proposers: dictionary with information for e.g. men, residents
+        :param proposer_names: proposer names, in index order
+        :param receivers: dictionary with information for e.g. women, hospitals
+        :param receiver_names: receiver names, in index order
+        :return: offsets, targets and target ranks, where the list of proposer i is
+            targets[offsets[i] : offsets[i + 1]] and target_ranks[k] is the rank of
+            the proposer in the list of targets[k]
+        """
+        receiver_index = {name: idx for idx, name in enumerate(receiver_names)}
+
+        offsets = array("i", [0])
+        targets = array("i")
+        target_ranks = array("i")
+        for proposer in proposer_names:
+            for receiver in proposers[proposer]["list"]:
+                targets.append(receiver_index[receiver])
+                target_ranks.append(receivers[receiver]["rank"][proposer])
+            offsets.append(len(targets))
+
+        return offsets, targets, target_ranks
+
+    def get_names(self, group):
+        """
+        :param group: e.g. "residents"
+        :return: participant names of the group, in index order
+        """
+        if isinstance(self._reader, BinaryPreferenceInstance):
+            return self._reader.get_names(group)
+        return list(getattr(self._reader, group))
+
+    def get_lists(self, group, group_names, target_group, target_names):
+        """
+        :param group: group whose lists are needed, e.g. "residents"
+        :param group_names: names of the group, in index order
+        :param target_group: group the lists are over, e.g. "hospitals"
+        :param target_names: names of the target group, in index order
+        :return: offsets, targets and target ranks, as for compile_lists
+        """
+        if isinstance(self._reader, BinaryPreferenceInstance):
+            return self._reader.get_lists(group)
+        return self.compile_lists(
+            getattr(self._reader, group),
+            group_names,
+            getattr(self._reader, target_group),
+            target_names,
+        )
+
+    def get_quotas(self, group, group_names, quota_key):
+        """
+        :param group: e.g. "hospitals"
+        :param group_names: names of the group, in index order
+        :param quota_key: key of the quota in the group's dictionaries, e.g. "capacity"
+        :return: the quota of each participant, in index order
+        """
+        if isinstance(self._reader, BinaryPreferenceInstance):
+            return self._reader.get_quotas(group)
+        participants = getattr(self._reader, group)
+        return array("i", [participants[p][quota_key] for p in group_names])
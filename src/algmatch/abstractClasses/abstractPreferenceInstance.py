@@ -2,9 +2,12 @@
 Abstract class to store preference lists for both sides in a type of matching problem.
 """
 
-from itertools import product
 import os
 
+from algmatch.binaryInstances.binaryLayouts import is_binary_instance
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
 from algmatch.errors.InstanceSetupErrors import PrefRepError, PrefNotFoundError
 
 
@@ -21,7 +24,10 @@ class AbstractPreferenceInstance:
 
         if filename is not None:
             assert os.path.isfile(filename), f"File {filename} does not exist"
-            self._load_from_file(filename)
+            if is_binary_instance(filename):
+                self._load_from_binary(filename)
+            else:
+                self._load_from_file(filename)
 
         if dictionary is not None:
             self._load_from_dictionary(dictionary)
@@ -37,6 +43,10 @@ class AbstractPreferenceInstance:
     def _load_from_dictionary(self, dictionary: dict) -> None:
         raise NotImplementedError("Method not implemented")
 
+    def _load_from_binary(self, filename: str) -> None:
+        with BinaryPreferenceInstance(filename) as binary:
+            binary.load_into(self)
+
     def check_preference_lists(self) -> None:
         raise NotImplementedError("Method not implemented")
 
@@ -48,15 +58,15 @@ class AbstractPreferenceInstance:
         :param a_side: dictionary with information for e.g. men, residents
         :param b_side: dictionary with information for e.g. women, hospitals
         """
-        for a, b in product(a_side, b_side):
-            a_in_b_list = a in b_side[b]["list"]
-            b_in_a_list = b in a_side[a]["list"]
-
-            if not a_in_b_list or not b_in_a_list:
-                if b_in_a_list:
-                    a_side[a]["list"].remove(b)
-                if a_in_b_list:
-                    b_side[b]["list"].remove(a)
+        # membership is taken from the lists before any are cleaned, which also
+        # covers both sides being the same group, e.g. roommates
+        a_accepts = {a: set(a_prefs["list"]) for a, a_prefs in a_side.items()}
+        b_accepts = {b: set(b_prefs["list"]) for b, b_prefs in b_side.items()}
+
+        for a, a_prefs in a_side.items():
+            a_prefs["list"][:] = [b for b in a_prefs["list"] if a in b_accepts[b]]
+        for b, b_prefs in b_side.items():
+            b_prefs["list"][:] = [a for a in b_prefs["list"] if b in a_accepts[a]]
 
     def set_up_rankings(self) -> None:
         raise NotImplementedError("Method not implemented")
@@ -25,6 +25,28 @@ class AbstractPreferenceInstanceWithTies(AbstractPreferenceInstance):
             return True
         return False
 
+    def clean_unacceptable_pairs(self, a_side, b_side) -> None:
+        """
+        Provides a general function for pair cleaning between two sides with ties.
+        Ties left empty by the cleaning are dropped from the list.
+
+        :param a_side: dictionary with information for e.g. men, residents
+        :param b_side: dictionary with information for e.g. women, hospitals
+        """
+        a_accepts = {a: set().union(*a_prefs["list"]) for a, a_prefs in a_side.items()}
+        b_accepts = {b: set().union(*b_prefs["list"]) for b, b_prefs in b_side.items()}
+
+        for a, a_prefs in a_side.items():
+            cleaned_ties = (
+                {b for b in tie if a in b_accepts[b]} for tie in a_prefs["list"]
+            )
+            a_prefs["list"][:] = [tie for tie in cleaned_ties if tie]
+        for b, b_prefs in b_side.items():
+            cleaned_ties = (
+                {a for a in tie if b in a_accepts[a]} for tie in b_prefs["list"]
+            )
+            b_prefs["list"][:] = [tie for tie in cleaned_ties if tie]
+
     def tied_lists_to_rank(self, group) -> None:
         """
         Utility. Takes a group with clean lists and constructs their rank dictionaries.
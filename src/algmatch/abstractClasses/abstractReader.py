@@ -12,3 +12,20 @@ class AbstractReader:
         Sets appropriate values for the preference instance based on the data read in.
         """
         raise NotImplementedError("Method not implemented")
+
+
+class NameTable(dict):
+    """
+    Maps the IDs read from a file to participant names, e.g. "3" to "m3".
+
+    Each name is built the first time its ID is read, so every list the participant
+    appears in refers to the same string, rather than one allocated per occurrence.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__()
+        self.prefix = prefix
+
+    def __missing__(self, participant_id: str) -> str:
+        name = self[participant_id] = self.prefix + participant_id
+        return name
@@ -0,0 +1,460 @@
+"""
+Rotation poset of a stable marriage instance, shared by the SM and HR solvers.
+"""
+
+from bisect import bisect_right
+from collections import deque
+
+UNMATCHED = -1
+
+
+class RotationPoset:
+    """
+    The rotations of a stable marriage instance, found from its proposer-optimal
+    stable matching, and the partial order on them.
+
+    The stable matchings correspond one-to-one with the closed subsets of the
+    rotations, i.e. those containing every predecessor of each of their rotations.
+    Eliminating the rotations of a closed subset from the proposer-optimal matching,
+    in any order consistent with the partial order, gives its stable matching.
+
+    Participants are numbered, so proposers' lists are lists of receiver indices,
+    best first, and ranks are keyed by index.
+    """
+
+    def __init__(
+        self,
+        proposer_lists,
+        receiver_ranks,
+        optimal_matching,
+        proposer_ranks=None,
+    ) -> None:
+        """
+        :param proposer_lists: proposer_lists[i] is the preference list of proposer i
+        :param receiver_ranks: receiver_ranks[j][i] is the rank receiver j gives
+            proposer i, for each proposer on their list
+        :param optimal_matching: optimal_matching[i] is the partner of proposer i in
+            the proposer-optimal stable matching, or UNMATCHED
+        :param proposer_ranks: proposer_ranks[i][j] is the rank proposer i gives
+            receiver j, if not their position on the list, as when receivers are
+            copies of one participant
+        """
+        self.proposer_lists = proposer_lists
+        self.receiver_ranks = receiver_ranks
+        self.optimal_matching = list(optimal_matching)
+        if proposer_ranks is None:
+            proposer_ranks = [
+                {j: idx for idx, j in enumerate(p_list)} for p_list in proposer_lists
+            ]
+        self.proposer_ranks = proposer_ranks
+
+        # rotations[k] is a list of (proposer, receiver) pairs; eliminating it gives
+        # each proposer the receiver of the next pair, cyclically
+        self.rotations = []
+        # predecessors[k] are rotations that must be eliminated before rotation k,
+        # enough that their transitive closure is the partial order
+        self.predecessors = []
+
+        self._find_rotations()
+
+    def _find_rotations(self):
+        """
+        Eliminates an exposed rotation at a time, from the proposer-optimal matching
+        until the receiver-optimal matching is reached, finding each one by following
+        proposers to the holder of the next receiver who would accept them. The path
+        followed is kept between rotations, as eliminating the cycle at its end
+        leaves the rest of it valid, so each proposer's list is walked only once.
+
+        Rotations are numbered in the order they are eliminated, which is consistent
+        with the partial order.
+        """
+        lists = self.proposer_lists
+        ranks = self.receiver_ranks
+        no_proposers = len(lists)
+
+        partner = list(self.optimal_matching)
+        holder = [UNMATCHED] * len(ranks)
+        # position of each proposer's partner on their list, and of the next receiver
+        # after it who may prefer them to their current partner
+        position = [UNMATCHED] * no_proposers
+        next_position = [0] * no_proposers
+        for i, j in enumerate(partner):
+            if j != UNMATCHED:
+                holder[j] = i
+                position[i] = lists[i].index(j)
+                next_position[i] = position[i] + 1
+
+        # rotation that gave each proposer their current partner
+        produced_by = [UNMATCHED] * no_proposers
+        # per receiver, minus the rank of each partner they have had, with the
+        # rotation that gave them it, or UNMATCHED for the first; receivers only ever
+        # improve, so these are increasing
+        improvements = [[] for _ in ranks]
+        for i, j in enumerate(partner):
+            if j != UNMATCHED:
+                improvements[j].append((-ranks[j][i], UNMATCHED))
+        # (rotation, proposer, receiver) for each receiver that a proposer passes
+        # over when a rotation moves them down their list
+        passed_over = []
+
+        finished = [partner[i] == UNMATCHED for i in range(no_proposers)]
+        stack_position = [UNMATCHED] * no_proposers
+
+        for seed in range(no_proposers):
+            if finished[seed]:
+                continue
+            stack = [seed]
+            stack_position[seed] = 0
+            while stack:
+                i = stack[-1]
+                # receivers only improve, so those who reject i now always will
+                i_list = lists[i]
+                idx = next_position[i]
+                while idx < len(i_list):
+                    j = i_list[idx]
+                    if holder[j] == UNMATCHED or ranks[j][i] < ranks[j][holder[j]]:
+                        break
+                    idx += 1
+                next_position[i] = idx
+
+                following = holder[i_list[idx]] if idx < len(i_list) else UNMATCHED
+                if following == UNMATCHED or finished[following]:
+                    # i keeps their partner in every stable matching still to come,
+                    # as the next receiver who would accept them is unmatched in all
+                    # of them, or held by someone who does the same; so whoever was
+                    # following i to their partner keeps theirs too
+                    for p in stack:
+                        finished[p] = True
+                        stack_position[p] = UNMATCHED
+                    break
+
+                if stack_position[following] == UNMATCHED:
+                    stack_position[following] = len(stack)
+                    stack.append(following)
+                    continue
+
+                # the proposers from following to the top of the stack form a rotation
+                start = stack_position[following]
+                cycle = stack[start:]
+                del stack[start:]
+                for p in cycle:
+                    stack_position[p] = UNMATCHED
+                self._eliminate(
+                    cycle,
+                    partner,
+                    holder,
+                    position,
+                    next_position,
+                    produced_by,
+                    improvements,
+                    passed_over,
+                )
+
+        self._find_predecessors(improvements, passed_over)
+
+    def _eliminate(
+        self,
+        cycle,
+        partner,
+        holder,
+        position,
+        next_position,
+        produced_by,
+        improvements,
+        passed_over,
+    ):
+        lists = self.proposer_lists
+        ranks = self.receiver_ranks
+        k = len(self.rotations)
+        self.rotations.append([(p, partner[p]) for p in cycle])
+        # rotation k must come after those that gave its proposers their partners
+        self.predecessors.append(
+            {produced_by[p] for p in cycle if produced_by[p] != UNMATCHED}
+        )
+
+        for p in cycle:
+            for idx in range(position[p] + 1, next_position[p]):
+                passed_over.append((k, p, lists[p][idx]))
+            position[p] = next_position[p]
+            next_position[p] += 1
+            partner[p] = lists[p][position[p]]
+            produced_by[p] = k
+
+        for p in cycle:
+            j = partner[p]
+            holder[j] = p
+            improvements[j].append((-ranks[j][p], k))
+
+    def _find_predecessors(self, improvements, passed_over):
+        """
+        Rotation k must also come after the rotation that gave each receiver one of
+        its proposers passes over a partner they prefer to that proposer, if they
+        did not already have one.
+        """
+        ranks = self.receiver_ranks
+        predecessors = self.predecessors
+
+        for k, p, j in passed_over:
+            # the first partner of j that they prefer to p
+            idx = bisect_right(improvements[j], (-ranks[j][p], len(self.rotations)))
+            if idx < len(improvements[j]) and improvements[j][idx][1] != UNMATCHED:
+                predecessors[k].add(improvements[j][idx][1])
+
+        self.predecessors = [sorted(preds) for preds in predecessors]
+
+    def _apply(self, partner, k):
+        rotation = self.rotations[k]
+        for idx, (p, _) in enumerate(rotation):
+            partner[p] = rotation[(idx + 1) % len(rotation)][1]
+
+    def _undo(self, partner, k):
+        for p, j in self.rotations[k]:
+            partner[p] = j
+
+    def stable_matchings(self):
+        """
+        Generates every stable matching, starting from the proposer-optimal one, by
+        deciding whether to eliminate each rotation in turn: first not, then, if its
+        predecessors have been, so. Every decision leads to a stable matching, so the
+        time between one and the next is polynomial, and only the current one is
+        kept in memory.
+
+        :return: generator of the partner of each proposer, or UNMATCHED; the same
+            list is updated in place between matchings, so copy it to keep it
+        """
+        partner = list(self.optimal_matching)
+        predecessors = self.predecessors
+        eliminated = bytearray(len(self.rotations))
+
+        while True:
+            yield partner
+
+            # backtrack to the last rotation not eliminated that now can be
+            k = len(self.rotations) - 1
+            while k >= 0:
+                if eliminated[k]:
+                    self._undo(partner, k)
+                    eliminated[k] = 0
+                elif all(eliminated[pred] for pred in predecessors[k]):
+                    break
+                k -= 1
+            if k < 0:
+                return
+
+            self._apply(partner, k)
+            eliminated[k] = 1
+
+    def matching_after(self, rotations):
+        """
+        :param rotations: a closed subset of the rotations
+        :return: the partner of each proposer, or UNMATCHED, once the rotations are
+            eliminated from the proposer-optimal matching
+        """
+        partner = list(self.optimal_matching)
+        # rotations are numbered consistently with the partial order
+        for k in sorted(rotations):
+            self._apply(partner, k)
+        return partner
+
+    def _moves(self, k):
+        """
+        :return: generator of (proposer, receiver they leave, receiver they join,
+            proposer that receiver leaves) for each proposer in rotation k
+        """
+        rotation = self.rotations[k]
+        for idx, (p, j) in enumerate(rotation):
+            next_p, next_j = rotation[(idx + 1) % len(rotation)]
+            yield p, j, next_j, next_p
+
+    def _down_closure(self, rotations):
+        closure = set(rotations)
+        stack = list(rotations)
+        while stack:
+            for pred in self.predecessors[stack.pop()]:
+                if pred not in closure:
+                    closure.add(pred)
+                    stack.append(pred)
+        return closure
+
+    def minimum_weight_closed_subset(self, weights):
+        """
+        Finds a closed subset of the rotations of least total weight, as the source
+        side of a minimum cut, with Dinic's algorithm. Each rotation of negative
+        weight is joined from the source, each of positive weight to the sink, and
+        each to its predecessors by edges that cannot be cut.
+
+        :param weights: the weight of each rotation
+        :return: set of rotations
+        """
+        no_rotations = len(self.rotations)
+        source, sink = no_rotations, no_rotations + 1
+        cannot_cut = sum(abs(w) for w in weights) + 1
+
+        # edges are stored in pairs, so edge e ^ 1 is the reverse of edge e
+        adjacency = [[] for _ in range(no_rotations + 2)]
+        heads = []
+        capacities = []
+
+        def add_edge(u, v, capacity):
+            adjacency[u].append(len(heads))
+            heads.append(v)
+            capacities.append(capacity)
+            adjacency[v].append(len(heads))
+            heads.append(u)
+            capacities.append(0)
+
+        for k, weight in enumerate(weights):
+            if weight < 0:
+                add_edge(source, k, -weight)
+            elif weight > 0:
+                add_edge(k, sink, weight)
+            for pred in self.predecessors[k]:
+                add_edge(k, pred, cannot_cut)
+
+        while True:
+            level = self._residual_levels(source, adjacency, heads, capacities)
+            if level[sink] == UNMATCHED:
+                break
+            cursor = [0] * len(adjacency)
+            while self._augment(
+                source, sink, adjacency, heads, capacities, level, cursor
+            ):
+                pass
+
+        # every rotation still reachable from the source is on its side of the cut
+        return {k for k in range(no_rotations) if level[k] != UNMATCHED}
+
+    def _residual_levels(self, source, adjacency, heads, capacities):
+        """
+        :return: the distance of each node from the source along edges with capacity
+            left, or UNMATCHED if it cannot be reached
+        """
+        level = [UNMATCHED] * len(adjacency)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for e in adjacency[u]:
+                v = heads[e]
+                if capacities[e] > 0 and level[v] == UNMATCHED:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        return level
+
+    def _augment(self, source, sink, adjacency, heads, capacities, level, cursor):
+        """
+        Pushes flow along one path from the source to the sink that goes up a level
+        at each edge, found with an explicit stack so long paths cannot exceed the
+        recursion limit. Edges that lead nowhere are skipped by later searches.
+
+        :return: whether a path was found
+        """
+        path = []
+        u = source
+        while u != sink:
+            edges = adjacency[u]
+            while cursor[u] < len(edges):
+                e = edges[cursor[u]]
+                if capacities[e] > 0 and level[heads[e]] == level[u] + 1:
+                    break
+                cursor[u] += 1
+            else:
+                if not path:
+                    return False
+                # dead end, so step back and move on from the edge that led here
+                u = heads[path.pop() ^ 1]
+                cursor[u] += 1
+                continue
+            path.append(e)
+            u = heads[e]
+
+        flow = min(capacities[e] for e in path)
+        for e in path:
+            capacities[e] -= flow
+            capacities[e ^ 1] += flow
+        return True
+
+    def egalitarian_rotations(self):
+        """
+        Each rotation changes the sum of the ranks everyone gives their partner by
+        its weight, so the egalitarian stable matching, where that sum is least, is
+        given by a closed subset of least weight.
+
+        :return: set of rotations to eliminate for an egalitarian stable matching
+        """
+        proposer_ranks = self.proposer_ranks
+        receiver_ranks = self.receiver_ranks
+        weights = []
+        for k in range(len(self.rotations)):
+            weight = 0
+            for p, j, next_j, next_p in self._moves(k):
+                weight += proposer_ranks[p][next_j] - proposer_ranks[p][j]
+                weight += receiver_ranks[next_j][p] - receiver_ranks[next_j][next_p]
+            weights.append(weight)
+        return self.minimum_weight_closed_subset(weights)
+
+    def minimum_regret_rotations(self):
+        """
+        Proposers only get worse partners as rotations are eliminated, and receivers
+        only better ones. So a stable matching where no one gives their partner a
+        rank above some bound exists just when the rotations that first give each
+        receiver a partner within the bound, and their predecessors, include none
+        giving a proposer a partner beyond it. The least such bound is found by
+        binary search.
+
+        :return: set of rotations to eliminate for a minimum regret stable matching,
+            the one with fewest among them
+        """
+        proposer_ranks = self.proposer_ranks
+        receiver_ranks = self.receiver_ranks
+
+        # the rank of each receiver's partner, and the rotations that gave them each
+        # partner after the first, in order
+        receiver_partners = {}
+        for p, j in enumerate(self.optimal_matching):
+            if j != UNMATCHED:
+                receiver_partners[j] = [(receiver_ranks[j][p], UNMATCHED)]
+        # the worst rank any proposer gives a partner rotation k gives them
+        worst_proposer_rank = []
+        for k in range(len(self.rotations)):
+            worst = 0
+            for p, _, next_j, _ in self._moves(k):
+                receiver_partners[next_j].append((receiver_ranks[next_j][p], k))
+                worst = max(worst, proposer_ranks[p][next_j])
+            worst_proposer_rank.append(worst)
+
+        def rotations_within(bound):
+            required = []
+            for partners in receiver_partners.values():
+                for rank, k in partners:
+                    if rank <= bound:
+                        if k != UNMATCHED:
+                            required.append(k)
+                        break
+                else:
+                    return None
+            closure = self._down_closure(required)
+            if any(worst_proposer_rank[k] > bound for k in closure):
+                return None
+            return closure
+
+        lowest = max(
+            (
+                proposer_ranks[p][j]
+                for p, j in enumerate(self.optimal_matching)
+                if j != UNMATCHED
+            ),
+            default=0,
+        )
+        highest = max(
+            (rank for partners in receiver_partners.values() for rank, _ in partners),
+            default=0,
+        )
+        highest = max(lowest, highest)
+        while lowest < highest:
+            middle = (lowest + highest) // 2
+            if rotations_within(middle) is None:
+                lowest = middle + 1
+            else:
+                highest = middle
+        return rotations_within(lowest)
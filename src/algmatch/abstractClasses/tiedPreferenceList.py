@@ -0,0 +1,116 @@
+"""
+Preference list with ties, shared by the solvers for problems with ties.
+"""
+
+
+class TiedPreferenceList(list):
+    """
+    A list of ties, each a set, that keeps count of its entries and caches the
+    positions of its first and last non-empty ties, so that the length, head and tail
+    are found in constant time rather than by scanning every tie.
+
+    Solvers only ever delete from their lists, so the cached positions only move
+    inwards, and over a whole run they pass each tie at most once. This relies on
+    every deletion going through discard or pop_from; removing from a tie directly
+    leaves the count wrong.
+    """
+
+    def __init__(self, ties=(), rank: dict | None = None) -> None:
+        """
+        :param ties: the sets of tied targets, best first
+        :param rank: the rank of each target, i.e. the index of its tie; built from
+            the ties if not given
+        """
+        super().__init__(ties)
+        if rank is None:
+            rank = {target: idx for idx, tie in enumerate(self) for target in tie}
+        self.rank = rank
+        self.size = sum(map(len, self))
+        self._head_idx = 0
+        self._tail_idx = len(self) - 1
+
+    def __contains__(self, target) -> bool:
+        """
+        :return: whether the target is still in the list, rather than whether some
+            tie equals it, as for a plain list
+        """
+        idx = self.rank.get(target)
+        return idx is not None and target in self[idx]
+
+    @property
+    def head_idx(self) -> int:
+        """
+        :return: the index of the first non-empty tie, or len(self) if there is none
+        """
+        while self._head_idx < len(self) and not self[self._head_idx]:
+            self._head_idx += 1
+        return self._head_idx
+
+    @property
+    def tail_idx(self) -> int:
+        """
+        :return: the index of the last non-empty tie, or -1 if there is none
+        """
+        while self._tail_idx >= 0 and not self[self._tail_idx]:
+            self._tail_idx -= 1
+        return self._tail_idx
+
+    @property
+    def head(self) -> set:
+        """
+        :return: the first non-empty tie itself, not a copy
+        :raises ValueError: the list is empty
+        """
+        if self.size == 0:
+            raise ValueError("Pref_list empty")
+        # some tie is non-empty, so the search stops within the list
+        idx = self._head_idx
+        while not self[idx]:
+            idx += 1
+        self._head_idx = idx
+        return self[idx]
+
+    @property
+    def tail(self) -> set:
+        """
+        :return: the last non-empty tie itself, not a copy
+        :raises ValueError: the list is empty
+        """
+        if self.size == 0:
+            raise ValueError("Pref_list empty")
+        idx = self._tail_idx
+        while not self[idx]:
+            idx -= 1
+        self._tail_idx = idx
+        return self[idx]
+
+    def discard(self, target) -> bool:
+        """
+        Removes the target from its tie, if it is still in the list.
+
+        :return: whether the target was removed
+        """
+        idx = self.rank.get(target)
+        if idx is None or target not in self[idx]:
+            return False
+        self[idx].remove(target)
+        self.size -= 1
+        return True
+
+    def pop_from(self, idx: int):
+        """
+        Removes an arbitrary target from the tie at the given index.
+
+        :return: the target removed
+        :raises KeyError: the tie is empty
+        """
+        target = self[idx].pop()
+        self.size -= 1
+        return target
+
+    def ties_after(self, idx: int):
+        """
+        :return: iterator over the indices of the ties after the given one, up to and
+            including the tail, without copying the list
+        """
+        return range(idx + 1, self.tail_idx + 1)
@@ -0,0 +1,174 @@
+"""
+Class to solve many independent instances of a problem across a pool of processes.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from math import ceil
+import os
+from time import perf_counter
+from traceback import format_exception_only
+from typing import Iterable, Iterator, NamedTuple
+
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+
+
+class BatchResult(NamedTuple):
+    index: int  # position of the instance in the batch
+    matching: dict | None  # the stable matching, or None if none was found
+    setup_time: float  # seconds spent reading and compiling the instance
+    solve_time: float  # seconds spent finding the matching
+    # the error raised reading or solving the instance, formatted, as not every
+    # error survives being sent back from a worker; None if there was none
+    error: str | None = None
+
+
+def _source_kwargs(instance, in_pool: bool) -> dict:
+    if isinstance(instance, dict):
+        return {"dictionary": instance}
+    if isinstance(instance, (str, os.PathLike)):
+        return {"filename": os.fspath(instance)}
+    if in_pool and isinstance(instance, BinaryPreferenceInstance):
+        # mappings cannot be pickled, but each worker can map the same file's pages
+        return {"filename": instance.filename}
+    return {"instance": instance}
+
+
+def _solve_chunk(problem, solver_kwargs: dict, chunk: list) -> list:
+    results = []
+    for index, source_kwargs in chunk:
+        matching = error = setup_end = None
+        start = perf_counter()
+        try:
+            solver = problem(**source_kwargs, **solver_kwargs)
+            setup_end = perf_counter()
+            matching = solver.get_stable_matching()
+        except Exception as e:
+            # one bad instance should not end the batch
+            error = "".join(format_exception_only(e)).strip()
+        solve_end = perf_counter()
+        if setup_end is None:
+            setup_end = solve_end
+
+        results.append(
+            BatchResult(
+                index, matching, setup_end - start, solve_end - setup_end, error
+            )
+        )
+    return results
+
+
+class BatchSolver:
+    def __init__(
+        self,
+        problem: type,
+        processes: int | None = None,
+        chunksize: int | None = None,
+        **solver_kwargs,
+    ) -> None:
+        """
+        Initialise a solver for batches of independent instances.
+
+        :param problem: type, the problem to solve, e.g. HospitalResidentsProblem, or any class taking filename, dictionary or instance and providing get_stable_matching.
+        :param processes: int, optional, default=None, the number of worker processes, which is the number of CPUs by default. With 1, instances are solved in this process.
+        :param chunksize: int, optional, default=None, how many instances are sent to a worker at once. By default a quarter of an even share per worker if the batch has a length, and 16 otherwise.
+        :param solver_kwargs: further arguments for every solver, e.g. optimised_side="hospitals".
+        """
+        assert callable(getattr(problem, "get_stable_matching", None)), (
+            "Problem must provide get_stable_matching"
+        )
+        if processes is None:
+            processes = os.cpu_count() or 1
+        assert type(processes) is int and processes > 0, (
+            "Param processes must be a positive int"
+        )
+        assert chunksize is None or (type(chunksize) is int and chunksize > 0), (
+            "Param chunksize must be a positive int"
+        )
+
+        self.problem = problem
+        self.processes = processes
+        self.chunksize = chunksize
+        self.solver_kwargs = solver_kwargs
+        self._executor = None
+
+    def _get_chunksize(self, instances: Iterable) -> int:
+        if self.chunksize is not None:
+            return self.chunksize
+        if hasattr(instances, "__len__"):
+            return max(1, ceil(len(instances) / (4 * self.processes)))
+        return 16
+
+    def _chunks(self, instances: Iterable, in_pool: bool) -> Iterator[list]:
+        chunksize = self._get_chunksize(instances)
+        sources = (
+            (index, _source_kwargs(instance, in_pool))
+            for index, instance in enumerate(instances)
+        )
+        while chunk := list(islice(sources, chunksize)):
+            yield chunk
+
+    def solve(self, instances: Iterable, ordered: bool = True) -> Iterator[BatchResult]:
+        """
+        Solve every instance of a batch, streaming the results back.
+
+        :param instances: iterable of dictionaries, filenames, compiled instances or binary instances, which is consumed lazily.
+        :param ordered: bool, optional, default=True, whether results are yielded in the order of the instances, or as soon as they complete.
+        :return: iterator of BatchResult, one per instance, including those that raised an error, which is reported on the result instead.
+        """
+        if self.processes == 1:
+            for chunk in self._chunks(instances, in_pool=False):
+                yield from _solve_chunk(self.problem, self.solver_kwargs, chunk)
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+
+        # only a few chunks per worker are in flight, so the batch is never held whole
+        chunks = self._chunks(instances, in_pool=True)
+        pending = deque()
+        max_pending = 2 * self.processes
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append(
+                self._executor.submit(
+                    _solve_chunk, self.problem, self.solver_kwargs, chunk
+                )
+            )
+            return True
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+
+            for future in done:
+                submit_next()
+                yield from future.result()
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes, which are otherwise reused between batches.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,142 @@
+"""
+Writes a compiled preference instance to the binary instance format.
+"""
+
+from array import array
+import sys
+
+from algmatch.binaryInstances.binaryLayouts import (
+    FILE_HEADER,
+    GROUP_HEADER,
+    HAS_LISTS,
+    HAS_OWNERS,
+    HAS_QUOTAS,
+    HAS_TARGET_RANKS,
+    LAYOUTS,
+    MAGIC,
+    MAX_ENTRIES,
+    TIED,
+    TIED_KINDS,
+    VERSION,
+    instance_kind,
+    padding,
+)
+
+
+def _compile_group(instance, group, layout, tied, names, index):
+    """
+    Flattens one group's dictionaries into its names and int32 sections.
+    """
+    participants = getattr(instance, group)
+    sections = {"names": "\n".join(names[group]).encode()}
+    flags = 0
+
+    if "quota" in layout:
+        flags |= HAS_QUOTAS
+        quota_key = layout["quota"]
+        sections["quotas"] = array(
+            "i", [participants[p][quota_key] for p in names[group]]
+        )
+
+    if "owner" in layout:
+        flags |= HAS_OWNERS
+        owner_key, owner_group = layout["owner"]
+        owner_index = index[owner_group]
+        sections["owners"] = array(
+            "i", [owner_index[participants[p][owner_key]] for p in names[group]]
+        )
+
+    if "target" in layout:
+        flags |= HAS_LISTS
+        target_group = layout["target"]
+        target_index = index[target_group]
+        targets_dict = getattr(instance, target_group)
+        target_layout = LAYOUTS[instance_kind(type(instance))][target_group]
+        mutual = target_layout.get("target") == group
+
+        offsets = array("i", [0])
+        targets = array("i")
+        ranks = array("i")
+        target_ranks = array("i")
+        tie_offsets = array("i", [0])
+        tie_starts = array("i")
+        for p in names[group]:
+            for rank, entry in enumerate(participants[p]["list"]):
+                if tied:
+                    # ties are written in index order, so the files are reproducible
+                    tie_starts.append(len(targets))
+                    tie = sorted(entry, key=target_index.__getitem__)
+                else:
+                    tie = (entry,)
+                for t in tie:
+                    targets.append(target_index[t])
+                    ranks.append(rank)
+                    if mutual:
+                        target_ranks.append(targets_dict[t]["rank"][p])
+            if max(len(targets), len(tie_starts)) > MAX_ENTRIES:
+                raise ValueError(f"Group {group} has too many entries to store")
+            offsets.append(len(targets))
+            tie_offsets.append(len(tie_starts))
+
+        sections["offsets"] = offsets
+        sections["targets"] = targets
+        sections["ranks"] = ranks
+        if mutual:
+            flags |= HAS_TARGET_RANKS
+            sections["target_ranks"] = target_ranks
+        if tied:
+            flags |= TIED
+            sections["tie_offsets"] = tie_offsets
+            sections["tie_starts"] = tie_starts
+
+    return flags, sections
+
+
+def write_binary_instance(instance, filename: str) -> None:
+    """
+    Writes a compiled preference instance to disk, so it can later be memory-mapped
+    with BinaryPreferenceInstance, or loaded by any solver that takes a filename.
+
+    :param instance: a compiled preference instance, e.g. HRPreferenceInstance
+    :param filename: path of the file to write
+    """
+    kind = instance_kind(type(instance))
+    assert kind in LAYOUTS, (
+        f"Instances of type {type(instance).__name__} cannot be written"
+    )
+    layouts = LAYOUTS[kind]
+    tied = kind in TIED_KINDS
+
+    names = {group: list(getattr(instance, group)) for group in layouts}
+    index = {
+        group: {name: idx for idx, name in enumerate(group_names)}
+        for group, group_names in names.items()
+    }
+
+    groups = []
+    for group, layout in layouts.items():
+        flags, sections = _compile_group(instance, group, layout, tied, names, index)
+        header = GROUP_HEADER.pack(
+            group.encode(),
+            layout.get("target", "").encode(),
+            layout.get("owner", ("", ""))[1].encode(),
+            flags,
+            len(names[group]),
+            len(sections.get("targets", ())),
+            len(sections.get("tie_starts", ())),
+            len(sections["names"]),
+        )
+        groups.append((header, sections))
+
+    with open(filename, "wb") as file:
+        file.write(FILE_HEADER.pack(MAGIC, VERSION, kind.encode(), len(groups)))
+        for header, _ in groups:
+            file.write(header)
+
+        for _, sections in groups:
+            for section in sections.values():
+                if isinstance(section, array) and sys.byteorder != "little":
+                    section = array("i", section)
+                    section.byteswap()
+                file.write(section)
+                file.write(bytes(padding(memoryview(section).nbytes)))
@@ -0,0 +1,116 @@
+"""
+On-disk layout of binary preference instances.
+
+A file starts with a header giving the problem kind and the number of groups, followed
+by one header per group (e.g. residents, hospitals) giving its size and which sections
+it stores. The sections follow in group order, each 8-byte aligned and little-endian:
+
+    names           newline-separated UTF-8 participant names, in index order
+    quotas          int32 capacity of each participant
+    owners          int32 index of each participant's owner, e.g. a project's lecturer
+    offsets         int32 CSR offsets, the list of participant i being entries
+                    offsets[i] to offsets[i + 1]
+    targets         int32 index of each entry in the target group
+    ranks           int32 rank the participant gives each entry; for tied lists this
+                    is the index of the entry's tie
+    target ranks    int32 rank each entry gives the participant back
+    tie offsets     int32 CSR offsets into the tie starts, for tied lists only
+    tie starts      int32 entry at which each tie begins; a tie ends where the next
+                    tie of the same list begins, or at the end of the list
+
+Lists are stored already cleaned of unacceptable pairs, so targets always list the
+participant back whenever target ranks are stored.
+"""
+
+import struct
+
+MAGIC = b"ALGMATCH"
+VERSION = 1
+
+# magic, version, problem kind, number of groups
+FILE_HEADER = struct.Struct("<8sI8sI")
+# group, target group, owner group, flags, participants, entries, ties, size of names
+GROUP_HEADER = struct.Struct("<16s16s16sI4xqqqq")
+
+HAS_LISTS = 1
+TIED = 2
+HAS_TARGET_RANKS = 4
+HAS_QUOTAS = 8
+HAS_OWNERS = 16
+
+ALIGNMENT = 8
+# offsets and targets are int32, so no list or group can hold more entries than this
+MAX_ENTRIES = 2**31 - 1
+
+# for each problem kind, the groups it stores and how each group's dictionaries are
+# laid out; extra fields are rebuilt from zero-argument factories, e.g. int() == 0
+LAYOUTS = {
+    "SM": {
+        "men": {"target": "women"},
+        "women": {"target": "men"},
+    },
+    "SMT": {
+        "men": {"target": "women"},
+        "women": {"target": "men"},
+    },
+    "HR": {
+        "residents": {"target": "hospitals"},
+        "hospitals": {"target": "residents", "quota": "capacity"},
+    },
+    "HRT": {
+        "residents": {"target": "hospitals"},
+        "hospitals": {"target": "residents", "quota": "capacity"},
+    },
+    "SPA": {
+        "students": {"target": "projects"},
+        # project lists are rebuilt from their lecturer's list on loading
+        "projects": {
+            "quota": "upper_quota",
+            "owner": ("lecturer", "lecturers"),
+            "extras": {"lower_quota": int},
+        },
+        "lecturers": {
+            "target": "students",
+            "quota": "upper_quota",
+            "extras": {"projects": set},
+        },
+    },
+    "SPAST": {
+        "students": {"target": "projects"},
+        "projects": {"quota": "capacity", "owner": ("lecturer", "lecturers")},
+        "lecturers": {
+            "target": "students",
+            "quota": "capacity",
+            "extras": {"projects": set},
+        },
+    },
+    "SR": {
+        "roommates": {"target": "roommates"},
+    },
+}
+
+TIED_KINDS = {"SMT", "HRT", "SPAST"}
+
+
+def instance_kind(instance_type: type) -> str:
+    """
+    :param instance_type: a preference instance class, e.g. HRPreferenceInstance
+    :return: the problem kind it is stored under, e.g. "HR"
+    """
+    return instance_type.__name__.removesuffix("PreferenceInstance")
+
+
+def padding(size: int) -> int:
+    """
+    :return: the number of bytes needed to align a section of the given size
+    """
+    return -size % ALIGNMENT
+
+
+def is_binary_instance(filename: str) -> bool:
+    """
+    :param filename: path to an instance file
+    :return: whether the file is a binary instance rather than a text one
+    """
+    with open(filename, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
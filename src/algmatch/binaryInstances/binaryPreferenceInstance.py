@@ -0,0 +1,264 @@
+"""
+Memory-mapped view of a binary preference instance.
+
+The int32 sections are exposed as read-only memoryviews over the mapping, so opening
+an instance copies nothing, and processes opening the same file share its pages.
+"""
+
+from array import array
+import mmap
+import os
+import struct
+import sys
+
+from algmatch.binaryInstances.binaryLayouts import (
+    FILE_HEADER,
+    GROUP_HEADER,
+    HAS_LISTS,
+    HAS_OWNERS,
+    HAS_QUOTAS,
+    HAS_TARGET_RANKS,
+    LAYOUTS,
+    MAGIC,
+    TIED,
+    VERSION,
+    instance_kind,
+    padding,
+)
+from algmatch.errors.ReaderErrors import BinaryFormatError
+
+
+class BinaryPreferenceInstance:
+    def __init__(self, filename: str) -> None:
+        assert os.path.isfile(filename), f"File {filename} does not exist"
+        self.filename = filename
+        if os.path.getsize(filename) < FILE_HEADER.size:
+            raise BinaryFormatError(filename, "file is too short for a header")
+
+        with open(filename, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        magic, version, kind, no_groups = FILE_HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise BinaryFormatError(filename, "not a binary instance")
+        if version != VERSION:
+            raise BinaryFormatError(filename, f"unsupported version {version}")
+
+        self.kind = kind.rstrip(b"\0").decode()
+        if self.kind not in LAYOUTS:
+            raise BinaryFormatError(filename, f"unknown problem kind {self.kind}")
+
+        self._groups = {}
+        self._names = {}
+        self._read_groups(no_groups)
+
+    def _read_groups(self, no_groups: int) -> None:
+        headers = []
+        position = FILE_HEADER.size
+        for _ in range(no_groups):
+            try:
+                headers.append(GROUP_HEADER.unpack_from(self._buffer, position))
+            except struct.error:
+                raise BinaryFormatError(self.filename, "file is truncated")
+            position += GROUP_HEADER.size
+
+        for header in headers:
+            group, target, owner, flags, participants, entries, ties, names_size = (
+                header
+            )
+            sections = {
+                "target": target.rstrip(b"\0").decode(),
+                "owner": owner.rstrip(b"\0").decode(),
+                "flags": flags,
+            }
+
+            sizes = [("names", names_size)]
+            if flags & HAS_QUOTAS:
+                sizes.append(("quotas", participants))
+            if flags & HAS_OWNERS:
+                sizes.append(("owners", participants))
+            if flags & HAS_LISTS:
+                sizes += [("offsets", participants + 1), ("targets", entries)]
+                sizes.append(("ranks", entries))
+            if flags & HAS_TARGET_RANKS:
+                sizes.append(("target_ranks", entries))
+            if flags & TIED:
+                sizes += [("tie_offsets", participants + 1), ("tie_starts", ties)]
+
+            for section, size in sizes:
+                nbytes = size if section == "names" else 4 * size
+                if position + nbytes > len(self._buffer):
+                    raise BinaryFormatError(self.filename, "file is truncated")
+                view = self._buffer[position : position + nbytes]
+                sections[section] = view if section == "names" else self._as_int32(view)
+                position += nbytes + padding(nbytes)
+
+            self._groups[group.rstrip(b"\0").decode()] = sections
+
+    def _as_int32(self, view):
+        if sys.byteorder == "little":
+            return view.cast("i")
+        # the file is little-endian, so other machines need a byteswapped copy
+        values = array("i", bytes(view))
+        values.byteswap()
+        return values
+
+    def _export(self, section):
+        # callers get their own view of each section, so closing this instance can
+        # release its views without invalidating those still used by solvers
+        return section[:] if isinstance(section, memoryview) else section
+
+    def _get_group(self, group: str) -> dict:
+        assert group in self._groups, (
+            f"Group {group} is not in this {self.kind} instance"
+        )
+        return self._groups[group]
+
+    def get_names(self, group: str) -> list:
+        """
+        :param group: e.g. "residents"
+        :return: the participant names of the group, in index order
+        """
+        if group not in self._names:
+            names = bytes(self._get_group(group)["names"]).decode()
+            self._names[group] = names.split("\n") if names else []
+        return self._names[group]
+
+    def get_lists(self, group: str):
+        """
+        :param group: e.g. "residents"
+        :return: offsets, targets and target ranks, in the form of
+            AbstractArrayEngine.compile_lists
+        """
+        sections = self._get_group(group)
+        assert sections["flags"] & HAS_TARGET_RANKS, (
+            f"Group {group} does not store the ranks its targets give it"
+        )
+        return tuple(
+            self._export(sections[section])
+            for section in ("offsets", "targets", "target_ranks")
+        )
+
+    def get_ranks(self, group: str):
+        """
+        :param group: e.g. "residents"
+        :return: the rank each participant gives each entry of their list
+        """
+        return self._export(self._get_group(group)["ranks"])
+
+    def get_ties(self, group: str):
+        """
+        :param group: e.g. "residents", in an instance with ties
+        :return: tie offsets and tie starts, where the ties of participant i begin at
+            entries tie_starts[tie_offsets[i] : tie_offsets[i + 1]]
+        """
+        sections = self._get_group(group)
+        assert sections["flags"] & TIED, f"Group {group} does not have ties"
+        return (
+            self._export(sections["tie_offsets"]),
+            self._export(sections["tie_starts"]),
+        )
+
+    def get_quotas(self, group: str):
+        """
+        :param group: e.g. "hospitals"
+        :return: the capacity of each participant
+        """
+        return self._export(self._get_group(group)["quotas"])
+
+    def get_owners(self, group: str):
+        """
+        :param group: e.g. "projects"
+        :return: the index of each participant's owner, e.g. a project's lecturer
+        """
+        return self._export(self._get_group(group)["owners"])
+
+    def load_into(self, instance) -> None:
+        """
+        Fills a preference instance's dictionaries, as its file reader would have.
+
+        :param instance: e.g. an HRPreferenceInstance being loaded from this file
+        """
+        kind = instance_kind(type(instance))
+        if kind != self.kind:
+            raise BinaryFormatError(
+                self.filename, f"holds a {self.kind} instance, not {kind}"
+            )
+
+        for group, layout in LAYOUTS[self.kind].items():
+            sections = self._groups[group]
+            names = self.get_names(group)
+            participants = {name: {} for name in names}
+
+            if "quota" in layout:
+                quota_key = layout["quota"]
+                for name, quota in zip(names, sections["quotas"]):
+                    participants[name][quota_key] = quota
+
+            if "owner" in layout:
+                owner_key, owner_group = layout["owner"]
+                owner_names = self.get_names(owner_group)
+                for name, owner in zip(names, sections["owners"]):
+                    participants[name][owner_key] = owner_names[owner]
+
+            if "target" in layout:
+                target_names = self.get_names(layout["target"])
+                offsets = sections["offsets"]
+                targets = sections["targets"]
+                tied = sections["flags"] & TIED
+                if tied:
+                    tie_offsets = sections["tie_offsets"]
+                    tie_starts = sections["tie_starts"]
+
+                for i, name in enumerate(names):
+                    start, end = offsets[i], offsets[i + 1]
+                    if tied:
+                        preferences = []
+                        first, last = tie_offsets[i], tie_offsets[i + 1]
+                        for t in range(first, last):
+                            tie_end = tie_starts[t + 1] if t + 1 < last else end
+                            preferences.append(
+                                {
+                                    target_names[targets[idx]]
+                                    for idx in range(tie_starts[t], tie_end)
+                                }
+                            )
+                    else:
+                        preferences = [target_names[t] for t in targets[start:end]]
+                    participants[name]["list"] = preferences
+                    participants[name]["rank"] = {}
+
+            for key, factory in layout.get("extras", {}).items():
+                for prefs in participants.values():
+                    prefs[key] = factory()
+
+            setattr(instance, group, participants)
+
+    def close(self) -> None:
+        """
+        Releases this instance's views of the file and unmaps it. Solvers built on
+        the instance hold their own views, so they keep working after it is closed,
+        and the mapping is only unmapped once they are garbage collected.
+        """
+        if self._mmap is None:
+            return
+
+        for sections in self._groups.values():
+            for section in sections.values():
+                if isinstance(section, memoryview):
+                    section.release()
+        self._groups.clear()
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # views held elsewhere keep the mapping alive until they are collected
+            pass
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
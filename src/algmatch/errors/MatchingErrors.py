@@ -0,0 +1,40 @@
+"""
+A set of custom errors to make checks on supplied matchings cleaner
+"""
+
+
+# Ideally this error should never be called directly
+class MatchingError(Exception):
+    def __init__(self, participant_type, name, cause):
+        source = f"{participant_type} {name}"
+        super().__init__(f"\nSource: {source}\nCause: {cause}")
+
+
+class ParticipantNotFoundError(MatchingError):
+    def __init__(self, participant_type, name):
+        cause = "not instantiated."
+        super().__init__(participant_type, name, cause)
+
+
+class UnacceptablePairError(MatchingError):
+    def __init__(self, participant_type, name, offender):
+        cause = f"matched to {offender}, who is not in their preference list."
+        super().__init__(participant_type, name, cause)
+
+
+class MultipleAssignmentError(MatchingError):
+    def __init__(self, participant_type, name):
+        cause = "matched to more than one partner."
+        super().__init__(participant_type, name, cause)
+
+
+class CapacityExceededError(MatchingError):
+    def __init__(self, participant_type, name):
+        cause = "assigned more participants than its capacity."
+        super().__init__(participant_type, name, cause)
+
+
+class InconsistentMatchingError(MatchingError):
+    def __init__(self, participant_type, name, partner):
+        cause = f"matched to {partner}, who is not matched back to them."
+        super().__init__(participant_type, name, cause)
@@ -73,3 +73,11 @@ class UnclosedTieError(ReaderError):
             f"Open bracket with no corresponding close bracket in {participant_type}"
         )
         super().__init__(participant_type, name, cause, line=True)
+
+
+# ====== Binary ======
+
+
+class BinaryFormatError(Exception):
+    def __init__(self, filename, cause):
+        super().__init__(f"\nSource: {filename}\nCause: {cause}")
@@ -10,6 +10,30 @@ from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrResidentOptimal
 from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrHospitalOptimal import (
     HRHospitalOptimal,
 )
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrArrayResidentOptimal import (
+    HRArrayResidentOptimal,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrArrayHospitalOptimal import (
+    HRArrayHospitalOptimal,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrRotations import (
+    HRRotations,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrEgalitarian import (
+    HREgalitarian,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrMinimumRegret import (
+    HRMinimumRegret,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrWarmStart import (
+    HRWarmStart,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
 
 
 class HospitalResidentsProblem:
@@ -18,27 +42,72 @@ class HospitalResidentsProblem:
         filename: str | None = None,
         dictionary: dict | None = None,
         optimised_side: str = "residents",
+        engine: str = "dict",
+        instance: HRPreferenceInstance | BinaryPreferenceInstance | None = None,
     ) -> None:
         """
         Initialise the Hospital Residents Problem algorithms.
 
         :param filename: str, optional, default=None, the path to the file to read in the preferences from.
         :param dictionary: dict, optional, default=None, the dictionary of preferences.
-        :param optimised_side: str, optional, default="resident", whether the algorithm is "resident" (default) or "hospital" sided.
+        :param optimised_side: str, optional, default="resident", whether the algorithm is "resident" (default) or "hospital" sided, or finds the "egalitarian" stable matching, where the sum of the ranks residents and hospitals give each other is least, or the "minimum_regret" one, where the worst such rank is least.
+        :param engine: str, optional, default="dict", whether to run the "dict" (default) or integer-indexed "array" implementation. Both give identical results.
+        :param instance: HRPreferenceInstance or BinaryPreferenceInstance, optional, default=None, an instance compiled once from a file or dictionary, which can be shared between solvers and stability checkers, or a memory-mapped binary instance, which the "array" engine reads without copying.
         """
         if filename is not None:
             filename = os.path.join(os.getcwd(), filename)
 
         assert type(optimised_side) is str, "Param optimised_side must be of type str"
         optimised_side = optimised_side.lower()
-        assert optimised_side in ("residents", "hospitals"), (
-            "Optimised side must either be 'residents' or 'hospitals'"
+        sides = ("residents", "hospitals", "egalitarian", "minimum_regret")
+        assert optimised_side in sides, (
+            "Optimised side must either be 'residents', 'hospitals', 'egalitarian' or 'minimum_regret'"
         )
 
-        if optimised_side == "residents":
-            self.hr_alg = HRResidentOptimal(filename=filename, dictionary=dictionary)
+        assert type(engine) is str, "Param engine must be of type str"
+        engine = engine.lower()
+        assert engine in ("dict", "array"), "Engine must either be 'dict' or 'array'"
+        assert engine == "dict" or optimised_side in ("residents", "hospitals"), (
+            "Only the 'dict' engine finds egalitarian or minimum regret matchings"
+        )
+
+        if engine == "dict" and isinstance(instance, BinaryPreferenceInstance):
+            instance = HRPreferenceInstance(filename=instance.filename)
+
+        # kept to enumerate every stable matching, whichever solver was chosen
+        self._sources = {
+            "filename": filename,
+            "dictionary": dictionary,
+            "instance": instance,
+        }
+        # resident-optimal solver kept between calls to resolve
+        self._warm_start = None
+
+        if engine == "array":
+            if optimised_side == "residents":
+                self.hr_alg = HRArrayResidentOptimal(
+                    filename=filename, dictionary=dictionary, instance=instance
+                )
+            else:
+                self.hr_alg = HRArrayHospitalOptimal(
+                    filename=filename, dictionary=dictionary, instance=instance
+                )
+        elif optimised_side == "egalitarian":
+            self.hr_alg = HREgalitarian(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
+        elif optimised_side == "minimum_regret":
+            self.hr_alg = HRMinimumRegret(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
+        elif optimised_side == "residents":
+            self.hr_alg = HRResidentOptimal(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
         else:
-            self.hr_alg = HRHospitalOptimal(filename=filename, dictionary=dictionary)
+            self.hr_alg = HRHospitalOptimal(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
 
     def get_stable_matching(self) -> dict | None:
         """
@@ -50,3 +119,45 @@ class HospitalResidentsProblem:
         if self.hr_alg.is_stable:
             return self.hr_alg.stable_matching
         return None
+
+    def get_all_stable_matchings(self):
+        """
+        Generate every stable matching for the Hospital/Residents Problem, one at a
+        time, from the rotations of the instance. Only the current matching is held
+        in memory, and the time between one and the next is polynomial.
+
+        :return: generator of dicts, each a stable matching in the same form as from get_stable_matching, starting from the resident-optimal one
+        """
+        instance = self._sources["instance"]
+        if isinstance(instance, BinaryPreferenceInstance):
+            self._sources["instance"] = HRPreferenceInstance(filename=instance.filename)
+        return HRRotations(**self._sources).all_stable_matchings()
+
+    def resolve(self, delta: dict) -> tuple[dict, dict]:
+        """
+        Bring the resident-optimal stable matching up to date after a small change
+        to the instance, resuming from the matching found before rather than solving
+        again from scratch. Each call builds on the changes made by earlier ones.
+
+        :param delta: dict, any of "withdrawn", a list of residents to remove, "preferences", a dict of residents to their new preference lists, and "capacities", a dict of hospitals to their change in capacity, e.g. {"withdrawn": ["r2"], "capacities": {"h1": -1}}. Names are as in the stable matching.
+        :return: tuple, the new resident-optimal stable matching, in the same form as from get_stable_matching, as a copy that later calls leave unchanged, and a dict of each resident whose hospital changed to a tuple of their old and new hospital, "" if none
+        """
+        if self._warm_start is None:
+            instance = self._sources["instance"]
+            if isinstance(instance, BinaryPreferenceInstance):
+                self._sources["instance"] = HRPreferenceInstance(
+                    filename=instance.filename
+                )
+            self._warm_start = HRWarmStart(**self._sources)
+            self._warm_start.run()
+
+        diff = self._warm_start.resolve(delta)
+        # the warm start updates its matching in place, so callers get their own copy
+        matching = self._warm_start.stable_matching
+        return {
+            "resident_sided": dict(matching["resident_sided"]),
+            "hospital_sided": {
+                hospital: set(residents)
+                for hospital, residents in matching["hospital_sided"].items()
+            },
+        }, diff
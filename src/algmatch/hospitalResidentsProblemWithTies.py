@@ -10,6 +10,9 @@ from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtSuperResidentOpti
 from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtSuperHospitalOptimal import (
     HRTSuperHospitalOptimal,
 )
+from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtStrongResidentOptimal import (
+    HRTStrongResidentOptimal,
+)
 from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtAbstract import (
     HRTAbstract,
 )
@@ -69,7 +72,14 @@ class HospitalResidentsProblemWithTies:
                     filename=self.filename, dictionary=self.dictionary
                 )
         elif self.stability_type == "strong":
-            raise NotImplementedError("Strong algorithms are not yet available.")
+            if self.optimised_side == "residents":
+                self.hr_alg = HRTStrongResidentOptimal(
+                    filename=self.filename, dictionary=self.dictionary
+                )
+            else:
+                raise NotImplementedError(
+                    "Hospital-optimal strong algorithms are not yet available."
+                )
         else:
             raise ValueError('stability_type must be either "strong" or "super".')
 
@@ -0,0 +1,169 @@
+"""
+Abstract class to find the blocking pairs of a matching, whether it was produced by one
+of the solvers in this package or computed elsewhere.
+"""
+
+import os
+
+from algmatch.errors.MatchingErrors import (
+    CapacityExceededError,
+    MatchingError,
+    MultipleAssignmentError,
+    ParticipantNotFoundError,
+    UnacceptablePairError,
+)
+
+
+class AbstractStabilityChecker:
+    def __init__(self, stability_type: str | None = None) -> None:
+        self._assert_valid_stability_type(stability_type)
+        self.stability_type = None if stability_type is None else stability_type.lower()
+
+    @staticmethod
+    def _assert_valid_stability_type(st) -> None:
+        if st is None:
+            return
+        assert type(st) is str, "Stability type is not str'"
+        assert st.lower() in ("super", "strong"), (
+            "Stability type must be either 'super' or 'strong'"
+        )
+
+    def _read_instance(
+        self, filename, dictionary, instance, instance_type, tied_instance_type
+    ):
+        """
+        Utility. Returns the given compiled instance, or compiles one from the
+        filename or dictionary.
+        """
+        sources = (filename, dictionary, instance)
+        assert any(source is not None for source in sources), (
+            "Either filename, dictionary or instance must be provided"
+        )
+        assert sum(source is not None for source in sources) == 1, (
+            "Only one of filename, dictionary or instance must be provided"
+        )
+
+        if self.stability_type is not None:
+            instance_type = tied_instance_type
+
+        if instance is not None:
+            assert isinstance(instance, instance_type), (
+                f"Instance must be of type {instance_type.__name__}"
+            )
+            return instance
+
+        if filename is not None:
+            filename = os.path.join(os.getcwd(), filename)
+            assert os.path.isfile(filename), f"File {filename} does not exist"
+
+        return instance_type(filename=filename, dictionary=dictionary)
+
+    def get_blocking_pairs(self, matching: dict) -> list:
+        raise NotImplementedError("Method not implemented")
+
+    def is_stable(self, matching: dict) -> bool:
+        """
+        :param matching: dict, the matching to check, in any form accepted by get_blocking_pairs
+        :return: bool, False if the matching is invalid or admits a blocking pair
+        """
+        try:
+            return len(self.get_blocking_pairs(matching)) == 0
+        except MatchingError:
+            return False
+
+    def _blocks(self, proposer_diff, receiver_diff) -> bool:
+        """
+        Each side's difference is the rank of the other party minus the rank of what
+        they currently have, so negative means a strict improvement and zero means
+        indifference. Being unassigned or under-subscribed counts as -1.
+        """
+        if proposer_diff > 0 or receiver_diff > 0:
+            return False
+        if self.stability_type == "super":
+            return True
+        if self.stability_type == "strong":
+            return proposer_diff < 0 or receiver_diff < 0
+        return proposer_diff < 0 and receiver_diff < 0
+
+    def _read_assignment(
+        self, matching, side_key, proposers, receivers, proposer_type, receiver_type
+    ) -> dict:
+        """
+        Utility. Accepts either a full matching, as returned by get_stable_matching,
+        or just its proposer-sided entry, and checks it only uses acceptable pairs.
+
+        :return: dict, every proposer mapped to their receiver, or None if unassigned
+        """
+        if side_key in matching:
+            matching = matching[side_key]
+
+        assignment = {p: None for p in proposers}
+        for p, r in matching.items():
+            if p not in proposers:
+                raise ParticipantNotFoundError(proposer_type, p)
+            if r is None or r == "":
+                continue
+            if r not in receivers:
+                raise ParticipantNotFoundError(receiver_type, r)
+            if r not in proposers[p]["rank"] or p not in receivers[r]["rank"]:
+                raise UnacceptablePairError(proposer_type, p, r)
+            assignment[p] = r
+
+        return assignment
+
+    def _bipartite_blocking_pairs(
+        self, assignment, proposers, receivers, capacities, receiver_type
+    ) -> list:
+        """
+        Utility. Finds every blocking pair in one sweep over the proposers' lists,
+        after the occupancy and worst assigned rank of every receiver are found once.
+
+        :param assignment: dict, as returned by _read_assignment
+        :param proposers: dictionary with information for e.g. men, residents
+        :param receivers: dictionary with information for e.g. women, hospitals
+        :param capacities: dict of receiver capacities, or None if each takes one
+        :param receiver_type: singular of receiver group name
+        :return: list of (proposer, receiver) tuples
+        """
+        occupancy = {r: 0 for r in receivers}
+        worst_rank = {r: -1 for r in receivers}
+        for p, r in assignment.items():
+            if r is None:
+                continue
+
+            occupancy[r] += 1
+            if capacities is None and occupancy[r] > 1:
+                raise MultipleAssignmentError(receiver_type, r)
+            if capacities is not None and occupancy[r] > capacities[r]:
+                raise CapacityExceededError(receiver_type, r)
+
+            rank_p = receivers[r]["rank"][p]
+            if rank_p > worst_rank[r]:
+                worst_rank[r] = rank_p
+
+        blocking_pairs = []
+        for p, p_prefs in proposers.items():
+            # only ranks are read, as solvers may have consumed the lists
+            p_ranks = p_prefs["rank"]
+            partner = assignment[p]
+
+            for r, rank_r in p_ranks.items():
+                if r == partner:
+                    continue
+                if partner is None:
+                    proposer_diff = -1
+                else:
+                    proposer_diff = rank_r - p_ranks[partner]
+                if proposer_diff > 0:
+                    continue
+
+                capacity = 1 if capacities is None else capacities[r]
+                if occupancy[r] < capacity:
+                    receiver_diff = -1
+                else:
+                    receiver_diff = receivers[r]["rank"][p] - worst_rank[r]
+
+                if self._blocks(proposer_diff, receiver_diff):
+                    blocking_pairs.append((p, r))
+
+        return blocking_pairs
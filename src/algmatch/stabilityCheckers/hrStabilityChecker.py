@@ -0,0 +1,60 @@
+"""
+Find the blocking pairs of a matching for the Hospital/Residents Problem, with or without ties.
+"""
+
+from algmatch.stabilityCheckers.abstractStabilityChecker import (
+    AbstractStabilityChecker,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtPreferenceInstance import (
+    HRTPreferenceInstance,
+)
+
+
+class HRStabilityChecker(AbstractStabilityChecker):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        stability_type: str | None = None,
+        instance: HRPreferenceInstance | HRTPreferenceInstance | None = None,
+    ) -> None:
+        """
+        Initialise a checker for matchings of one Hospital/Residents instance.
+
+        :param filename: str, optional, default=None, the path to the file to read in the preferences from.
+        :param dictionary: dict, optional, default=None, the dictionary of preferences.
+        :param stability_type: str, optional, default=None, either "super" or "strong" if the preferences contain ties.
+        :param instance: HRPreferenceInstance or HRTPreferenceInstance, optional, default=None, an already compiled instance, used instead of reading one in.
+        """
+        super().__init__(stability_type=stability_type)
+
+        instance = self._read_instance(
+            filename, dictionary, instance, HRPreferenceInstance, HRTPreferenceInstance
+        )
+        self.residents = instance.residents
+        self.hospitals = instance.hospitals
+        self._capacities = {
+            h: h_info["capacity"] for h, h_info in self.hospitals.items()
+        }
+
+    def get_blocking_pairs(self, matching: dict) -> list:
+        """
+        Find every blocking pair of a matching.
+
+        :param matching: dict, either a matching as returned by get_stable_matching, or only its "resident_sided" part.
+        :return: list, the (resident, hospital) tuples that block the matching.
+        """
+        assignment = self._read_assignment(
+            matching,
+            "resident_sided",
+            self.residents,
+            self.hospitals,
+            "resident",
+            "hospital",
+        )
+        return self._bipartite_blocking_pairs(
+            assignment, self.residents, self.hospitals, self._capacities, "hospital"
+        )
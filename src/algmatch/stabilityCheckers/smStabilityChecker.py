@@ -0,0 +1,52 @@
+"""
+Find the blocking pairs of a matching for the Stable Marriage Problem, with or without ties.
+"""
+
+from algmatch.stabilityCheckers.abstractStabilityChecker import (
+    AbstractStabilityChecker,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
+from algmatch.stableMatchings.stableMarriageProblem.ties.smtPreferenceInstance import (
+    SMTPreferenceInstance,
+)
+
+
+class SMStabilityChecker(AbstractStabilityChecker):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        stability_type: str | None = None,
+        instance: SMPreferenceInstance | SMTPreferenceInstance | None = None,
+    ) -> None:
+        """
+        Initialise a checker for matchings of one Stable Marriage instance.
+
+        :param filename: str, optional, default=None, the path to the file to read in the preferences from.
+        :param dictionary: dict, optional, default=None, the dictionary of preferences.
+        :param stability_type: str, optional, default=None, either "super" or "strong" if the preferences contain ties.
+        :param instance: SMPreferenceInstance or SMTPreferenceInstance, optional, default=None, an already compiled instance, used instead of reading one in.
+        """
+        super().__init__(stability_type=stability_type)
+
+        instance = self._read_instance(
+            filename, dictionary, instance, SMPreferenceInstance, SMTPreferenceInstance
+        )
+        self.men = instance.men
+        self.women = instance.women
+
+    def get_blocking_pairs(self, matching: dict) -> list:
+        """
+        Find every blocking pair of a matching.
+
+        :param matching: dict, either a matching as returned by get_stable_matching, or only its "man_sided" part.
+        :return: list, the (man, woman) tuples that block the matching.
+        """
+        assignment = self._read_assignment(
+            matching, "man_sided", self.men, self.women, "man", "woman"
+        )
+        return self._bipartite_blocking_pairs(
+            assignment, self.men, self.women, None, "woman"
+        )
@@ -0,0 +1,130 @@
+"""
+Find the blocking pairs of a matching for the Student Project Allocation Problem,
+with or without ties.
+"""
+
+from algmatch.errors.MatchingErrors import CapacityExceededError
+from algmatch.stabilityCheckers.abstractStabilityChecker import (
+    AbstractStabilityChecker,
+)
+from algmatch.stableMatchings.studentProjectAllocation.noTies.spaPreferenceInstance import (
+    SPAPreferenceInstance,
+)
+from algmatch.stableMatchings.studentProjectAllocation.ties.spastPreferenceInstance import (
+    SPASTPreferenceInstance,
+)
+
+
+class SPAStabilityChecker(AbstractStabilityChecker):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        stability_type: str | None = None,
+        instance: SPAPreferenceInstance | SPASTPreferenceInstance | None = None,
+    ) -> None:
+        """
+        Initialise a checker for matchings of one Student Project Allocation instance.
+
+        :param filename: str, optional, default=None, the path to the file to read in the preferences from.
+        :param dictionary: dict, optional, default=None, the dictionary of preferences.
+        :param stability_type: str, optional, default=None, "super" if the preferences contain ties.
+        :param instance: SPAPreferenceInstance or SPASTPreferenceInstance, optional, default=None, an already compiled instance, used instead of reading one in.
+        """
+        super().__init__(stability_type=stability_type)
+        if self.stability_type == "strong":
+            raise NotImplementedError(
+                "Strong stability algorithms have not yet been published for SPAST"
+            )
+
+        instance = self._read_instance(
+            filename,
+            dictionary,
+            instance,
+            SPAPreferenceInstance,
+            SPASTPreferenceInstance,
+        )
+        self.students = instance.students
+        self.projects = instance.projects
+        self.lecturers = instance.lecturers
+
+        # instances with ties store their quotas under a different key
+        quota = "upper_quota" if self.stability_type is None else "capacity"
+        self._project_capacities = {
+            p: p_info[quota] for p, p_info in self.projects.items()
+        }
+        self._lecturer_capacities = {
+            lec: l_info[quota] for lec, l_info in self.lecturers.items()
+        }
+
+    def get_blocking_pairs(self, matching: dict) -> list:
+        """
+        Find every blocking pair of a matching.
+
+        :param matching: dict, either a matching as returned by get_stable_matching, or only its "student_sided" part.
+        :return: list, the (student, project) tuples that block the matching.
+        """
+        assignment = self._read_assignment(
+            matching,
+            "student_sided",
+            self.students,
+            self.projects,
+            "student",
+            "project",
+        )
+
+        p_occupancy = {p: 0 for p in self.projects}
+        p_worst_rank = {p: -1 for p in self.projects}
+        l_assigned = {lec: set() for lec in self.lecturers}
+        l_worst_rank = {lec: -1 for lec in self.lecturers}
+        for s, p in assignment.items():
+            if p is None:
+                continue
+
+            p_occupancy[p] += 1
+            if p_occupancy[p] > self._project_capacities[p]:
+                raise CapacityExceededError("project", p)
+            p_worst_rank[p] = max(p_worst_rank[p], self.projects[p]["rank"][s])
+
+            lecturer = self.projects[p]["lecturer"]
+            l_assigned[lecturer].add(s)
+            if len(l_assigned[lecturer]) > self._lecturer_capacities[lecturer]:
+                raise CapacityExceededError("lecturer", lecturer)
+            l_worst_rank[lecturer] = max(
+                l_worst_rank[lecturer], self.lecturers[lecturer]["rank"][s]
+            )
+
+        blocking_pairs = []
+        for s, s_prefs in self.students.items():
+            # only ranks are read, as solvers may have consumed the lists
+            s_ranks = s_prefs["rank"]
+            partner = assignment[s]
+
+            for p, rank_p in s_ranks.items():
+                if p == partner:
+                    continue
+                if partner is None:
+                    student_diff = -1
+                else:
+                    student_diff = rank_p - s_ranks[partner]
+                if student_diff > 0:
+                    continue
+
+                lecturer = self.projects[p]["lecturer"]
+                if p_occupancy[p] >= self._project_capacities[p]:
+                    # the project is full, so it must prefer s to its worst student
+                    project_diff = self.projects[p]["rank"][s] - p_worst_rank[p]
+                elif len(l_assigned[lecturer]) < self._lecturer_capacities[lecturer]:
+                    project_diff = -1
+                elif s in l_assigned[lecturer]:
+                    # s would only move between two of the lecturer's projects
+                    project_diff = -1
+                else:
+                    project_diff = (
+                        self.lecturers[lecturer]["rank"][s] - l_worst_rank[lecturer]
+                    )
+
+                if self._blocks(student_diff, project_diff):
+                    blocking_pairs.append((s, p))
+
+        return blocking_pairs
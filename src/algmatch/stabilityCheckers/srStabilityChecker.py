@@ -0,0 +1,57 @@
+"""
+Find the blocking pairs of a matching for the Stable Roommates Problem.
+"""
+
+from algmatch.errors.MatchingErrors import InconsistentMatchingError
+from algmatch.stabilityCheckers.abstractStabilityChecker import (
+    AbstractStabilityChecker,
+)
+from algmatch.stableMatchings.stableRoommatesProblem.srPreferenceInstance import (
+    SRPreferenceInstance,
+)
+
+
+class SRStabilityChecker(AbstractStabilityChecker):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SRPreferenceInstance | None = None,
+    ) -> None:
+        """
+        Initialise a checker for matchings of one Stable Roommates instance.
+
+        :param filename: str, optional, default=None, the path to the file to read in the preferences from.
+        :param dictionary: dict, optional, default=None, the dictionary of preferences.
+        :param instance: SRPreferenceInstance, optional, default=None, an already compiled instance, used instead of reading one in.
+        """
+        super().__init__()
+
+        instance = self._read_instance(
+            filename, dictionary, instance, SRPreferenceInstance, None
+        )
+        self.roommates = instance.roommates
+        self._order = {r: i for i, r in enumerate(self.roommates)}
+
+    def get_blocking_pairs(self, matching: dict) -> list:
+        """
+        Find every blocking pair of a matching.
+
+        :param matching: dict, a matching as returned by get_stable_matching.
+        :return: list, the (roommate, roommate) tuples that block the matching, each pair listed once.
+        """
+        assignment = self._read_assignment(
+            matching, None, self.roommates, self.roommates, "roommate", "roommate"
+        )
+        for r, partner in assignment.items():
+            if partner is not None and assignment[partner] != r:
+                raise InconsistentMatchingError("roommate", r, partner)
+
+        # both members of a blocking pair see it from their own side
+        return [
+            (r1, r2)
+            for r1, r2 in self._bipartite_blocking_pairs(
+                assignment, self.roommates, self.roommates, None, "roommate"
+            )
+            if self._order[r1] < self._order[r2]
+        ]
@@ -10,6 +10,27 @@ from algmatch.stableMatchings.stableMarriageProblem.noTies.smManOptimal import (
 from algmatch.stableMatchings.stableMarriageProblem.noTies.smWomanOptimal import (
     SMWomanOptimal,
 )
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smArrayManOptimal import (
+    SMArrayManOptimal,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smArrayWomanOptimal import (
+    SMArrayWomanOptimal,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smRotations import (
+    SMRotations,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smEgalitarian import (
+    SMEgalitarian,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smMinimumRegret import (
+    SMMinimumRegret,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
 
 
 class StableMarriageProblem:
@@ -18,27 +39,69 @@ class StableMarriageProblem:
         filename: str | None = None,
         dictionary: dict | None = None,
         optimised_side: str = "men",
+        engine: str = "dict",
+        instance: SMPreferenceInstance | BinaryPreferenceInstance | None = None,
     ) -> None:
         """
         Initialise the Stable Marriage Problem algorithm.
 
         :param filename: str, optional, default=None, the path to the file to read in the preferences from.
         :param dictionary: dict, optional, default=None, the dictionary of preferences.
-        :param optimised_side: str, optional, default="men", whether the algorithm is "men" (default) or "woman" sided.
+        :param optimised_side: str, optional, default="men", whether the algorithm is "men" (default) or "woman" sided, or finds the "egalitarian" stable matching, where the sum of the ranks everyone gives their partner is least, or the "minimum_regret" one, where the worst such rank is least.
+        :param engine: str, optional, default="dict", whether to run the "dict" (default) or integer-indexed "array" implementation. Both give identical results.
+        :param instance: SMPreferenceInstance or BinaryPreferenceInstance, optional, default=None, an instance compiled once from a file or dictionary, which can be shared between solvers and stability checkers, or a memory-mapped binary instance, which the "array" engine reads without copying.
         """
         if filename is not None:
             filename = os.path.join(os.getcwd(), filename)
 
         assert type(optimised_side) is str, "Param optimised_side must be of type str"
         optimised_side = optimised_side.lower()
-        assert optimised_side in ("men", "women"), (
-            "Optimised side must either be 'men' or 'women'"
+        assert optimised_side in ("men", "women", "egalitarian", "minimum_regret"), (
+            "Optimised side must either be 'men', 'women', 'egalitarian' or 'minimum_regret'"
         )
 
-        if optimised_side == "men":
-            self.sm_alg = SMManOptimal(filename=filename, dictionary=dictionary)
+        assert type(engine) is str, "Param engine must be of type str"
+        engine = engine.lower()
+        assert engine in ("dict", "array"), "Engine must either be 'dict' or 'array'"
+        assert engine == "dict" or optimised_side in ("men", "women"), (
+            "Only the 'dict' engine finds egalitarian or minimum regret matchings"
+        )
+
+        if engine == "dict" and isinstance(instance, BinaryPreferenceInstance):
+            instance = SMPreferenceInstance(filename=instance.filename)
+
+        # kept to enumerate every stable matching, whichever solver was chosen
+        self._sources = {
+            "filename": filename,
+            "dictionary": dictionary,
+            "instance": instance,
+        }
+
+        if engine == "array":
+            if optimised_side == "men":
+                self.sm_alg = SMArrayManOptimal(
+                    filename=filename, dictionary=dictionary, instance=instance
+                )
+            else:
+                self.sm_alg = SMArrayWomanOptimal(
+                    filename=filename, dictionary=dictionary, instance=instance
+                )
+        elif optimised_side == "egalitarian":
+            self.sm_alg = SMEgalitarian(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
+        elif optimised_side == "minimum_regret":
+            self.sm_alg = SMMinimumRegret(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
+        elif optimised_side == "men":
+            self.sm_alg = SMManOptimal(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
         else:
-            self.sm_alg = SMWomanOptimal(filename=filename, dictionary=dictionary)
+            self.sm_alg = SMWomanOptimal(
+                filename=filename, dictionary=dictionary, instance=instance
+            )
 
     def get_stable_matching(self) -> dict | None:
         """
@@ -50,3 +113,16 @@ class StableMarriageProblem:
         if self.sm_alg.is_stable:
             return self.sm_alg.stable_matching
         return None
+
+    def get_all_stable_matchings(self):
+        """
+        Generate every stable matching for the Stable Marriage Problem, one at a time,
+        from the rotations of the instance. Only the current matching is held in
+        memory, and the time between one and the next is polynomial.
+
+        :return: generator of dicts, each a stable matching in the same form as from get_stable_matching, starting from the man-optimal one
+        """
+        instance = self._sources["instance"]
+        if isinstance(instance, BinaryPreferenceInstance):
+            self._sources["instance"] = SMPreferenceInstance(filename=instance.filename)
+        return SMRotations(**self._sources).all_stable_matchings()
@@ -2,9 +2,9 @@
 Hospital/Residents Problem - Abstract class
 """
 
-from copy import deepcopy
 import os
 
+from algmatch.stabilityCheckers.hrStabilityChecker import HRStabilityChecker
 from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
     HRPreferenceInstance,
 )
@@ -12,13 +12,17 @@ from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstan
 
 class HRAbstract:
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | None = None,
     ) -> None:
-        assert filename is not None or dictionary is not None, (
-            "Either filename or dictionary must be provided"
+        sources = (filename, dictionary, instance)
+        assert any(source is not None for source in sources), (
+            "Either filename, dictionary or instance must be provided"
         )
-        assert not (filename is not None and dictionary is not None), (
-            "Only one of filename or dictionary must be provided"
+        assert sum(source is not None for source in sources) == 1, (
+            "Only one of filename, dictionary or instance must be provided"
         )
 
         if filename is not None:
@@ -28,13 +32,16 @@ class HRAbstract:
         if dictionary is not None:
             self._reader = HRPreferenceInstance(dictionary=dictionary)
 
+        if instance is not None:
+            assert isinstance(instance, HRPreferenceInstance), (
+                "Instance must be of type HRPreferenceInstance"
+            )
+            # compiled instances may be shared, so solvers must never modify them
+            self._reader = instance
+
         self.residents = self._reader.residents
         self.hospitals = self._reader.hospitals
 
-        # we need original copies of the preference lists to check the stability of solutions
-        self.original_residents = deepcopy(self.residents)
-        self.original_hospitals = deepcopy(self.hospitals)
-
         self.M = {}  # provisional matching
         self.stable_matching = {
             "resident_sided": {resident: "" for resident in self.residents},
@@ -42,37 +49,12 @@ class HRAbstract:
         }
         self.is_stable = False
 
-    def _blocking_pair_condition(self, resident, hospital):
-        h_info = self.original_hospitals[hospital]
-        assignees = self.M[hospital]["assigned"]
-
-        cj = h_info["capacity"]
-        occupancy = len(assignees)
-        if occupancy < cj:
-            return True
-
-        resident_rank = h_info["rank"][resident]
-        for existing_resident in assignees:
-            existing_rank = h_info["rank"][existing_resident]
-            if resident_rank < existing_rank:
-                return True
-
-        return False
-
     def _check_stability(self):
-        # stability must be checked with regards to the original lists prior to deletions
-        for resident, r_prefs in self.original_residents.items():
-            preferred_hospitals = r_prefs["list"]
-            if self.M[resident]["assigned"] is not None:
-                matched_hospital = self.M[resident]["assigned"]
-                rank_matched_hospital = r_prefs["rank"][matched_hospital]
-                preferred_hospitals = r_prefs["list"][:rank_matched_hospital]
-
-            for hospital in preferred_hospitals:
-                if self._blocking_pair_condition(resident, hospital):
-                    return False
-
-        return True
+        # the solvers never modify the preference lists, so these are the originals
+        checker = HRStabilityChecker(instance=self._reader)
+        return checker.is_stable(
+            {resident: self.M[resident]["assigned"] for resident in self.residents}
+        )
 
     def _while_loop(self):
         raise NotImplementedError("Method _while_loop must be implemented in subclass")
@@ -0,0 +1,106 @@
+"""
+Hospital/Residents Problem - Abstract class for the array-backed engine
+
+Residents and hospitals are interned to contiguous integers, and each side's lists
+are stored as flat buffers annotated with the rank the other side gives every entry.
+Both orientations move a cursor along the proposing side's lists and treat anything
+beyond the receiver's current rank threshold as deleted, rather than removing it.
+"""
+
+from array import array
+import os
+
+from algmatch.abstractClasses.abstractArrayEngine import AbstractArrayEngine
+from algmatch.binaryInstances.binaryLayouts import is_binary_instance
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+
+
+class HRArrayAbstract(AbstractArrayEngine):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | BinaryPreferenceInstance | None = None,
+    ) -> None:
+        sources = (filename, dictionary, instance)
+        assert any(source is not None for source in sources), (
+            "Either filename, dictionary or instance must be provided"
+        )
+        assert sum(source is not None for source in sources) == 1, (
+            "Only one of filename, dictionary or instance must be provided"
+        )
+
+        if filename is not None:
+            assert os.path.isfile(filename), f"File {filename} does not exist"
+            if is_binary_instance(filename):
+                # the lists are read straight from the mapped file, without a copy
+                self._reader = BinaryPreferenceInstance(filename)
+            else:
+                self._reader = HRPreferenceInstance(filename=filename)
+
+        if dictionary is not None:
+            self._reader = HRPreferenceInstance(dictionary=dictionary)
+
+        if instance is not None:
+            assert isinstance(
+                instance, (HRPreferenceInstance, BinaryPreferenceInstance)
+            ), (
+                "Instance must be of type HRPreferenceInstance or BinaryPreferenceInstance"
+            )
+            # compiled instances may be shared, so solvers must never modify them
+            self._reader = instance
+
+        if isinstance(self._reader, BinaryPreferenceInstance):
+            assert self._reader.kind == "HR", "Binary instance must be of kind HR"
+
+        self.resident_names = self.get_names("residents")
+        self.hospital_names = self.get_names("hospitals")
+        self._no_residents = len(self.resident_names)
+        self._no_hospitals = len(self.hospital_names)
+
+        self._capacity = self.get_quotas("hospitals", self.hospital_names, "capacity")
+        self._occupancy = array("i", [0]) * self._no_hospitals
+
+        self.stable_matching = {
+            "resident_sided": {resident: "" for resident in self.resident_names},
+            "hospital_sided": {hospital: set() for hospital in self.hospital_names},
+        }
+        self.is_stable = False
+
+    def _get_assigned_hospitals(self):
+        """
+        :return: for each resident index, the assigned hospital index or -1
+        """
+        raise NotImplementedError(
+            "Method _get_assigned_hospitals must be implemented in subclass"
+        )
+
+    def _while_loop(self):
+        raise NotImplementedError("Method _while_loop must be implemented in subclass")
+
+    def _check_stability(self) -> bool:
+        raise NotImplementedError(
+            "Method _check_stability must be implemented in subclass"
+        )
+
+    def run(self) -> None:
+        self._while_loop()
+
+        for r, h in enumerate(self._get_assigned_hospitals()):
+            if h != -1:
+                resident = self.resident_names[r]
+                hospital = self.hospital_names[h]
+                self.stable_matching["resident_sided"][resident] = hospital
+                self.stable_matching["hospital_sided"][hospital].add(resident)
+
+        self.is_stable = self._check_stability()
+
+        if self.is_stable:
+            return f"stable matching: {self.stable_matching}"
+        else:
+            return f"unstable matching: {self.stable_matching}"
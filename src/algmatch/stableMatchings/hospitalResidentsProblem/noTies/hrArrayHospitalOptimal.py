@@ -0,0 +1,102 @@
+"""
+Array-backed algorithm to produce the hospital-optimal, resident-pessimal stable matching.
+"""
+
+from array import array
+
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrArrayAbstract import (
+    HRArrayAbstract,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+
+
+class HRArrayHospitalOptimal(HRArrayAbstract):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | BinaryPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        self._h_offsets, self._h_targets, self._h_target_ranks = self.get_lists(
+            "hospitals", self.hospital_names, "residents", self.resident_names
+        )
+
+        # each hospital only ever offers further down its list
+        self._cursor = array("i", self._h_offsets[:-1])
+        # hospital each resident holds, and the rank they give it
+        self._assigned = array("i", [-1]) * self._no_residents
+        self._held_rank = array("i", [self._no_hospitals]) * self._no_residents
+
+    def _get_assigned_hospitals(self):
+        return self._assigned
+
+    def _while_loop(self):
+        h_offsets = self._h_offsets
+        h_targets = self._h_targets
+        h_target_ranks = self._h_target_ranks
+        cursor = self._cursor
+        assigned = self._assigned
+        held_rank = self._held_rank
+        capacity = self._capacity
+        occupancy = self._occupancy
+
+        undersub_hospitals = [
+            h
+            for h in range(self._no_hospitals)
+            if capacity[h] > 0 and h_offsets[h] < h_offsets[h + 1]
+        ]
+
+        while undersub_hospitals:
+            h = undersub_hospitals.pop()
+            idx = cursor[h]
+            end = h_offsets[h + 1]
+
+            while occupancy[h] < capacity[h] and idx < end:
+                r = h_targets[idx]
+                rank_h = h_target_ranks[idx]
+                idx += 1
+
+                # r rejects any hospital no better than the one they hold
+                if rank_h >= held_rank[r]:
+                    continue
+
+                h_prime = assigned[r]
+                if h_prime != -1:
+                    occupancy[h_prime] -= 1
+                    if cursor[h_prime] < h_offsets[h_prime + 1]:
+                        undersub_hospitals.append(h_prime)
+
+                assigned[r] = h
+                held_rank[r] = rank_h
+                occupancy[h] += 1
+
+            cursor[h] = idx
+
+    def _check_stability(self) -> bool:
+        # stability is checked against the full lists, which were never modified
+        h_offsets = self._h_offsets
+        h_targets = self._h_targets
+        h_target_ranks = self._h_target_ranks
+
+        for h in range(self._no_hospitals):
+            start = h_offsets[h]
+            end = h_offsets[h + 1]
+
+            # a full hospital can only block with residents it prefers to its worst
+            if self._occupancy[h] >= self._capacity[h]:
+                end -= 1
+                while end >= start and self._assigned[h_targets[end]] != h:
+                    end -= 1
+
+            for idx in range(start, end):
+                if h_target_ranks[idx] < self._held_rank[h_targets[idx]]:
+                    return False
+
+        return True
@@ -0,0 +1,125 @@
+"""
+Array-backed algorithm to produce the resident-optimal, hospital-pessimal stable matching.
+"""
+
+from array import array
+
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrArrayAbstract import (
+    HRArrayAbstract,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+
+
+class HRArrayResidentOptimal(HRArrayAbstract):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | BinaryPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        self._r_offsets, self._r_targets, self._r_target_ranks = self.get_lists(
+            "residents", self.resident_names, "hospitals", self.hospital_names
+        )
+        self._h_offsets, self._h_targets, _ = self.get_lists(
+            "hospitals", self.hospital_names, "residents", self.resident_names
+        )
+
+        # position in the resident's list of their hospital, -1 if unassigned
+        self._position = array("i", [-1]) * self._no_residents
+        # whether the resident at each position of a hospital's list is assigned there
+        self._held = bytearray(len(self._h_targets))
+        # rank of the worst assigned resident; only ever decreases once full
+        self._worst_rank = array("i", [-1]) * self._no_hospitals
+
+        # each resident only ever moves forward along their list, and both are kept
+        # between runs, so solving again resumes where the last run finished
+        self._cursor = array("i", self._r_offsets[:-1])
+        self._unassigned_residents = [
+            r
+            for r in range(self._no_residents)
+            if self._r_offsets[r] < self._r_offsets[r + 1]
+        ]
+
+    def _get_assigned_hospitals(self):
+        return [-1 if idx == -1 else self._r_targets[idx] for idx in self._position]
+
+    def _while_loop(self):
+        r_offsets = self._r_offsets
+        r_targets = self._r_targets
+        r_target_ranks = self._r_target_ranks
+        h_offsets = self._h_offsets
+        h_targets = self._h_targets
+        position = self._position
+        held = self._held
+        worst_rank = self._worst_rank
+        capacity = self._capacity
+        occupancy = self._occupancy
+        cursor = self._cursor
+        unassigned_residents = self._unassigned_residents
+
+        while unassigned_residents:
+            r = unassigned_residents.pop()
+            idx = cursor[r]
+            end = r_offsets[r + 1]
+
+            while idx < end:
+                h = r_targets[idx]
+                rank_r = r_target_ranks[idx]
+                idx += 1
+
+                if occupancy[h] < capacity[h]:
+                    occupancy[h] += 1
+                    if rank_r > worst_rank[h]:
+                        worst_rank[h] = rank_r
+
+                elif rank_r < worst_rank[h]:
+                    base = h_offsets[h]
+                    rank_worst = worst_rank[h]
+                    r_worst = h_targets[base + rank_worst]
+                    held[base + rank_worst] = 0
+                    position[r_worst] = -1
+                    if cursor[r_worst] < r_offsets[r_worst + 1]:
+                        unassigned_residents.append(r_worst)
+
+                    # r will be held at rank_r, so the scan stops there at the latest
+                    rank_worst -= 1
+                    while rank_worst > rank_r and not held[base + rank_worst]:
+                        rank_worst -= 1
+                    worst_rank[h] = rank_worst
+
+                else:
+                    # (r, h) lies past the hospital's threshold, so it is deleted
+                    continue
+
+                held[h_offsets[h] + rank_r] = 1
+                position[r] = idx - 1
+                break
+
+            cursor[r] = idx
+
+    def _check_stability(self) -> bool:
+        # stability is checked against the full lists, which were never modified
+        r_offsets = self._r_offsets
+        r_targets = self._r_targets
+        r_target_ranks = self._r_target_ranks
+
+        for r in range(self._no_residents):
+            end = self._position[r]
+            if end == -1:
+                end = r_offsets[r + 1]
+
+            for idx in range(r_offsets[r], end):
+                h = r_targets[idx]
+                if self._occupancy[h] < self._capacity[h]:
+                    return False
+                if r_target_ranks[idx] < self._worst_rank[h]:
+                    return False
+
+        return True
@@ -0,0 +1,14 @@
+"""
+Algorithm to produce an egalitarian stable matching, where the sum of the ranks
+residents give their hospitals and hospitals give their residents is least.
+"""
+
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrRotations import (
+    HRRotations,
+)
+
+
+class HREgalitarian(HRRotations):
+    def _while_loop(self):
+        poset = self.get_rotation_poset()
+        self._set_matching(poset.matching_after(poset.egalitarian_rotations()))
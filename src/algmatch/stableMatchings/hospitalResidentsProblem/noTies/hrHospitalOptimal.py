@@ -5,15 +5,23 @@ Algorithm to produce the resident-optimal, hospital-pessimal stable matching.
 from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrAbstract import (
     HRAbstract,
 )
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
 
 
 class HRHospitalOptimal(HRAbstract):
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | None = None,
     ) -> None:
-        super().__init__(filename=filename, dictionary=dictionary)
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
 
         self.undersub_hospitals = set()
+        # position of each hospital's next offer, so its list is never modified
+        self.offer_idx = {}
 
         for resident in self.residents:
             self.M[resident] = {"assigned": None}
@@ -21,17 +29,20 @@ class HRHospitalOptimal(HRAbstract):
         for hospital, prefs in self.hospitals.items():
             if len(prefs["list"]) > 0:
                 self.undersub_hospitals.add(hospital)
+            self.offer_idx[hospital] = 0
             self.M[hospital] = {"assigned": set()}
 
     def _assign_pair(self, resident, hospital):
         self.M[resident]["assigned"] = hospital
         self.M[hospital]["assigned"].add(resident)
 
-    def _delete_pair(self, resident, hospital):
-        self.residents[resident]["list"].remove(hospital)
-        self.hospitals[hospital]["list"].remove(resident)
-        if len(self.hospitals[hospital]["list"]) == 0:
-            self.undersub_hospitals.discard(hospital)
+    def _is_deleted(self, resident, hospital):
+        # a resident implicitly deletes every hospital they rank below their own
+        assigned_hospital = self.M[resident]["assigned"]
+        if assigned_hospital is None:
+            return False
+        r_ranks = self.residents[resident]["rank"]
+        return r_ranks[hospital] > r_ranks[assigned_hospital]
 
     def _break_assignment(self, resident, hospital):
         self.M[resident]["assigned"] = None
@@ -40,10 +51,19 @@ class HRHospitalOptimal(HRAbstract):
             self.undersub_hospitals.add(hospital)
 
     def get_first_unassigned_resident(self, hospital):
-        for resident in self.hospitals[hospital]["list"]:
-            if resident not in self.M[hospital]["assigned"]:
-                return resident
-        return None
+        # residents passed over are assigned here or deleted, and leaving deletes them
+        h_list = self.hospitals[hospital]["list"]
+        assignees = self.M[hospital]["assigned"]
+        idx = self.offer_idx[hospital]
+        while idx < len(h_list) and (
+            h_list[idx] in assignees or self._is_deleted(h_list[idx], hospital)
+        ):
+            idx += 1
+        self.offer_idx[hospital] = idx
+
+        if idx == len(h_list):
+            return None
+        return h_list[idx]
 
     def _while_loop(self):
         while len(self.undersub_hospitals) != 0:
@@ -59,10 +79,6 @@ class HRHospitalOptimal(HRAbstract):
                     self._break_assignment(r, h_prime)
                 self._assign_pair(r, h)
 
-                rank_h = self.residents[r]["rank"][h]
-                for reject in self.residents[r]["list"][rank_h + 1 :]:
-                    self._delete_pair(r, reject)
-
                 # See if the hospital can make another offer
                 # If yes, loop. If no, next hospital.
                 occupancy += 1
@@ -0,0 +1,14 @@
+"""
+Algorithm to produce a minimum regret stable matching, where the worst rank a
+resident gives their hospital, or a hospital gives one of its residents, is least.
+"""
+
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrRotations import (
+    HRRotations,
+)
+
+
+class HRMinimumRegret(HRRotations):
+    def _while_loop(self):
+        poset = self.get_rotation_poset()
+        self._set_matching(poset.matching_after(poset.minimum_regret_rotations()))
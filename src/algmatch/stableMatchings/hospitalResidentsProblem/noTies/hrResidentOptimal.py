@@ -5,39 +5,59 @@ Algorithm to produce the resident-optimal, hospital-pessimal stable matching.
 from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrAbstract import (
     HRAbstract,
 )
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
 
 
 class HRResidentOptimal(HRAbstract):
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | None = None,
     ) -> None:
-        super().__init__(filename=filename, dictionary=dictionary)
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
 
         self.unassigned_residents = set()
+        # position of each resident's next application, so their list is never modified
+        self.proposal_idx = {}
+        # rank of the worst resident held by each hospital once full, as it stays full
+        self.worst_rank = {}
 
         for resident, prefs in self.residents.items():
             if len(prefs["list"]) > 0:
                 self.unassigned_residents.add(resident)
+            self.proposal_idx[resident] = 0
             self.M[resident] = {"assigned": None}
 
-        for hospital in self.hospitals:
+        for hospital, prefs in self.hospitals.items():
+            self.worst_rank[hospital] = len(prefs["list"])
             self.M[hospital] = {"assigned": set()}
 
     def _assign_pair(self, resident, hospital):
         self.M[resident]["assigned"] = hospital
         self.M[hospital]["assigned"].add(resident)
 
-    def _delete_pair(self, resident, hospital):
-        self.residents[resident]["list"].remove(hospital)
-        self.hospitals[hospital]["list"].remove(resident)
-        if len(self.residents[resident]["list"]) == 0:
-            self.unassigned_residents.discard(resident)
+    def _is_deleted(self, resident, hospital):
+        # a full hospital implicitly deletes every resident it ranks below its worst
+        return self.hospitals[hospital]["rank"][resident] > self.worst_rank[hospital]
+
+    def _get_head(self, resident):
+        r_list = self.residents[resident]["list"]
+        idx = self.proposal_idx[resident]
+        while idx < len(r_list) and self._is_deleted(resident, r_list[idx]):
+            idx += 1
+        self.proposal_idx[resident] = idx
+
+        if idx == len(r_list):
+            return None
+        return r_list[idx]
 
     def _break_assignment(self, resident, hospital):
         self.M[resident]["assigned"] = None
         self.M[hospital]["assigned"].remove(resident)
-        if len(self.residents[resident]["list"]) > 0:
-            self.unassigned_residents.add(resident)
+        self.unassigned_residents.add(resident)
 
     def _get_worst_existing_resident(self, hospital):
         existing_residents = self.M[hospital]["assigned"]
@@ -52,7 +72,9 @@ class HRResidentOptimal(HRAbstract):
     def _while_loop(self):
         while len(self.unassigned_residents) != 0:
             r = self.unassigned_residents.pop()
-            h = self.residents[r]["list"][0]
+            h = self._get_head(r)
+            if h is None:
+                continue
 
             self._assign_pair(r, h)
 
@@ -66,6 +88,4 @@ class HRResidentOptimal(HRAbstract):
 
             if occupancy == capacity:
                 r_worst = self._get_worst_existing_resident(h)
-                rank_worst = self.hospitals[h]["rank"][r_worst]
-                for reject in self.hospitals[h]["list"][rank_worst:]:
-                    self._delete_pair(reject, h)
+                self.worst_rank[h] = self.hospitals[h]["rank"][r_worst]
@@ -0,0 +1,122 @@
+"""
+Rotations of a Hospital/Residents instance, found from the resident-optimal stable
+matching, from which every stable matching can be generated.
+"""
+
+from algmatch.abstractClasses.rotationPoset import UNMATCHED, RotationPoset
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrResidentOptimal import (
+    HRResidentOptimal,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+
+
+class HRRotations(HRResidentOptimal):
+    """
+    Each hospital is split into one copy per unit of its capacity, each with the
+    hospital's list, and each resident ranks the copies of a hospital in order where
+    they ranked the hospital. The stable matchings of this stable marriage instance
+    correspond one-to-one with those of the original, where the i-th copy of each
+    hospital takes its i-th best assigned resident.
+    """
+
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        self.resident_names = list(self.residents)
+        self.hospital_names = list(self.hospitals)
+        # hospital of each copy, and index of the first copy of each hospital
+        self.copy_hospital = []
+        self.first_copy = {}
+        for hospital in self.hospital_names:
+            self.first_copy[hospital] = len(self.copy_hospital)
+            self.copy_hospital.extend([hospital] * self.hospitals[hospital]["capacity"])
+        self.rotation_poset = None
+
+    def get_rotation_poset(self) -> RotationPoset:
+        """
+        Finds the resident-optimal stable matching, if not yet found, and the
+        rotations from it, with residents proposing to the copies of hospitals.
+
+        :return: RotationPoset, over the residents in index order and the copies
+        """
+        if self.rotation_poset is None:
+            # once the resident-optimal matching is found, this does nothing
+            super()._while_loop()
+
+            resident_index = {r: i for i, r in enumerate(self.resident_names)}
+            resident_lists = []
+            # residents give each copy the rank of its hospital
+            resident_ranks = []
+            for resident in self.resident_names:
+                r_list = []
+                r_ranks = {}
+                for rank, hospital in enumerate(self.residents[resident]["list"]):
+                    first = self.first_copy[hospital]
+                    copies = range(first, first + self.hospitals[hospital]["capacity"])
+                    r_list.extend(copies)
+                    r_ranks.update(dict.fromkeys(copies, rank))
+                resident_lists.append(r_list)
+                resident_ranks.append(r_ranks)
+
+            # every copy of a hospital shares its ranks
+            hospital_ranks = {
+                hospital: {resident_index[r]: rank for r, rank in prefs["rank"].items()}
+                for hospital, prefs in self.hospitals.items()
+            }
+            copy_ranks = [hospital_ranks[h] for h in self.copy_hospital]
+
+            resident_optimal = [UNMATCHED] * len(self.resident_names)
+            for hospital in self.hospital_names:
+                ranks = hospital_ranks[hospital]
+                assigned = sorted(
+                    (resident_index[r] for r in self.M[hospital]["assigned"]),
+                    key=ranks.__getitem__,
+                )
+                for offset, i in enumerate(assigned):
+                    resident_optimal[i] = self.first_copy[hospital] + offset
+
+            self.rotation_poset = RotationPoset(
+                resident_lists, copy_ranks, resident_optimal, resident_ranks
+            )
+        return self.rotation_poset
+
+    def _set_matching(self, partner):
+        """
+        :param partner: the copy assigned to each resident in index order, or
+            UNMATCHED, as from the rotation poset
+        """
+        for hospital in self.hospital_names:
+            self.M[hospital]["assigned"] = set()
+        for i, j in enumerate(partner):
+            resident = self.resident_names[i]
+            if j == UNMATCHED:
+                self.M[resident]["assigned"] = None
+            else:
+                hospital = self.copy_hospital[j]
+                self.M[resident]["assigned"] = hospital
+                self.M[hospital]["assigned"].add(resident)
+
+    def all_stable_matchings(self):
+        """
+        :return: generator of every stable matching, in the same form as
+            stable_matching, starting from the resident-optimal one
+        """
+        poset = self.get_rotation_poset()
+        for partner in poset.stable_matchings():
+            stable_matching = {
+                "resident_sided": {r: "" for r in self.resident_names},
+                "hospital_sided": {h: set() for h in self.hospital_names},
+            }
+            for i, j in enumerate(partner):
+                if j != UNMATCHED:
+                    resident, hospital = self.resident_names[i], self.copy_hospital[j]
+                    stable_matching["resident_sided"][resident] = hospital
+                    stable_matching["hospital_sided"][hospital].add(resident)
+            yield stable_matching
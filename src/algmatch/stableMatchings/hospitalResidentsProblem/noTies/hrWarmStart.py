@@ -0,0 +1,340 @@
+"""
+Algorithm to keep the resident-optimal stable matching up to date as residents
+withdraw, edit their preference lists, or hospitals change their capacities,
+resuming from the previous matching rather than solving again from scratch.
+
+Changes that can only make residents worse off resume deferred acceptance from
+the residents they displace, as if those residents had just arrived. Changes that
+can make residents better off first offer each opened seat to the best resident
+wanting it, then the seat they leave in turn, which gives a stable matching. Any
+rotation exposed on the hospitals' side is then eliminated, moving residents up
+until the matching is resident-optimal again. Such a rotation must pass through a
+hospital the change touched, so only walks from those hospitals are needed.
+"""
+
+from bisect import bisect
+
+from algmatch.binaryInstances.binaryLayouts import is_binary_instance
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrResidentOptimal import (
+    HRResidentOptimal,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.fileReader import FileReader
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.dictionaryReader import (
+    DictionaryReader,
+)
+
+
+class HRWarmStart(HRResidentOptimal):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: HRPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        # the instance may be shared, so changed participants get new entries here
+        self.residents = dict(self.residents)
+        self.hospitals = dict(self.hospitals)
+        self.withdrawn = set()
+        # residents whose assignment may have changed since the matching was last read
+        self.touched = set()
+        # each resident moved by the current change, to the hospital they had before it
+        self.moved = {}
+
+        # each hospital's ranking of residents before the pairs not on both lists were
+        # removed, so an edit can add a hospital the resident did not list at first.
+        # Compiled instances only keep the cleaned lists, so this is None for them
+        self._original_ranks = None
+        if dictionary is not None:
+            original = DictionaryReader(dictionary).hospitals
+        elif filename is not None and not is_binary_instance(filename):
+            original = FileReader(filename).hospitals
+        else:
+            original = None
+        if original is not None:
+            self._original_ranks = {
+                hospital: {resident: idx for idx, resident in enumerate(h_prefs["list"])}
+                for hospital, h_prefs in original.items()
+            }
+
+    def _assign_pair(self, resident, hospital):
+        self.touched.add(resident)
+        self.moved.setdefault(resident, self.M[resident]["assigned"])
+        super()._assign_pair(resident, hospital)
+
+    def _break_assignment(self, resident, hospital):
+        self.touched.add(resident)
+        self.moved.setdefault(resident, hospital)
+        super()._break_assignment(resident, hospital)
+
+    def _update_worst_rank(self, hospital):
+        h_prefs = self.hospitals[hospital]
+        assigned = self.M[hospital]["assigned"]
+        if h_prefs["capacity"] == 0:
+            self.worst_rank[hospital] = -1
+        elif len(assigned) == h_prefs["capacity"]:
+            r_worst = self._get_worst_existing_resident(hospital)
+            self.worst_rank[hospital] = h_prefs["rank"][r_worst]
+        else:
+            self.worst_rank[hospital] = len(h_prefs["list"])
+
+    def _prefers(self, resident, hospital):
+        # whether the resident would rather be at the hospital than where they are
+        if resident in self.withdrawn:
+            return False
+        r_rank = self.residents[resident]["rank"]
+        current = self.M[resident]["assigned"]
+        if hospital not in r_rank or current == hospital:
+            return False
+        return current is None or r_rank[hospital] < r_rank[current]
+
+    def _fill_vacancy(self, hospital):
+        # offer the seat to the best resident that wants it, then offer theirs
+        while hospital is not None:
+            self._update_worst_rank(hospital)
+            capacity = self.hospitals[hospital]["capacity"]
+            if len(self.M[hospital]["assigned"]) >= capacity:
+                return
+
+            candidate = None
+            for resident in self.hospitals[hospital]["list"]:
+                if self._prefers(resident, hospital):
+                    candidate = resident
+                    break
+            if candidate is None:
+                return
+
+            previous = self.M[candidate]["assigned"]
+            if previous is not None:
+                self._break_assignment(candidate, previous)
+            self.unassigned_residents.discard(candidate)
+            self._assign_pair(candidate, hospital)
+            self.proposal_idx[candidate] = self.residents[candidate]["rank"][hospital]
+            self._update_worst_rank(hospital)
+            hospital = previous
+
+    def _changed_hospitals(self):
+        # hospitals for which whether a moved resident would rather be there changed
+        changed = set()
+        for resident, old in self.moved.items():
+            r_list = self.residents[resident]["list"]
+            r_rank = self.residents[resident]["rank"]
+            old_idx = r_rank.get(old, len(r_list))
+            new_idx = r_rank.get(self.M[resident]["assigned"], len(r_list))
+            if resident in self.withdrawn:
+                new_idx = -1
+            lo, hi = sorted((old_idx, new_idx))
+            changed.update(r_list[max(lo, 0) : hi + 1])
+        self.moved.clear()
+        return changed
+
+    def _next_resident(self, hospital):
+        # the resident a full hospital would take after its worst, or None if that
+        # resident is unassigned, as they are unassigned in every stable matching
+        h_prefs = self.hospitals[hospital]
+        if len(self.M[hospital]["assigned"]) < h_prefs["capacity"]:
+            return None
+
+        h_list = h_prefs["list"]
+        for idx in range(self.worst_rank[hospital] + 1, len(h_list)):
+            resident = h_list[idx]
+            if self._prefers(resident, hospital):
+                if self.M[resident]["assigned"] is None:
+                    return None
+                return resident
+        return None
+
+    def _eliminate_rotations(self, hospitals):
+        # every rotation exposed on the hospitals' side passes through a hospital
+        # whose next resident has changed, so walks only start from those
+        stack = list(hospitals)
+        dead_ends = set()
+        while stack:
+            hospital = stack.pop()
+            path = []
+            on_path = {}
+            while hospital is not None and hospital not in dead_ends:
+                if hospital in on_path:
+                    self._eliminate(path[on_path[hospital] :])
+                    stack.extend(self._changed_hospitals())
+                    dead_ends.clear()
+                    break
+                resident = self._next_resident(hospital)
+                on_path[hospital] = len(path)
+                path.append((hospital, resident))
+                hospital = None if resident is None else self.M[resident]["assigned"]
+            else:
+                dead_ends.update(on_path)
+
+    def _eliminate(self, rotation):
+        # each hospital takes its next resident, who leaves the following hospital
+        for _, resident in rotation:
+            self._break_assignment(resident, self.M[resident]["assigned"])
+        for hospital, resident in rotation:
+            self.unassigned_residents.discard(resident)
+            self._assign_pair(resident, hospital)
+            self.proposal_idx[resident] = self.residents[resident]["rank"][hospital]
+        for hospital, _ in rotation:
+            self._update_worst_rank(hospital)
+
+    def _accepts(self, hospital, resident) -> bool:
+        """
+        Whether the hospital ranks the resident, adding the resident to the
+        hospital's list if they were only left out for not listing the hospital.
+
+        :raises ValueError: the instance was compiled, so it is unknown whether a hospital ranks a resident who did not list it
+        """
+        h_prefs = self.hospitals[hospital]
+        if resident in h_prefs["rank"]:
+            return True
+        if self._original_ranks is None:
+            raise ValueError(
+                f"Cannot add {hospital} to the list of {resident}, as the instance was "
+                "compiled without the pairs its lists did not share. Solve from a "
+                "filename or dictionary to add hospitals to a resident's list."
+            )
+
+        original_rank = self._original_ranks[hospital]
+        if resident not in original_rank:
+            return False
+
+        # the cleaned list keeps the original order, so the resident slots into it
+        h_list = list(h_prefs["list"])
+        h_list.insert(
+            bisect(h_list, original_rank[resident], key=original_rank.__getitem__),
+            resident,
+        )
+        self.hospitals[hospital] = dict(
+            h_prefs,
+            list=h_list,
+            rank={r: idx for idx, r in enumerate(h_list)},
+        )
+        # the ranks after the resident have shifted
+        self._update_worst_rank(hospital)
+        return True
+
+    def withdraw_resident(self, resident) -> None:
+        """
+        Remove a resident from the instance, offering their seat on.
+
+        :param resident: str, the name of the resident, e.g. "r1"
+        """
+        assert resident in self.residents, f"Resident {resident} does not exist"
+        if resident in self.withdrawn:
+            return
+
+        hospital = self.M[resident]["assigned"]
+        self.withdrawn.add(resident)
+        self.touched.add(resident)
+        self.moved.setdefault(resident, hospital)
+        if hospital is not None:
+            self._break_assignment(resident, hospital)
+        self.unassigned_residents.discard(resident)
+
+        self._fill_vacancy(hospital)
+        self._eliminate_rotations(self._changed_hospitals())
+
+    def edit_preferences(self, resident, preferences: list) -> None:
+        """
+        Replace a resident's preference list, which also brings back a withdrawn
+        resident. A hospital the resident did not list before joins their list if
+        the hospital ranks them, and is otherwise left out, as when the instance was
+        read. Only instances read from a filename or dictionary keep the rankings
+        needed to tell.
+
+        :param resident: str, the name of the resident, e.g. "r1"
+        :param preferences: list of str, the resident's hospitals, most preferred first
+        :raises ValueError: a hospital the resident did not list before is added, but the instance was compiled
+        """
+        assert resident in self.residents, f"Resident {resident} does not exist"
+        assert len(set(preferences)) == len(preferences), (
+            f"Preferences for resident {resident} contain repeats"
+        )
+        for hospital in preferences:
+            assert hospital in self.hospitals, f"Hospital {hospital} does not exist"
+
+        self.withdraw_resident(resident)
+
+        r_list = [h for h in preferences if self._accepts(h, resident)]
+        self.residents[resident] = {
+            "list": r_list,
+            "rank": {hospital: idx for idx, hospital in enumerate(r_list)},
+        }
+        self.withdrawn.remove(resident)
+        self.touched.add(resident)
+        self.proposal_idx[resident] = 0
+        self.unassigned_residents.add(resident)
+        self._while_loop()
+        self.moved.clear()
+
+    def change_capacity(self, hospital, change: int) -> None:
+        """
+        Add to, or with a negative change take from, a hospital's capacity.
+
+        :param hospital: str, the name of the hospital, e.g. "h1"
+        :param change: int, the number of seats added, or removed if negative
+        """
+        assert hospital in self.hospitals, f"Hospital {hospital} does not exist"
+        assert type(change) is int, "Param change must be of type int"
+        capacity = self.hospitals[hospital]["capacity"] + change
+        assert capacity >= 0, f"Hospital {hospital} cannot have a negative capacity"
+
+        self.hospitals[hospital] = dict(self.hospitals[hospital], capacity=capacity)
+
+        if change > 0:
+            for _ in range(change):
+                self._fill_vacancy(hospital)
+            self._eliminate_rotations(self._changed_hospitals() | {hospital})
+        else:
+            while len(self.M[hospital]["assigned"]) > capacity:
+                r_worst = self._get_worst_existing_resident(hospital)
+                self._break_assignment(r_worst, hospital)
+            self._update_worst_rank(hospital)
+            self._while_loop()
+            self.moved.clear()
+
+    def resolve(self, delta: dict) -> dict:
+        """
+        Apply a change to the instance and bring the stable matching up to date.
+
+        :param delta: dict, any of "withdrawn", a list of residents to remove, "preferences", a dict of residents to their new preference lists, and "capacities", a dict of hospitals to their change in capacity, applied in that order. Names are as in the stable matching, e.g. "r1" and "h1".
+        :return: dict, each resident whose hospital changed, to a tuple of their old and new hospital, "" if none
+        """
+        for resident in delta.get("withdrawn", ()):
+            self.withdraw_resident(resident)
+        for resident, preferences in delta.get("preferences", {}).items():
+            self.edit_preferences(resident, preferences)
+        for hospital, change in delta.get("capacities", {}).items():
+            self.change_capacity(hospital, change)
+
+        resident_sided = self.stable_matching["resident_sided"]
+        hospital_sided = self.stable_matching["hospital_sided"]
+        diff = {}
+        for resident in self.touched:
+            old = resident_sided.get(resident, "")
+            new = self.M[resident]["assigned"] or ""
+            if resident in self.withdrawn:
+                resident_sided.pop(resident, None)
+            else:
+                resident_sided[resident] = new
+            if old == new:
+                continue
+
+            diff[resident] = (old, new)
+            if old:
+                hospital_sided[old].remove(resident)
+            if new:
+                hospital_sided[new].add(resident)
+
+        self.touched.clear()
+        return diff
+
+    def run(self) -> None:
+        result = super().run()
+        self.touched.clear()
+        self.moved.clear()
+        return result
@@ -2,9 +2,10 @@
 Class to read in a dictionary of preferences for the Hospital/Residents Problem stable matching algorithm.
 """
 
+from itertools import islice
 from re import findall
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     CapacityError,
     IDMisformatError,
@@ -25,16 +26,11 @@ class FileReader(AbstractReader):
     def regex_split(self, line):
         return findall(r"\d+|[\(\)]", line)
 
-    def _scan_preference_tokens(self, token_list, side):
+    def _scan_preference_tokens(self, token_list, side, pref_names):
         preferences = []
         in_tie = False
         cur_set = set()
 
-        if side == "resident":
-            pref_char = "h"
-        else:
-            pref_char = "r"
-
         for token in token_list:
             if token == "(":
                 if in_tie:
@@ -44,13 +40,12 @@ class FileReader(AbstractReader):
                 if not in_tie:
                     raise UnopenedTieError(side, self.cur_line)
                 in_tie = False
-                preferences.append(cur_set.copy())
-                cur_set.clear()
+                preferences.append(cur_set)
+                cur_set = set()
+            elif in_tie:
+                cur_set.add(pref_names[token])
             else:
-                cur_set.add(pref_char + token)
-                if not in_tie:
-                    preferences.append(cur_set.copy())
-                    cur_set.clear()
+                preferences.append({pref_names[token]})
         if in_tie:
             raise UnclosedTieError(side, self.cur_line)
         return preferences
@@ -62,48 +57,52 @@ class FileReader(AbstractReader):
         self.hospitals = {}
         self.cur_line = 1
 
+        resident_names = NameTable("r")
+        hospital_names = NameTable("h")
+
+        # the file is streamed a line at a time, so it is never held in memory whole
         with open(self.data, "r") as file:
-            file = file.read().splitlines()
-
-        try:
-            self.no_residents, self.no_hospitals = map(int, file[0].split())
-        except ValueError:
-            raise ParticipantQuantityError()
-
-        # build resident dictionary
-        for elt in file[1 : self.no_residents + 1]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("resident", self.cur_line, line=True)
-            resident = f"r{entry[0]}"
-            if resident in self.residents:
-                raise RepeatIDError("resident", self.cur_line, line=True)
-
-            preferences = self._scan_preference_tokens(entry[1:], "resident")
-            self.residents[resident] = {"list": preferences, "rank": {}}
-
-        # build hospital dictionary
-        for elt in file[
-            self.no_residents + 1 : self.no_residents + self.no_hospitals + 1
-        ]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("hospital", self.cur_line, line=True)
-            hospital = f"h{entry[0]}"
-            if hospital in self.hospitals:
-                raise RepeatIDError("hospital", self.cur_line, line=True)
-
-            if not entry[1].isdigit():
-                raise CapacityError("hospital", self.cur_line, line=True)
-            capacity = int(entry[1])
-
-            preferences = self._scan_preference_tokens(entry[2:], "hospital")
-            self.hospitals[hospital] = {
-                "capacity": capacity,
-                "list": preferences,
-                "rank": {},
-            }
+            try:
+                self.no_residents, self.no_hospitals = map(int, file.readline().split())
+            except ValueError:
+                raise ParticipantQuantityError()
+
+            # build resident dictionary
+            for elt in islice(file, self.no_residents):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("resident", self.cur_line, line=True)
+                resident = resident_names[entry[0]]
+                if resident in self.residents:
+                    raise RepeatIDError("resident", self.cur_line, line=True)
+
+                preferences = self._scan_preference_tokens(
+                    entry[1:], "resident", hospital_names
+                )
+                self.residents[resident] = {"list": preferences, "rank": {}}
+
+            # build hospital dictionary
+            for elt in islice(file, self.no_hospitals):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("hospital", self.cur_line, line=True)
+                hospital = hospital_names[entry[0]]
+                if hospital in self.hospitals:
+                    raise RepeatIDError("hospital", self.cur_line, line=True)
+
+                if not entry[1].isdigit():
+                    raise CapacityError("hospital", self.cur_line, line=True)
+                capacity = int(entry[1])
+
+                preferences = self._scan_preference_tokens(
+                    entry[2:], "hospital", resident_names
+                )
+                self.hospitals[hospital] = {
+                    "capacity": capacity,
+                    "list": preferences,
+                    "rank": {},
+                }
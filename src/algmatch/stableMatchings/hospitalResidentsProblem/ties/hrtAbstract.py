@@ -2,9 +2,10 @@
 Hospital Residents Problem With Ties - Abstract class
 """
 
-from copy import deepcopy
 import os
 
+from algmatch.abstractClasses.tiedPreferenceList import TiedPreferenceList
+from algmatch.stabilityCheckers.hrStabilityChecker import HRStabilityChecker
 from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtPreferenceInstance import (
     HRTPreferenceInstance,
 )
@@ -36,9 +37,8 @@ class HRTAbstract:
 
         self.residents = self._reader.residents
         self.hospitals = self._reader.hospitals
-
-        self.original_residents = deepcopy(self.residents)
-        self.original_hospitals = deepcopy(self.hospitals)
+        for prefs in (*self.residents.values(), *self.hospitals.values()):
+            prefs["list"] = TiedPreferenceList(prefs["list"], prefs["rank"])
 
         self.M = {}  # provisional matching
         self.stable_matching = {
@@ -66,77 +66,20 @@ class HRTAbstract:
 
         return min(existing_residents, key=rank_comparator)
 
+    def _is_stable(self, stability_type) -> bool:
+        # solvers only delete from the lists, so the ranks are still the originals
+        checker = HRStabilityChecker(
+            stability_type=stability_type, instance=self._reader
+        )
+        return checker.is_stable(
+            {resident: self.M[resident]["assigned"] for resident in self.residents}
+        )
+
     def _check_super_stability(self) -> bool:
-        # stability must be checked with regards to the original lists prior to deletions
-        for resident, r_prefs in self.original_residents.items():
-            matched_hospital = self.M[resident]["assigned"]
-
-            preferred_hospitals = r_prefs["list"]
-            if matched_hospital is not None:
-                rank_worst_matched_hospital = r_prefs["rank"][matched_hospital]
-                # every hospital that r_i prefers to their match or is indifferent between them
-                preferred_hospitals = r_prefs["list"][: rank_worst_matched_hospital + 1]
-
-            for h_tie in preferred_hospitals:
-                for hospital in h_tie:
-                    if hospital == matched_hospital:
-                        continue
-
-                    if (
-                        len(self.M[hospital]["assigned"])
-                        < self.hospitals[hospital]["capacity"]
-                    ):
-                        return False
-
-                    worst_resident = self._get_worst_existing_resident(hospital)
-                    h_prefs = self.original_hospitals[hospital]
-                    rank_worst = h_prefs["rank"][worst_resident]
-                    rank_resident = h_prefs["rank"][resident]
-                    if rank_resident <= rank_worst:
-                        return False
-        return True
+        return self._is_stable("super")
 
     def _check_strong_stability(self) -> bool:
-        # stability must be checked with regards to the original lists prior to deletions
-        for resident, r_prefs in self.original_residents.items():
-            matched_hospital = self.M[resident]["assigned"]
-
-            preferred_hospitals = r_prefs["list"]
-            if matched_hospital is not None:
-                rank_worst_matched_hospital = r_prefs["rank"][matched_hospital]
-                preferred_hospitals = r_prefs["list"][:rank_worst_matched_hospital]
-                indifferent_hospitals = r_prefs["list"][rank_worst_matched_hospital + 1]
-
-            for h_tie in preferred_hospitals:
-                for hospital in h_tie:
-                    if (
-                        len(self.M[hospital]["assigned"])
-                        < self.hospitals[hospital]["capacity"]
-                    ):
-                        return False
-
-                    worst_resident = self._get_worst_existing_resident(hospital)
-                    h_prefs = self.original_hospitals[hospital]
-                    rank_worst = h_prefs["rank"][worst_resident]
-                    rank_resident = h_prefs["rank"][resident]
-                    if rank_resident <= rank_worst:
-                        return False
-
-            for hospital in indifferent_hospitals:
-                if (
-                    len(self.M[hospital]["assigned"])
-                    < self.hospitals[hospital]["capacity"]
-                ):
-                    return False
-
-                worst_resident = self._get_worst_existing_resident(hospital)
-                h_prefs = self.original_hospitals[hospital]
-                rank_worst = h_prefs["rank"][worst_resident]
-                rank_resident = h_prefs["rank"][resident]
-                if rank_resident < rank_worst:
-                    return False
-
-        return True
+        return self._is_stable("strong")
 
     def _get_pref_list(self, participant) -> list:
         if participant in self.residents:
@@ -155,29 +98,13 @@ class HRTAbstract:
             raise ValueError(f"{participant} is not a resident or a hospital")
 
     def _get_pref_length(self, person) -> int:
-        pref_list = self._get_pref_list(person)
-        total = sum([len(tie) for tie in pref_list])
-        return total
+        return self._get_pref_list(person).size
 
     def _get_head(self, person) -> set:
-        pref_list = self._get_pref_list(person)
-        idx = 0
-        while idx < len(pref_list):
-            head = pref_list[idx]
-            if len(head) > 0:
-                return head
-            idx += 1
-        raise ValueError("Pref_list empty")
+        return self._get_pref_list(person).head
 
     def _get_tail(self, person) -> set:
-        pref_list = self._get_pref_list(person)
-        idx = len(pref_list) - 1
-        while idx >= 0:
-            tail = pref_list[idx]
-            if len(tail) > 0:
-                return tail
-            idx -= 1
-        raise ValueError("Pref_list empty")
+        return self._get_pref_list(person).tail
 
     def _assign(self, resident, hospital) -> None:
         self.M[resident]["assigned"].add(hospital)
@@ -191,16 +118,15 @@ class HRTAbstract:
         # allow either order of args
         if resident in self.hospitals:
             resident, hospital = hospital, resident
-        # TO-DO: speed this up iusing ranks
-        for tie in self.residents[resident]["list"]:
-            tie.discard(hospital)
-        for tie in self.hospitals[hospital]["list"]:
-            tie.discard(resident)
+        self.residents[resident]["list"].discard(hospital)
+        self.hospitals[hospital]["list"].discard(resident)
 
     def _delete_tail(self, person) -> None:
-        tail = self._get_tail(person)
+        pref_list = self._get_pref_list(person)
+        tail = pref_list.tail
+        tail_idx = pref_list.tail_idx
         while len(tail) != 0:
-            deletion = tail.pop()
+            deletion = pref_list.pop_from(tail_idx)
             self._break_assignment(person, deletion)
             self._delete_pair(person, deletion)
 
@@ -211,10 +137,10 @@ class HRTAbstract:
             self._break_assignment(person, assignee)
 
     def _reject_lower_ranks(self, target, proposer) -> None:
-        rank_p = self._get_pref_ranks(target)[proposer]
-        for reject_tie in self._get_pref_list(target)[rank_p + 1 :]:
-            while len(reject_tie) != 0:
-                reject = reject_tie.pop()
+        pref_list = self._get_pref_list(target)
+        for idx in pref_list.ties_after(pref_list.rank[proposer]):
+            while pref_list[idx]:
+                reject = pref_list.pop_from(idx)
                 self._break_assignment(target, reject)
                 self._delete_pair(target, reject)
 
@@ -2,8 +2,6 @@
 Store preference lists for Hospital Residents stable matching algorithm.
 """
 
-from itertools import product
-
 from algmatch.abstractClasses.abstractPreferenceInstanceWithTies import (
     AbstractPreferenceInstanceWithTies,
 )
@@ -53,30 +51,7 @@ class HRTPreferenceInstance(AbstractPreferenceInstanceWithTies):
                         raise PrefNotFoundError("hospital", h, r)
 
     def clean_unacceptable_pairs(self) -> None:
-        for r, h in product(self.residents, self.hospitals):
-            r_list = self.residents[r]["list"]
-            h_list = self.hospitals[h]["list"]
-
-            r_found = any([r in tie for tie in h_list])
-            h_found = any([h in tie for tie in r_list])
-
-            if not (r_found and h_found):
-                for tie in r_list:
-                    try:
-                        tie.remove(h)
-                    except KeyError:
-                        pass
-                for tie in h_list:
-                    try:
-                        tie.remove(r)
-                    except KeyError:
-                        pass
-                # clean empty sets
-                # we've produced at most one per side in this loop
-                if set() in r_list:
-                    r_list.remove(set())
-                if set() in h_list:
-                    h_list.remove(set())
+        super().clean_unacceptable_pairs(self.residents, self.hospitals)
 
     def set_up_rankings(self):
         for r in self.residents:
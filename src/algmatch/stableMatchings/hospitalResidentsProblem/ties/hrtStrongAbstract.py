@@ -1,16 +1,19 @@
 """
 Hospital/Residents Problem With Ties - Strong-Stability-Specific Abstract Class
 Stores implementations of:
-- Gabow's algorithm for maximum matching
+- The reduced assignment graph of the provisional assignments
+- Hopcroft-Karp, with hospital capacities, for its maximum matching
 - Finding the critical set of residents based on the above
 """
 
-from collections import deque
+from array import array
 
 from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtAbstract import (
     HRTAbstract,
 )
 
+UNMATCHED = -1
+
 
 class HRTStrongAbstract(HRTAbstract):
     def __init__(
@@ -19,23 +22,248 @@ class HRTStrongAbstract(HRTAbstract):
         super().__init__(
             filename=filename, dictionary=dictionary, stability_type="strong"
         )
-        # used to find the critical set and final answer
+        # used to find the final answer
         self.maximum_matching = {}
-        self.dist = {}
+
+        # residents and hospitals are numbered, so that the maximum matching and
+        # the alternating paths from it can be kept in int arrays between rounds
+        self._resident_names = list(self.residents)
+        self._hospital_names = list(self.hospitals)
+        self._resident_index = {r: i for i, r in enumerate(self._resident_names)}
+        self._hospital_index = {h: j for j, h in enumerate(self._hospital_names)}
+
+        # the reduced assignment graph, where residents bound to a hospital are
+        # removed, and take one place each from the hospitals they are bound to
+        self._adjacency = [[] for _ in self._resident_names]
+        self._quota = array("i", [0]) * len(self._hospital_names)
+
+        self._mate_of_resident = array("i", [UNMATCHED]) * len(self._resident_names)
+        self._matched = [set() for _ in self._hospital_names]
+        self._dist = array("i", [0]) * len(self._resident_names)
+        # participants whose assignments or lists changed since the graph was formed
+        self._touched_residents = set()
+        self._touched_hospitals = set()
 
     def _reset_maximum_matching(self):
         self.maximum_matching = {
             "resident": {r: None for r in self.residents},
             "hospital": {h: set() for h in self.hospitals},
         }
-        self.dist = {}
+
+    def _touch(self, resident, hospital):
+        # either argument may be the resident, as the deletions allow both orders
+        if resident in self.hospitals:
+            resident, hospital = hospital, resident
+        self._touched_residents.add(resident)
+        self._touched_hospitals.add(hospital)
+
+    def _assign(self, resident, hospital) -> None:
+        super()._assign(resident, hospital)
+        self._touch(resident, hospital)
+
+    def _break_assignment(self, resident, hospital) -> None:
+        super()._break_assignment(resident, hospital)
+        self._touch(resident, hospital)
+
+    def _delete_pair(self, resident, hospital) -> None:
+        super()._delete_pair(resident, hospital)
+        self._touch(resident, hospital)
+
+    def _is_bound(self, resident, hospital) -> bool:
+        # a resident is bound to a hospital that is not over-subscribed, or that
+        # prefers them to the residents in the tail of its list
+        h_prefs = self.hospitals[hospital]
+        if len(self.M[hospital]["assigned"]) <= h_prefs["capacity"]:
+            return True
+        return h_prefs["rank"][resident] < h_prefs["list"].tail_idx
+
+    def _unmatch(self, i):
+        j = self._mate_of_resident[i]
+        if j != UNMATCHED:
+            self._mate_of_resident[i] = UNMATCHED
+            self._matched[j].discard(i)
+
+    def _form_G_r(self):
+        """
+        Updates the reduced assignment graph for the residents and hospitals touched
+        since it was last formed, unmatching residents whose edge to their mate has
+        gone, so the previous maximum matching is left to augment from.
+        """
+        affected = self._touched_residents
+        for hospital in self._touched_hospitals:
+            j = self._hospital_index[hospital]
+            assigned = self.M[hospital]["assigned"]
+            affected.update(assigned)
+
+            bound = sum(1 for r in assigned if self._is_bound(r, hospital))
+            self._quota[j] = self.hospitals[hospital]["capacity"] - bound
+
+        hospital_index = self._hospital_index
+        for resident in affected:
+            i = self._resident_index[resident]
+            assigned = self.M[resident]["assigned"]
+            if any(self._is_bound(resident, h) for h in assigned):
+                self._adjacency[i] = []
+            else:
+                self._adjacency[i] = [hospital_index[h] for h in assigned]
+
+            if self._mate_of_resident[i] not in self._adjacency[i]:
+                self._unmatch(i)
+
+        for hospital in self._touched_hospitals:
+            j = self._hospital_index[hospital]
+            while len(self._matched[j]) > max(self._quota[j], 0):
+                self._unmatch(next(iter(self._matched[j])))
+
+        self._touched_residents = set()
+        self._touched_hospitals.clear()
+
+    def _BFS(self):
+        """
+        Layers the residents of the reduced assignment graph by the length of the
+        shortest alternating path reaching them from a free resident.
+
+        :return: whether any augmenting path exists
+        """
+        adjacency = self._adjacency
+        mate_of_resident = self._mate_of_resident
+        matched = self._matched
+        quota = self._quota
+        dist = self._dist
+        # further than any resident can be from a free one
+        unreached = len(adjacency) + 1
+
+        queue = []
+        for i in range(len(adjacency)):
+            if adjacency[i] and mate_of_resident[i] == UNMATCHED:
+                dist[i] = 0
+                queue.append(i)
+            else:
+                dist[i] = unreached
+
+        # residents beyond the layer where a hospital with room is first reached are
+        # not needed, unless there is none, when every reachable resident is layered
+        shortest = unreached
+        for i in queue:
+            if dist[i] >= shortest:
+                break
+            for j in adjacency[i]:
+                if len(matched[j]) < quota[j]:
+                    shortest = dist[i] + 1
+                    continue
+                for partner in matched[j]:
+                    if dist[partner] == unreached:
+                        dist[partner] = dist[i] + 1
+                        queue.append(partner)
+
+        return shortest != unreached
+
+    def _DFS(self, root, cursor):
+        """
+        Searches for an augmenting path from a free resident along the BFS layers,
+        with an explicit stack, so long paths cannot exceed the recursion limit.
+
+        :return: whether the matching was augmented
+        """
+        adjacency = self._adjacency
+        mate_of_resident = self._mate_of_resident
+        matched = self._matched
+        quota = self._quota
+        dist = self._dist
+        unreached = len(adjacency) + 1
+
+        stack = [root]
+        while stack:
+            i = stack[-1]
+            neighbours = adjacency[i]
+            if cursor[i] == len(neighbours):
+                # dead end, so no later search needs to visit this resident again
+                dist[i] = unreached
+                stack.pop()
+                continue
+
+            j = neighbours[cursor[i]]
+            if len(matched[j]) < quota[j]:
+                # each resident on the stack moves to the hospital they reached
+                for p in stack:
+                    h = adjacency[p][cursor[p]]
+                    old = mate_of_resident[p]
+                    if old != UNMATCHED:
+                        matched[old].discard(p)
+                    mate_of_resident[p] = h
+                    matched[h].add(p)
+                return True
+
+            # a full hospital is only passed once every partner of it on the next
+            # layer is a dead end, which are unreached by then, so are not retried
+            for partner in matched[j]:
+                if dist[partner] == dist[i] + 1:
+                    stack.append(partner)
+                    break
+            else:
+                cursor[i] += 1
+
+        return False
 
     def _get_maximum_matching(self):
-        raise NotImplementedError()
+        """
+        An implementation of Hopcroft-Karp, where each hospital takes up to its
+        quota, warm-started from the previous maximum matching, so only the
+        assignments made or broken since need augmenting.
+        """
+        self._form_G_r()
+        while self._BFS():
+            cursor = array("i", [0]) * len(self._adjacency)
+            for i in range(len(self._adjacency)):
+                if self._adjacency[i] and self._mate_of_resident[i] == UNMATCHED:
+                    self._DFS(i, cursor)
+
+    def _get_critical_set(self):
+        """
+        The critical set is every resident reachable by an alternating path from a
+        resident left free by the maximum matching. Once no augmenting path remains,
+        the last BFS of Hopcroft-Karp has layered exactly these, so they are read
+        off its layers rather than found by exploring the graph again.
+        """
+        self._get_maximum_matching()
+        unreached = len(self._adjacency) + 1
+        return {
+            self._resident_names[i] for i, d in enumerate(self._dist) if d != unreached
+        }
+
+    def _neighbourhood(self, residents) -> set:
+        """
+        :return: the hospitals adjacent to the given residents in the reduced
+            assignment graph
+        """
+        return {
+            self._hospital_names[j]
+            for r in residents
+            for j in self._adjacency[self._resident_index[r]]
+        }
 
     def _select_maximum_matching(self):
+        """
+        Chooses a feasible matching from the provisional assignments, where each
+        bound resident keeps a hospital they are bound to, and the rest are placed
+        by the maximum matching of the reduced assignment graph.
+        """
         self._get_maximum_matching()
-        for m, w in self.maximum_matching["men"].items():
-            self.M[m]["assigned"] = w
-        for w, m in self.maximum_matching["women"].items():
-            self.M[w]["assigned"] = m
+        self._reset_maximum_matching()
+
+        for i, resident in enumerate(self._resident_names):
+            assigned = self.M[resident]["assigned"]
+            bound = [h for h in assigned if self._is_bound(resident, h)]
+            if bound:
+                hospital = min(bound, key=self.residents[resident]["rank"].get)
+            elif self._mate_of_resident[i] != UNMATCHED:
+                hospital = self._hospital_names[self._mate_of_resident[i]]
+            else:
+                continue
+            self.maximum_matching["resident"][resident] = hospital
+            self.maximum_matching["hospital"][hospital].add(resident)
+
+        for resident, hospital in self.maximum_matching["resident"].items():
+            self.M[resident]["assigned"] = hospital
+        for hospital, residents in self.maximum_matching["hospital"].items():
+            self.M[hospital]["assigned"] = residents
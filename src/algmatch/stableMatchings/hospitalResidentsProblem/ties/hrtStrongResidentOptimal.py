@@ -1,7 +1,9 @@
 """
-Algorithm to produce M_0, the resident-optimal, hospital-pessimal super-stable matching, where such a thing exists.
+Algorithm to produce M_0, the resident-optimal, hospital-pessimal strongly stable matching, where such a thing exists.
 """
 
+import heapq
+
 from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtStrongAbstract import (
     HRTStrongAbstract,
 )
@@ -35,14 +37,18 @@ class HRTStrongResidentOptimal(HRTStrongAbstract):
         super()._break_assignment(resident, hospital)
         if resident in self.hospitals:
             resident, hospital = hospital, resident
-        if self._get_pref_length(resident) > 0:
+        # a resident only applies again once every provisional assignment is broken
+        if self._get_pref_length(resident) > 0 and not self.M[resident]["assigned"]:
             self.unassigned_residents.add(resident)
 
-    def _form_G_r(self):
-        raise NotImplementedError()
-
-    def _get_critical_set(self):
-        raise NotImplementedError()
+    def _reject_dominated(self, hospital):
+        # residents are dominated once the hospital holds capacity residents it
+        # strictly prefers to them, so every tie after that of its capacity-th best
+        capacity = self.hospitals[hospital]["capacity"]
+        rank = self.hospitals[hospital]["rank"]
+        assigned = self.M[hospital]["assigned"]
+        r_last = heapq.nsmallest(capacity, assigned, key=rank.__getitem__)[-1]
+        self._reject_lower_ranks(hospital, r_last)
 
     def _while_loop(self) -> bool:
         Z = {None}
@@ -56,18 +62,16 @@ class HRTStrongResidentOptimal(HRTStrongAbstract):
                     capacity = self.hospitals[h]["capacity"]
                     occupancy = len(self.M[h]["assigned"])
                     if occupancy >= capacity:
-                        raise NotImplementedError("dominations")
+                        self.been_full[h] = True
+                        self._reject_dominated(h)
 
-            self._form_G_r()
             Z = self._get_critical_set()
             for h in self._neighbourhood(Z):
                 self._delete_tail(h)
 
-        # Check Viability of Matching
-        for r in self.residents:
-            if len(self.M[r]["assigned"]) > 1:
-                return False
+        self._select_maximum_matching()
 
+        # check viability of matching
         for h in self.hospitals:
             capacity = self.hospitals[h]["capacity"]
             occupancy = len(self.M[h]["assigned"])
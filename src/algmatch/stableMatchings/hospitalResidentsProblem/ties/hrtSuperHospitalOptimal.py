@@ -53,7 +53,7 @@ class HRTSuperHospitalOptimal(HRTAbstract):
     def _get_next_residents(self, h):
         pref_list = self._get_pref_list(h)
         current_residents = self.M[h]["assigned"]
-        idx = 0
+        idx = pref_list.head_idx
         while idx < len(pref_list):
             head = pref_list[idx]
             remaining_head = head - current_residents
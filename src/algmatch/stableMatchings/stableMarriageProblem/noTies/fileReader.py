@@ -2,7 +2,9 @@
 Class to read in a file of preferences for the Stable Marriage Problem stable matching algorithm.
 """
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from itertools import islice
+
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     ParticipantQuantityError,
     IDMisformatError,
@@ -23,46 +25,48 @@ class FileReader(AbstractReader):
         self.women = {}
         cur_line = 1
 
-        with open(self.data, "r") as file:
-            file = file.read().splitlines()
+        man_names = NameTable("m")
+        woman_names = NameTable("w")
 
-        try:
-            self.no_men, self.no_women = map(int, file[0].split())
-        except (ValueError, IndexError):
-            raise ParticipantQuantityError()
+        # the file is streamed a line at a time, so it is never held in memory whole
+        with open(self.data, "r") as file:
+            try:
+                self.no_men, self.no_women = map(int, file.readline().split())
+            except ValueError:
+                raise ParticipantQuantityError()
 
-        # build men dictionary
-        for elt in file[1 : self.no_men + 1]:
-            cur_line += 1
-            entry = elt.split()
+            # build men dictionary
+            for elt in islice(file, self.no_men):
+                cur_line += 1
+                entry = elt.split()
 
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("man", cur_line, line=True)
-            man = f"m{entry[0]}"
-            if man in self.men:
-                raise RepeatIDError("man", cur_line, line=True)
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("man", cur_line, line=True)
+                man = man_names[entry[0]]
+                if man in self.men:
+                    raise RepeatIDError("man", cur_line, line=True)
 
-            for i in entry[1:]:
-                if not i.isdigit():
-                    raise PrefListMisformatError("man", cur_line, i, line=True)
-            preferences = [f"w{i}" for i in entry[1:]]
+                for i in entry[1:]:
+                    if not i.isdigit():
+                        raise PrefListMisformatError("man", cur_line, i, line=True)
+                preferences = [woman_names[i] for i in entry[1:]]
 
-            self.men[man] = {"list": preferences, "rank": {}}
+                self.men[man] = {"list": preferences, "rank": {}}
 
-        # build women dictionary
-        for elt in file[self.no_men + 1 : self.no_men + self.no_women + 1]:
-            cur_line += 1
-            entry = elt.split()
+            # build women dictionary
+            for elt in islice(file, self.no_women):
+                cur_line += 1
+                entry = elt.split()
 
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("woman", cur_line, line=True)
-            woman = f"w{entry[0]}"
-            if woman in self.women:
-                raise RepeatIDError("woman", cur_line, line=True)
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("woman", cur_line, line=True)
+                woman = woman_names[entry[0]]
+                if woman in self.women:
+                    raise RepeatIDError("woman", cur_line, line=True)
 
-            for i in entry[1:]:
-                if not i.isdigit():
-                    raise PrefListMisformatError("woman", cur_line, i, line=True)
-            preferences = [f"m{i}" for i in entry[1:]]
+                for i in entry[1:]:
+                    if not i.isdigit():
+                        raise PrefListMisformatError("woman", cur_line, i, line=True)
+                preferences = [man_names[i] for i in entry[1:]]
 
-            self.women[woman] = {"list": preferences, "rank": {}}
+                self.women[woman] = {"list": preferences, "rank": {}}
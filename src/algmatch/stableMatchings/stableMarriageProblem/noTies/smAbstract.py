@@ -2,9 +2,9 @@
 Stable Marriage Problem - Abstract class
 """
 
-from copy import deepcopy
 import os
 
+from algmatch.stabilityCheckers.smStabilityChecker import SMStabilityChecker
 from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
     SMPreferenceInstance,
 )
@@ -12,13 +12,17 @@ from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance
 
 class SMAbstract:
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | None = None,
     ) -> None:
-        assert filename is not None or dictionary is not None, (
-            "Either filename or dictionary must be provided"
+        sources = (filename, dictionary, instance)
+        assert any(source is not None for source in sources), (
+            "Either filename, dictionary or instance must be provided"
         )
-        assert not (filename is not None and dictionary is not None), (
-            "Only one of filename or dictionary must be provided"
+        assert sum(source is not None for source in sources) == 1, (
+            "Only one of filename, dictionary or instance must be provided"
         )
 
         if filename is not None:
@@ -28,12 +32,16 @@ class SMAbstract:
         if dictionary is not None:
             self._reader = SMPreferenceInstance(dictionary=dictionary)
 
+        if instance is not None:
+            assert isinstance(instance, SMPreferenceInstance), (
+                "Instance must be of type SMPreferenceInstance"
+            )
+            # compiled instances may be shared, so solvers must never modify them
+            self._reader = instance
+
         self.men = self._reader.men
         self.women = self._reader.women
 
-        self.original_men = deepcopy(self.men)
-        self.original_women = deepcopy(self.women)
-
         self.M = {}  # provisional matching
         self.stable_matching = {
             "man_sided": {m: "" for m in self.men},
@@ -42,27 +50,9 @@ class SMAbstract:
         self.is_stable = False
 
     def _check_stability(self):
-        # stability must be checked with regards to the original lists prior to deletions
-        for man, m_prefs in self.original_men.items():
-            preferred_women = m_prefs["list"]
-            if self.M[man]["assigned"] is not None:
-                matched_woman = self.M[man]["assigned"]
-                rank_matched_woman = m_prefs["rank"][matched_woman]
-                # every woman that m_i prefers to his matched partner
-                preferred_women = m_prefs["list"][:rank_matched_woman]
-
-            for woman in preferred_women:
-                existing_fiance = self.M[woman]["assigned"]
-                if existing_fiance is None:
-                    return False
-                else:
-                    w_ranks = self.original_women[woman]["rank"]
-                    rank_fiance = w_ranks[existing_fiance]
-                    rank_man = w_ranks[man]
-                    if rank_man < rank_fiance:
-                        return False
-
-        return True
+        # the solvers never modify the preference lists, so these are the originals
+        checker = SMStabilityChecker(instance=self._reader)
+        return checker.is_stable({man: self.M[man]["assigned"] for man in self.men})
 
     def _while_loop(self):
         raise NotImplementedError("Method _while_loop must be implemented in subclass")
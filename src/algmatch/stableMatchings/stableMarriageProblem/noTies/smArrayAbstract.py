@@ -0,0 +1,168 @@
+"""
+Stable Marriage Problem - Abstract class for the array-backed engine
+
+Participant names are interned to contiguous integers once, after the preference
+instance has been validated and cleaned. Preference lists are then stored as flat
+integer buffers with per-participant offsets, and each entry of the proposing side
+carries the rank that the receiving side gives it, so no deletions are ever made.
+"""
+
+from array import array
+import os
+
+from algmatch.abstractClasses.abstractArrayEngine import AbstractArrayEngine
+from algmatch.binaryInstances.binaryLayouts import is_binary_instance
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
+
+
+class SMArrayAbstract(AbstractArrayEngine):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | BinaryPreferenceInstance | None = None,
+    ) -> None:
+        sources = (filename, dictionary, instance)
+        assert any(source is not None for source in sources), (
+            "Either filename, dictionary or instance must be provided"
+        )
+        assert sum(source is not None for source in sources) == 1, (
+            "Only one of filename, dictionary or instance must be provided"
+        )
+
+        if filename is not None:
+            assert os.path.isfile(filename), f"File {filename} does not exist"
+            if is_binary_instance(filename):
+                # the lists are read straight from the mapped file, without a copy
+                self._reader = BinaryPreferenceInstance(filename)
+            else:
+                self._reader = SMPreferenceInstance(filename=filename)
+
+        if dictionary is not None:
+            self._reader = SMPreferenceInstance(dictionary=dictionary)
+
+        if instance is not None:
+            assert isinstance(
+                instance, (SMPreferenceInstance, BinaryPreferenceInstance)
+            ), (
+                "Instance must be of type SMPreferenceInstance or BinaryPreferenceInstance"
+            )
+            # compiled instances may be shared, so solvers must never modify them
+            self._reader = instance
+
+        if isinstance(self._reader, BinaryPreferenceInstance):
+            assert self._reader.kind == "SM", "Binary instance must be of kind SM"
+
+        self.man_names = self.get_names("men")
+        self.woman_names = self.get_names("women")
+
+        self.stable_matching = {
+            "man_sided": {m: "" for m in self.man_names},
+            "woman_sided": {w: "" for w in self.woman_names},
+        }
+        self.is_stable = False
+
+    def _set_up_proposers(self, proposers, proposer_names, receivers, receiver_names):
+        """
+        :param proposers: group that proposes, e.g. "men"
+        :param proposer_names: names of the proposers, in index order
+        :param receivers: group that receives proposals, e.g. "women"
+        :param receiver_names: names of the receivers, in index order
+        """
+        self._no_proposers = len(proposer_names)
+        self._no_receivers = len(receiver_names)
+        self._offsets, self._targets, self._target_ranks = self.get_lists(
+            proposers, proposer_names, receivers, receiver_names
+        )
+
+        # position in targets of each proposer's current partner, -1 if free
+        self._position = array("i", [-1]) * self._no_proposers
+        # proposer held by each receiver, and the rank they hold them at
+        self._held_by = array("i", [-1]) * self._no_receivers
+        self._held_rank = array("i", [self._no_proposers]) * self._no_receivers
+
+        # each proposer only ever moves forward along their list, and both are kept
+        # between runs, so solving again resumes where the last run finished
+        self._cursor = array("i", self._offsets[:-1])
+        self._free = [
+            p
+            for p in range(self._no_proposers)
+            if self._offsets[p] < self._offsets[p + 1]
+        ]
+
+    def _deferred_acceptance(self):
+        offsets = self._offsets
+        targets = self._targets
+        target_ranks = self._target_ranks
+        position = self._position
+        held_by = self._held_by
+        held_rank = self._held_rank
+        cursor = self._cursor
+        free = self._free
+
+        while free:
+            p = free.pop()
+            idx = cursor[p]
+            end = offsets[p + 1]
+
+            while idx < end:
+                r = targets[idx]
+                rank_p = target_ranks[idx]
+                idx += 1
+
+                if rank_p < held_rank[r]:
+                    rejected = held_by[r]
+                    if rejected != -1:
+                        position[rejected] = -1
+                        if cursor[rejected] < offsets[rejected + 1]:
+                            free.append(rejected)
+
+                    held_by[r] = p
+                    held_rank[r] = rank_p
+                    position[p] = idx - 1
+                    break
+
+            cursor[p] = idx
+
+    def _check_stability(self) -> bool:
+        # a blocking pair needs a proposer who prefers a receiver to their partner,
+        # and that receiver either free or holding someone they rank lower
+        offsets = self._offsets
+        targets = self._targets
+        target_ranks = self._target_ranks
+        held_rank = self._held_rank
+
+        for p in range(self._no_proposers):
+            end = self._position[p]
+            if end == -1:
+                end = offsets[p + 1]
+
+            for idx in range(offsets[p], end):
+                if target_ranks[idx] < held_rank[targets[idx]]:
+                    return False
+
+        return True
+
+    def _while_loop(self):
+        raise NotImplementedError("Method _while_loop must be implemented in subclass")
+
+    def _save_matching(self):
+        raise NotImplementedError(
+            "Method _save_matching must be implemented in subclass"
+        )
+
+    def run(self) -> None:
+        self._while_loop()
+        self._save_matching()
+
+        self.is_stable = self._check_stability()
+
+        if self.is_stable:
+            return f"stable matching: {self.stable_matching}"
+        else:
+            return f"unstable matching: {self.stable_matching}"
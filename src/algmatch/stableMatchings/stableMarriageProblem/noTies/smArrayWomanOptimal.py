@@ -0,0 +1,36 @@
+"""
+Array-backed algorithm to produce M_z, the woman-optimal, man-pessimal stable matching.
+"""
+
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smArrayAbstract import (
+    SMArrayAbstract,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
+
+
+class SMArrayWomanOptimal(SMArrayAbstract):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | BinaryPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        self._set_up_proposers("women", self.woman_names, "men", self.man_names)
+
+    def _while_loop(self):
+        self._deferred_acceptance()
+
+    def _save_matching(self):
+        for w, woman in enumerate(self.woman_names):
+            idx = self._position[w]
+            if idx != -1:
+                man = self.man_names[self._targets[idx]]
+                self.stable_matching["man_sided"][man] = woman
+                self.stable_matching["woman_sided"][woman] = man
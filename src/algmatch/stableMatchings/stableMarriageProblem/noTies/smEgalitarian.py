@@ -0,0 +1,14 @@
+"""
+Algorithm to produce an egalitarian stable matching, where the sum of the ranks
+everyone gives their partner is least.
+"""
+
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smRotations import (
+    SMRotations,
+)
+
+
+class SMEgalitarian(SMRotations):
+    def _while_loop(self):
+        poset = self.get_rotation_poset()
+        self._set_matching(poset.matching_after(poset.egalitarian_rotations()))
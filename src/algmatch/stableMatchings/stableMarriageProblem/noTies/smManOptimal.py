@@ -3,29 +3,51 @@ Algorithm to produce M_0, the man-optimal, woman-pessimal stable matching.
 """
 
 from algmatch.stableMatchings.stableMarriageProblem.noTies.smAbstract import SMAbstract
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
 
 
 class SMManOptimal(SMAbstract):
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | None = None,
     ) -> None:
-        super().__init__(filename=filename, dictionary=dictionary)
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
 
         self.unassigned_men = set()
+        # position of each man's next proposal, so his list is never modified
+        self.proposal_idx = {}
 
         for man, prefs in self.men.items():
             if len(prefs["list"]) > 0:
                 self.unassigned_men.add(man)
+            self.proposal_idx[man] = 0
             self.M[man] = {"assigned": None}
 
         for woman in self.women:
             self.M[woman] = {"assigned": None}
 
-    def _delete_pair(self, man, woman):
-        self.men[man]["list"].remove(woman)
-        self.women[woman]["list"].remove(man)
-        if len(self.men[man]["list"]) == 0:
-            self.unassigned_men.discard(man)
+    def _is_deleted(self, man, woman):
+        # a woman implicitly deletes every man she ranks below her fiance
+        fiance = self.M[woman]["assigned"]
+        if fiance is None:
+            return False
+        w_ranks = self.women[woman]["rank"]
+        return w_ranks[man] > w_ranks[fiance]
+
+    def _get_head(self, man):
+        m_list = self.men[man]["list"]
+        idx = self.proposal_idx[man]
+        while idx < len(m_list) and self._is_deleted(man, m_list[idx]):
+            idx += 1
+        self.proposal_idx[man] = idx
+
+        if idx == len(m_list):
+            return None
+        return m_list[idx]
 
     def _engage(self, man, woman):
         self.M[man]["assigned"] = woman
@@ -33,19 +55,16 @@ class SMManOptimal(SMAbstract):
 
     def _free_up(self, man):
         self.M[man]["assigned"] = None
-        if len(self.men[man]["list"]) > 0:
-            self.unassigned_men.add(man)
+        self.unassigned_men.add(man)
 
     def _while_loop(self):
         while len(self.unassigned_men) != 0:
             m = self.unassigned_men.pop()
-            w = self.men[m]["list"][0]
-            p = self.M[w]["assigned"]
+            w = self._get_head(m)
+            if w is None:
+                continue
 
+            p = self.M[w]["assigned"]
             if p is not None:
                 self._free_up(p)
             self._engage(m, w)
-
-            rank_m = self.women[w]["rank"][m]
-            for reject in self.women[w]["list"][rank_m + 1 :]:
-                self._delete_pair(reject, w)
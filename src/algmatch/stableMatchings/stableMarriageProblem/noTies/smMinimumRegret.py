@@ -0,0 +1,14 @@
+"""
+Algorithm to produce a minimum regret stable matching, where the worst rank anyone
+gives their partner is least.
+"""
+
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smRotations import (
+    SMRotations,
+)
+
+
+class SMMinimumRegret(SMRotations):
+    def _while_loop(self):
+        poset = self.get_rotation_poset()
+        self._set_matching(poset.matching_after(poset.minimum_regret_rotations()))
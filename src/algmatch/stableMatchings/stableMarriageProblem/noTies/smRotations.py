@@ -0,0 +1,89 @@
+"""
+Rotations of a Stable Marriage instance, found from the man-optimal stable matching,
+from which every stable matching can be generated.
+"""
+
+from algmatch.abstractClasses.rotationPoset import UNMATCHED, RotationPoset
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smManOptimal import (
+    SMManOptimal,
+)
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
+
+
+class SMRotations(SMManOptimal):
+    def __init__(
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | None = None,
+    ) -> None:
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
+
+        self.man_names = list(self.men)
+        self.woman_names = list(self.women)
+        self.rotation_poset = None
+
+    def get_rotation_poset(self) -> RotationPoset:
+        """
+        Finds the man-optimal stable matching, if not yet found, and the rotations
+        from it, with men proposing and women receiving.
+
+        :return: RotationPoset, over the men and women in index order
+        """
+        if self.rotation_poset is None:
+            # once the man-optimal matching is found, this does nothing
+            super()._while_loop()
+
+            man_index = {m: i for i, m in enumerate(self.man_names)}
+            woman_index = {w: j for j, w in enumerate(self.woman_names)}
+            man_lists = [
+                [woman_index[w] for w in self.men[m]["list"]] for m in self.man_names
+            ]
+            woman_ranks = [
+                {man_index[m]: rank for m, rank in self.women[w]["rank"].items()}
+                for w in self.woman_names
+            ]
+            man_optimal = [
+                UNMATCHED
+                if self.M[m]["assigned"] is None
+                else woman_index[self.M[m]["assigned"]]
+                for m in self.man_names
+            ]
+            self.rotation_poset = RotationPoset(man_lists, woman_ranks, man_optimal)
+        return self.rotation_poset
+
+    def _set_matching(self, partner):
+        """
+        :param partner: the partner of each man in index order, or UNMATCHED, as
+            from the rotation poset
+        """
+        for woman in self.woman_names:
+            self.M[woman]["assigned"] = None
+        for i, j in enumerate(partner):
+            man = self.man_names[i]
+            if j == UNMATCHED:
+                self.M[man]["assigned"] = None
+            else:
+                woman = self.woman_names[j]
+                self.M[man]["assigned"] = woman
+                self.M[woman]["assigned"] = man
+
+    def all_stable_matchings(self):
+        """
+        :return: generator of every stable matching, in the same form as
+            stable_matching, starting from the man-optimal one
+        """
+        poset = self.get_rotation_poset()
+        for partner in poset.stable_matchings():
+            stable_matching = {
+                "man_sided": {m: "" for m in self.man_names},
+                "woman_sided": {w: "" for w in self.woman_names},
+            }
+            for i, j in enumerate(partner):
+                if j != UNMATCHED:
+                    man, woman = self.man_names[i], self.woman_names[j]
+                    stable_matching["man_sided"][man] = woman
+                    stable_matching["woman_sided"][woman] = man
+            yield stable_matching
@@ -3,15 +3,23 @@ Algorithm to produce M_z, the woman-optimal, man-pessimal stable matching, where
 """
 
 from algmatch.stableMatchings.stableMarriageProblem.noTies.smAbstract import SMAbstract
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
 
 
 class SMWomanOptimal(SMAbstract):
     def __init__(
-        self, filename: str | None = None, dictionary: dict | None = None
+        self,
+        filename: str | None = None,
+        dictionary: dict | None = None,
+        instance: SMPreferenceInstance | None = None,
     ) -> None:
-        super().__init__(filename=filename, dictionary=dictionary)
+        super().__init__(filename=filename, dictionary=dictionary, instance=instance)
 
         self.unassigned_women = set()
+        # position of each woman's next proposal, so her list is never modified
+        self.proposal_idx = {}
 
         for man in self.men:
             self.M[man] = {"assigned": None}
@@ -19,13 +27,27 @@ class SMWomanOptimal(SMAbstract):
         for woman, prefs in self.women.items():
             if len(prefs["list"]) > 0:
                 self.unassigned_women.add(woman)
+            self.proposal_idx[woman] = 0
             self.M[woman] = {"assigned": None}
 
-    def _delete_pair(self, man, woman):
-        self.men[man]["list"].remove(woman)
-        self.women[woman]["list"].remove(man)
-        if len(self.women[woman]["list"]) == 0:
-            self.unassigned_women.discard(woman)
+    def _is_deleted(self, man, woman):
+        # a man implicitly deletes every woman he ranks below his fiancee
+        fiancee = self.M[man]["assigned"]
+        if fiancee is None:
+            return False
+        m_ranks = self.men[man]["rank"]
+        return m_ranks[woman] > m_ranks[fiancee]
+
+    def _get_head(self, woman):
+        w_list = self.women[woman]["list"]
+        idx = self.proposal_idx[woman]
+        while idx < len(w_list) and self._is_deleted(w_list[idx], woman):
+            idx += 1
+        self.proposal_idx[woman] = idx
+
+        if idx == len(w_list):
+            return None
+        return w_list[idx]
 
     def _engage(self, man, woman):
         self.M[man]["assigned"] = woman
@@ -33,19 +55,16 @@ class SMWomanOptimal(SMAbstract):
 
     def _free_up(self, woman):
         self.M[woman]["assigned"] = None
-        if len(self.women[woman]["list"]) > 0:
-            self.unassigned_women.add(woman)
+        self.unassigned_women.add(woman)
 
     def _while_loop(self):
         while len(self.unassigned_women) != 0:
             w = self.unassigned_women.pop()
-            m = self.women[w]["list"][0]
-            p = self.M[m]["assigned"]
+            m = self._get_head(w)
+            if m is None:
+                continue
 
+            p = self.M[m]["assigned"]
             if p is not None:
                 self._free_up(p)
             self._engage(m, w)
-
-            rank_w = self.men[m]["rank"][w]
-            for reject in self.men[m]["list"][rank_w + 1 :]:
-                self._delete_pair(m, reject)
@@ -2,9 +2,10 @@
 Class to read in a file of preferences for the Stable Marriage Problem stable matching algorithm.
 """
 
+from itertools import islice
 from re import findall
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     IDMisformatError,
     NestedTiesError,
@@ -24,16 +25,11 @@ class FileReader(AbstractReader):
         # Read as: find cases of more than one digit or either '(' or ')'
         return findall(r"\d+|[\(\)]", line)
 
-    def _scan_preference_tokens(self, token_list, side):
+    def _scan_preference_tokens(self, token_list, side, pref_names):
         preferences = []
         in_tie = False
         cur_set = set()
 
-        if side == "man":
-            pref_char = "w"
-        else:
-            pref_char = "m"
-
         for token in token_list:
             if token == "(":
                 if in_tie:
@@ -43,13 +39,12 @@ class FileReader(AbstractReader):
                 if not in_tie:
                     raise UnopenedTieError(side, self.cur_line)
                 in_tie = False
-                preferences.append(cur_set.copy())
-                cur_set.clear()
+                preferences.append(cur_set)
+                cur_set = set()
+            elif in_tie:
+                cur_set.add(pref_names[token])
             else:
-                cur_set.add(pref_char + token)
-                if not in_tie:
-                    preferences.append(cur_set.copy())
-                    cur_set.clear()
+                preferences.append({pref_names[token]})
         if in_tie:
             raise UnclosedTieError(side, self.cur_line)
         return preferences
@@ -61,38 +56,44 @@ class FileReader(AbstractReader):
         self.women = {}
         self.cur_line = 1
 
+        man_names = NameTable("m")
+        woman_names = NameTable("w")
+
+        # the file is streamed a line at a time, so it is never held in memory whole
         with open(self.data, "r") as file:
-            file = file.read().splitlines()
-
-        try:
-            self.no_men, self.no_women = map(int, file[0].split())
-        except ValueError:
-            raise ParticipantQuantityError()
-
-        # build men dictionary
-        for elt in file[1 : self.no_men + 1]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("man", self.cur_line, line=True)
-            man = f"m{entry[0]}"
-            if man in self.men:
-                raise RepeatIDError("man", self.cur_line, line=True)
-
-            preferences = self._scan_preference_tokens(entry[1:], "man")
-            self.men[man] = {"list": preferences, "rank": {}}
-
-        # build women dictionary
-        for elt in file[self.no_men + 1 : self.no_men + self.no_women + 1]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("woman", self.cur_line, line=True)
-            woman = f"w{entry[0]}"
-            if woman in self.women:
-                raise RepeatIDError("woman", self.cur_line, line=True)
-
-            preferences = self._scan_preference_tokens(entry[1:], "woman")
-            self.women[woman] = {"list": preferences, "rank": {}}
+            try:
+                self.no_men, self.no_women = map(int, file.readline().split())
+            except ValueError:
+                raise ParticipantQuantityError()
+
+            # build men dictionary
+            for elt in islice(file, self.no_men):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("man", self.cur_line, line=True)
+                man = man_names[entry[0]]
+                if man in self.men:
+                    raise RepeatIDError("man", self.cur_line, line=True)
+
+                preferences = self._scan_preference_tokens(
+                    entry[1:], "man", woman_names
+                )
+                self.men[man] = {"list": preferences, "rank": {}}
+
+            # build women dictionary
+            for elt in islice(file, self.no_women):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("woman", self.cur_line, line=True)
+                woman = woman_names[entry[0]]
+                if woman in self.women:
+                    raise RepeatIDError("woman", self.cur_line, line=True)
+
+                preferences = self._scan_preference_tokens(
+                    entry[1:], "woman", man_names
+                )
+                self.women[woman] = {"list": preferences, "rank": {}}
@@ -2,9 +2,10 @@
 Stable Marriage Problem With Ties - Abstract class
 """
 
-from copy import deepcopy
 import os
 
+from algmatch.abstractClasses.tiedPreferenceList import TiedPreferenceList
+from algmatch.stabilityCheckers.smStabilityChecker import SMStabilityChecker
 from algmatch.stableMatchings.stableMarriageProblem.ties.smtPreferenceInstance import (
     SMTPreferenceInstance,
 )
@@ -36,9 +37,8 @@ class SMTAbstract:
 
         self.men = self._reader.men
         self.women = self._reader.women
-
-        self.original_men = deepcopy(self.men)
-        self.original_women = deepcopy(self.women)
+        for prefs in (*self.men.values(), *self.women.values()):
+            prefs["list"] = TiedPreferenceList(prefs["list"], prefs["rank"])
 
         self.M = {}  # provisional matching
         self.stable_matching = {
@@ -55,88 +55,18 @@ class SMTAbstract:
             "Stability type must be either 'super' or 'strong'"
         )
 
+    def _is_stable(self, stability_type) -> bool:
+        # solvers only delete from the lists, so the ranks are still the originals
+        checker = SMStabilityChecker(
+            stability_type=stability_type, instance=self._reader
+        )
+        return checker.is_stable({man: self.M[man]["assigned"] for man in self.men})
+
     def _check_super_stability(self) -> bool:
-        # first check for multiple-assignment
-        seen_matching_targets = set()
-        for person in self.M:
-            matching_target = self.M[person]["assigned"]
-            if matching_target in seen_matching_targets:
-                return False
-            if matching_target is not None:
-                seen_matching_targets.add(matching_target)
-
-        # stability must be checked with regards to the original lists prior to deletions
-        for man, m_prefs in self.original_men.items():
-            preferred_women = self.original_men[man]["list"]
-            matched_woman = self.M[man]["assigned"]
-
-            if matched_woman is not None:
-                rank_matched_woman = m_prefs["rank"][matched_woman]
-                # every woman that m_i prefers to his matched partner or is indifferent between them
-                preferred_women = m_prefs["list"][: rank_matched_woman + 1]
-
-            for w_tie in preferred_women:
-                for woman in w_tie:
-                    if woman == matched_woman:
-                        continue
-
-                    existing_fiance = self.M[woman]["assigned"]
-                    if existing_fiance is None:
-                        return False
-                    else:
-                        w_prefs = self.original_women[woman]
-                        rank_fiance = w_prefs["rank"][existing_fiance]
-                        rank_man = w_prefs["rank"][man]
-                        if rank_man <= rank_fiance:
-                            return False
-        return True
+        return self._is_stable("super")
 
     def _check_strong_stability(self) -> bool:
-        # first check for multiple-assignment
-        seen_matching_targets = set()
-        for person in self.M:
-            matching_target = self.M[person]["assigned"]
-            if matching_target in seen_matching_targets:
-                return False
-            if matching_target is not None:
-                seen_matching_targets.add(matching_target)
-
-        # stability must be checked with regards to the original lists prior to deletions
-        for man, m_prefs in self.original_men.items():
-            matched_woman = self.M[man]["assigned"]
-
-            if matched_woman is not None:
-                rank_matched_woman = m_prefs["rank"][matched_woman]
-                preferred_women = m_prefs["list"][:rank_matched_woman]
-                indifferent_women = m_prefs["list"][rank_matched_woman]
-            else:
-                preferred_women = self.original_men[man]["list"]
-                indifferent_women = []
-
-            for w_tie in preferred_women:
-                for woman in w_tie:
-                    existing_fiance = self.M[woman]["assigned"]
-                    if existing_fiance is None:
-                        return False
-                    else:
-                        w_prefs = self.original_women[woman]
-                        rank_fiance = w_prefs["rank"][existing_fiance]
-                        rank_man = w_prefs["rank"][man]
-                        if rank_man <= rank_fiance:
-                            return False
-
-            for woman in indifferent_women:
-                existing_fiance = self.M[woman]["assigned"]
-                if existing_fiance is None:
-                    return False
-                else:
-                    w_prefs = self.original_women[woman]
-                    rank_fiance = w_prefs["rank"][existing_fiance]
-                    rank_man = w_prefs["rank"][man]
-                    if rank_man < rank_fiance:
-                        return False
-
-        return True
+        return self._is_stable("strong")
 
     def _get_pref_list(self, person) -> list:
         if person in self.men:
@@ -155,29 +85,13 @@ class SMTAbstract:
             raise ValueError(f"{person} is not a man or a woman")
 
     def _get_pref_length(self, person) -> int:
-        pref_list = self._get_pref_list(person)
-        total = sum([len(tie) for tie in pref_list])
-        return total
+        return self._get_pref_list(person).size
 
     def _get_head(self, person) -> set:
-        pref_list = self._get_pref_list(person)
-        idx = 0
-        while idx < len(pref_list):
-            head = pref_list[idx]
-            if len(head) > 0:
-                return head
-            idx += 1
-        raise ValueError("Pref_list empty")
+        return self._get_pref_list(person).head
 
     def _get_tail(self, person) -> set:
-        pref_list = self._get_pref_list(person)
-        idx = len(pref_list) - 1
-        while idx >= 0:
-            tail = pref_list[idx]
-            if len(tail) > 0:
-                return tail
-            idx -= 1
-        raise ValueError("Pref_list empty")
+        return self._get_pref_list(person).tail
 
     def _engage(self, man, woman) -> None:
         self.M[man]["assigned"].add(woman)
@@ -190,15 +104,15 @@ class SMTAbstract:
     def _delete_pair(self, man, woman) -> None:
         if man in self.women:
             man, woman = woman, man
-        for tie in self.men[man]["list"]:
-            tie.discard(woman)
-        for tie in self.women[woman]["list"]:
-            tie.discard(man)
+        self.men[man]["list"].discard(woman)
+        self.women[woman]["list"].discard(man)
 
     def _delete_tail(self, person) -> None:
-        tail = self._get_tail(person)
+        pref_list = self._get_pref_list(person)
+        tail = pref_list.tail
+        tail_idx = pref_list.tail_idx
         while len(tail) != 0:
-            deletion = tail.pop()
+            deletion = pref_list.pop_from(tail_idx)
             self._delete_pair(person, deletion)
 
     def _break_all_engagements(self, person) -> None:
@@ -208,10 +122,10 @@ class SMTAbstract:
             self._break_engagement(person, assignee)
 
     def _reject_lower_ranks(self, target, proposer) -> None:
-        rank_p = self._get_pref_ranks(target)[proposer]
-        for reject_tie in self._get_pref_list(target)[rank_p + 1 :]:
-            while len(reject_tie) != 0:
-                reject = reject_tie.pop()
+        pref_list = self._get_pref_list(target)
+        for idx in pref_list.ties_after(pref_list.rank[proposer]):
+            while pref_list[idx]:
+                reject = pref_list.pop_from(idx)
                 self._break_engagement(target, reject)
                 self._delete_pair(target, reject)
 
@@ -2,8 +2,6 @@
 Store preference lists for Stable Marriage stable matching algorithm.
 """
 
-from itertools import product
-
 from algmatch.abstractClasses.abstractPreferenceInstanceWithTies import (
     AbstractPreferenceInstanceWithTies,
 )
@@ -53,30 +51,7 @@ class SMTPreferenceInstance(AbstractPreferenceInstanceWithTies):
                         raise PrefNotFoundError("woman", w, m)
 
     def clean_unacceptable_pairs(self) -> None:
-        for m, w in product(self.men, self.women):
-            m_list = self.men[m]["list"]
-            w_list = self.women[w]["list"]
-
-            m_found = any([m in tie for tie in w_list])
-            w_found = any([w in tie for tie in m_list])
-
-            if not (m_found and w_found):
-                for tie in m_list:
-                    try:
-                        tie.remove(w)
-                    except KeyError:
-                        pass
-                for tie in w_list:
-                    try:
-                        tie.remove(m)
-                    except KeyError:
-                        pass
-                # clean empty sets
-                # we've produced at most one per side in this loop
-                if set() in m_list:
-                    m_list.remove(set())
-                if set() in w_list:
-                    w_list.remove(set())
+        super().clean_unacceptable_pairs(self.men, self.women)
 
     def set_up_rankings(self):
         for m in self.men:
@@ -1,12 +1,16 @@
 """
 Stable Marriage Problem With Ties - Strong-Stability-Specific Abstract Class
-Stores Hopcroft-Karp implementation for finding the maximum matching
+Stores implementations of:
+- Hopcroft-Karp for finding the maximum matching
+- Finding the critical set of proposers based on the above
 """
 
-from collections import deque
+from array import array
 
 from algmatch.stableMatchings.stableMarriageProblem.ties.smtAbstract import SMTAbstract
 
+UNMATCHED = -1
+
 
 class SMTStrongAbstract(SMTAbstract):
     def __init__(
@@ -15,64 +19,174 @@ class SMTStrongAbstract(SMTAbstract):
         super().__init__(
             filename=filename, dictionary=dictionary, stability_type="strong"
         )
-        # used to find the critical set and final answer
+        # used to find the final answer
         self.maximum_matching = {}
-        self.dist = {}
 
-    def _reset_maximum_matching(self):
-        self.maximum_matching = {
-            "men": {m: None for m in self.men},
-            "women": {w: None for w in self.women},
-        }
-        self.dist = {}
+    def _set_up_proposers(self, proposers, receivers):
+        """
+        Numbers the proposers and receivers, so that the maximum matching and the
+        alternating paths from it can be kept in int arrays between iterations.
+
+        :param proposers: e.g. self.men, for the man-optimal algorithm
+        :param receivers: e.g. self.women
+        """
+        self._proposer_names = list(proposers)
+        self._receiver_names = list(receivers)
+        self._proposer_index = {p: i for i, p in enumerate(self._proposer_names)}
+        self._receiver_index = {r: j for j, r in enumerate(self._receiver_names)}
+
+        self._adjacency = [[] for _ in self._proposer_names]
+        self._mate_of_proposer = array("i", [UNMATCHED]) * len(self._proposer_names)
+        self._mate_of_receiver = array("i", [UNMATCHED]) * len(self._receiver_names)
+        self._dist = array("i", [0]) * len(self._proposer_names)
+        # proposers whose engagements changed since the last maximum matching
+        self._touched = set()
+
+    def _engage(self, man, woman) -> None:
+        super()._engage(man, woman)
+        # either argument may be the proposer, as subclasses pass them in both orders
+        index = self._proposer_index
+        self._touched.add(index[man] if man in index else index[woman])
+
+    def _break_engagement(self, man, woman) -> None:
+        super()._break_engagement(man, woman)
+        index = self._proposer_index
+        self._touched.add(index[man] if man in index else index[woman])
+
+    def _update_touched(self):
+        """
+        Rebuilds the adjacency of the proposers touched since the last maximum
+        matching, unmatching them if they are no longer engaged to their mate, so
+        the previous matching is left to augment from.
+        """
+        receiver_index = self._receiver_index
+        mate_of_proposer = self._mate_of_proposer
+        for i in self._touched:
+            engaged = self.M[self._proposer_names[i]]["assigned"]
+            self._adjacency[i] = [receiver_index[r] for r in engaged]
+
+            j = mate_of_proposer[i]
+            if j != UNMATCHED and self._receiver_names[j] not in engaged:
+                mate_of_proposer[i] = UNMATCHED
+                self._mate_of_receiver[j] = UNMATCHED
+        self._touched.clear()
 
     def _BFS(self):
-        queue = deque(maxlen=len(self.men))
-        self.dist = {None: float("inf")}
-        for m in self.men:
-            if self.maximum_matching["men"][m] is None:
-                self.dist[m] = 0
-                queue.append(m)
+        """
+        Layers the proposers by the length of the shortest alternating path reaching
+        them from a free proposer.
+
+        :return: whether any augmenting path exists
+        """
+        adjacency = self._adjacency
+        mate_of_proposer = self._mate_of_proposer
+        mate_of_receiver = self._mate_of_receiver
+        dist = self._dist
+        # further than any proposer can be from a free one
+        unreached = len(adjacency) + 1
+
+        queue = []
+        for i in range(len(adjacency)):
+            if mate_of_proposer[i] == UNMATCHED:
+                dist[i] = 0
+                queue.append(i)
             else:
-                self.dist[m] = float("inf")
-
-        while queue:
-            m = queue.popleft()
-            if self.dist[m] < self.dist[None]:
-                for w in self.M[m]["assigned"]:
-                    partner = self.maximum_matching["women"][w]
-                    if self.dist[partner] == float("inf"):
-                        self.dist[partner] = self.dist[m] + 1
-                        queue.append(partner)
-
-        return self.dist[None] != float("inf")
-
-    def _DFS(self, m):
-        if m is not None:
-            for w in self.M[m]["assigned"]:
-                partner = self.maximum_matching["women"][w]
-                if self.dist[partner] == self.dist[m] + 1:
-                    if self._DFS(partner):
-                        self.maximum_matching["women"][w] = m
-                        self.maximum_matching["men"][m] = w
-                        return True
-            self.dist[m] = float("inf")
-            return False
-        return True
+                dist[i] = unreached
+
+        # proposers beyond the layer where a free receiver is first reached are not
+        # needed, unless there is none, when every reachable proposer is layered
+        shortest = unreached
+        for i in queue:
+            if dist[i] >= shortest:
+                break
+            for j in adjacency[i]:
+                partner = mate_of_receiver[j]
+                if partner == UNMATCHED:
+                    shortest = dist[i] + 1
+                elif dist[partner] == unreached:
+                    dist[partner] = dist[i] + 1
+                    queue.append(partner)
+
+        return shortest != unreached
+
+    def _DFS(self, root, cursor):
+        """
+        Searches for an augmenting path from a free proposer along the BFS layers,
+        with an explicit stack, so long paths cannot exceed the recursion limit.
+
+        :return: whether the matching was augmented
+        """
+        adjacency = self._adjacency
+        mate_of_proposer = self._mate_of_proposer
+        mate_of_receiver = self._mate_of_receiver
+        dist = self._dist
+        unreached = len(adjacency) + 1
+
+        stack = [root]
+        while stack:
+            i = stack[-1]
+            neighbours = adjacency[i]
+            if cursor[i] == len(neighbours):
+                # dead end, so no later search needs to visit this proposer again
+                dist[i] = unreached
+                stack.pop()
+                continue
+
+            j = neighbours[cursor[i]]
+            cursor[i] += 1
+            partner = mate_of_receiver[j]
+            if partner == UNMATCHED:
+                # each proposer on the stack takes the receiver they last reached
+                for p in stack:
+                    r = adjacency[p][cursor[p] - 1]
+                    mate_of_proposer[p] = r
+                    mate_of_receiver[r] = p
+                return True
+            if dist[partner] == dist[i] + 1:
+                stack.append(partner)
+
+        return False
 
     def _get_maximum_matching(self):
         """
-        An implementation of Hopcroft-Karp
+        An implementation of Hopcroft-Karp, warm-started from the previous maximum
+        matching, so only the engagements made or broken since need augmenting.
         """
-        self._reset_maximum_matching()
+        self._update_touched()
         while self._BFS():
-            for m in self.men:
-                if self.maximum_matching["men"][m] is None:
-                    self._DFS(m)
+            cursor = array("i", [0]) * len(self._adjacency)
+            for i in range(len(self._adjacency)):
+                if self._mate_of_proposer[i] == UNMATCHED:
+                    self._DFS(i, cursor)
+
+    def _get_critical_set(self):
+        """
+        The critical set is every proposer reachable by an alternating path from a
+        proposer left free by the maximum matching. Once no augmenting path remains,
+        the last BFS of Hopcroft-Karp has layered exactly these, so they are read
+        off its layers rather than found by exploring the graph again.
+        """
+        self._get_maximum_matching()
+        unreached = len(self._adjacency) + 1
+        return {
+            self._proposer_names[i] for i, d in enumerate(self._dist) if d != unreached
+        }
 
     def _select_maximum_matching(self):
         self._get_maximum_matching()
-        for m, w in self.maximum_matching["men"].items():
-            self.M[m]["assigned"] = w
-        for w, m in self.maximum_matching["women"].items():
-            self.M[w]["assigned"] = m
+
+        matching = {p: None for p in self._proposer_names}
+        matching.update({r: None for r in self._receiver_names})
+        for i, j in enumerate(self._mate_of_proposer):
+            if j != UNMATCHED:
+                proposer = self._proposer_names[i]
+                receiver = self._receiver_names[j]
+                matching[proposer] = receiver
+                matching[receiver] = proposer
+
+        self.maximum_matching = {
+            "men": {m: matching[m] for m in self.men},
+            "women": {w: matching[w] for w in self.women},
+        }
+        for person, partner in matching.items():
+            self.M[person]["assigned"] = partner
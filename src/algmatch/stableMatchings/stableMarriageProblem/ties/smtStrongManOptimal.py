@@ -12,6 +12,7 @@ class SMTStrongManOptimal(SMTStrongAbstract):
         self, filename: str | None = None, dictionary: dict | None = None
     ) -> None:
         super().__init__(filename=filename, dictionary=dictionary)
+        self._set_up_proposers(self.men, self.women)
 
         self.unassigned_men = set()
         self.proposed = {w: False for w in self.women}
@@ -37,29 +38,6 @@ class SMTStrongManOptimal(SMTStrongAbstract):
             man, woman = woman, man
         self.unassigned_men.add(man)
 
-    def _get_critical_set(self):
-        self._get_maximum_matching()
-
-        unexplored_men = {
-            m for m, w in self.maximum_matching["men"].items() if w is None
-        }
-        explored_men, visited_women = set(), set()
-        while unexplored_men:
-            man = unexplored_men.pop()
-            explored_men.add(man)
-            women_to_explore = self.M[man]["assigned"] - {
-                self.maximum_matching["men"][man]
-            }
-
-            for w in women_to_explore:
-                if w not in visited_women:
-                    visited_women.add(w)
-                    w_match = self.maximum_matching["women"][w]
-                    if w_match not in explored_men:
-                        unexplored_men.add(w_match)
-
-        return explored_men
-
     def _while_loop(self) -> bool:
         U = {None}
         while U:
@@ -12,6 +12,7 @@ class SMTStrongWomanOptimal(SMTStrongAbstract):
         self, filename: str | None = None, dictionary: dict | None = None
     ) -> None:
         super().__init__(filename=filename, dictionary=dictionary)
+        self._set_up_proposers(self.women, self.men)
 
         self.unassigned_women = set()
         self.proposed = {m: False for m in self.men}
@@ -37,29 +38,6 @@ class SMTStrongWomanOptimal(SMTStrongAbstract):
             man, woman = woman, man
         self.unassigned_women.add(woman)
 
-    def _get_critical_set(self):
-        self._get_maximum_matching()
-
-        unexplored_women = {
-            w for w, m in self.maximum_matching["women"].items() if m is None
-        }
-        explored_women, visited_men = set(), set()
-        while unexplored_women:
-            woman = unexplored_women.pop()
-            explored_women.add(woman)
-            men_to_explore = self.M[woman]["assigned"] - {
-                self.maximum_matching["women"][woman]
-            }
-
-            for m in men_to_explore:
-                if m not in visited_men:
-                    visited_men.add(m)
-                    m_match = self.maximum_matching["men"][m]
-                    if m_match not in explored_women:
-                        unexplored_women.add(m_match)
-
-        return explored_women
-
     def _while_loop(self) -> bool:
         U = {None}
         while U:
@@ -2,7 +2,7 @@
 Class to read in a file of preferences for the Stable Roommates Problem stable matching algorithm.
 """
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     IDMisformatError,
     RepeatIDError,
@@ -18,24 +18,31 @@ class FileReader(AbstractReader):
     def _read_data(self) -> None:
         self.no_roommates = 0
         self.roommates = {}
-        cur_line = 1
+        cur_line = 0
 
-        with open(self.data, "r") as file:
-            file = file.read().splitlines()
-
-        for elt in file[: self.no_roommates]:
-            cur_line += 1
-            entry = elt.split()
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("roommate", cur_line, line=True)
-            roommate = f"r{entry[0]}"
-            if roommate in self.roommates:
-                raise RepeatIDError("roommate", cur_line, line=True)
+        roommate_names = NameTable("r")
 
-            for i in entry[1:]:
-                if not i.isdigit():
-                    raise PrefListMisformatError("roommate", cur_line, i, line=True)
-            preferences = [f"r{i}" for i in entry[1:]]
-
-            self.roommates[roommate] = {"list": preferences, "rank": {}}
+        # the file is streamed a line at a time, so it is never held in memory whole
+        with open(self.data, "r") as file:
+            for elt in file:
+                cur_line += 1
+                entry = elt.split()
+
+                # there is no header giving the number of roommates, so a blank
+                # line, e.g. at the end of the file, is skipped rather than an error
+                if not entry:
+                    continue
+                if not entry[0].isdigit():
+                    raise IDMisformatError("roommate", cur_line, line=True)
+                roommate = roommate_names[entry[0]]
+                if roommate in self.roommates:
+                    raise RepeatIDError("roommate", cur_line, line=True)
+
+                for i in entry[1:]:
+                    if not i.isdigit():
+                        raise PrefListMisformatError("roommate", cur_line, i, line=True)
+                preferences = [roommate_names[i] for i in entry[1:]]
+
+                self.roommates[roommate] = {"list": preferences, "rank": {}}
+
+        self.no_roommates = len(self.roommates)
@@ -2,9 +2,9 @@
 Stable Roommates Problem - Abstract class
 """
 
-from copy import deepcopy
 import os
 
+from algmatch.stabilityCheckers.srStabilityChecker import SRStabilityChecker
 from algmatch.stableMatchings.stableRoommatesProblem.srPreferenceInstance import (
     SRPreferenceInstance,
 )
@@ -29,36 +29,21 @@ class SRAbstract:
             self._reader = SRPreferenceInstance(dictionary=dictionary)
 
         self.roommates = self._reader.roommates
-        self.original_roommates = deepcopy(self.roommates)
 
         self.M = {}  # provisional matching
         self.stable_matching = {r: "" for r in self.roommates}
         self.is_stable = False
 
     def _check_stability(self):
-        # stability must be checked with regards to the original lists prior to deletions
-        for roommate, r_prefs in self.original_roommates.items():
-            preferred_partners = r_prefs["list"]
-            if self.M[roommate]["assigned"] is not None:
-                matched_partner = self.M[roommate]["assigned"]
-                rank_matched_partner = r_prefs["rank"][matched_partner]
-                # every other roomate that r_i prefers to his matched partner
-                preferred_partners = r_prefs["list"][:rank_matched_partner]
-            else:
-                return False
-
-            for partner in preferred_partners:
-                existing_roommate = self.M[partner]["assigned"]
-                if existing_roommate is None:
-                    return False
-                else:
-                    p_ranks = self.original_roommates[partner]["rank"]
-                    rank_existing_roommate = p_ranks[existing_roommate]
-                    rank_roommate = p_ranks[roommate]
-                    if rank_roommate < rank_existing_roommate:
-                        return False
-
-        return True
+        matching = {
+            roommate: self.M[roommate]["assigned"] for roommate in self.roommates
+        }
+        if None in matching.values():
+            return False
+
+        # solvers only delete from the lists, so the ranks are still the originals
+        checker = SRStabilityChecker(instance=self._reader)
+        return checker.is_stable(matching)
 
     def _while_loop(self):
         raise NotImplementedError("Method _while_loop must be implemented in subclass")
@@ -4,34 +4,91 @@ Algorithm to produce a stable matching.
 
 from algmatch.stableMatchings.stableRoommatesProblem.srAbstract import SRAbstract
 
+NONE = -1
+
 
 class SRAlgorithm(SRAbstract):
+    """
+    Irving's algorithm.
+
+    Each reduced list is kept as a doubly-linked list over the positions of the
+    original list, with pointers to its first and last entries, and the rank tables
+    give the position of any roommate on any list. So reading the first, second or
+    last entry, and deleting any pair, each take constant time, and since a pair is
+    deleted at most once the whole run takes O(n^2) time on a complete instance.
+    """
+
     def __init__(
         self, filename: str | None = None, dictionary: dict | None = None
     ) -> None:
         super().__init__(filename=filename, dictionary=dictionary)
 
+        self._names = list(self.roommates)
+
+        # _rank[r][s] is the position of s on r's original list, or NONE once the
+        # pair is deleted
+        self._rank = {}
+        # links between the positions on each list still in its reduced list
+        self._next = {}
+        self._prev = {}
+        self._first = {}
+        self._last = {}
+        self._length = {}
+
         self.unassigned_roommates = set()
+        # number of roommates whose reduced lists are empty
+        self._empty_lists = 0
+        # every roommate before this one has a reduced list of length at most 1;
+        # lists only shrink, so it only moves forward
+        self._long_list_cursor = 0
 
         for roommate, r_prefs in self.roommates.items():
-            if len(r_prefs["list"]) > 0:
+            length = len(r_prefs["list"])
+            # the reader's ranks are left as they are, for the stability checker
+            self._rank[roommate] = dict(r_prefs["rank"])
+            self._next[roommate] = list(range(1, length + 1))
+            self._prev[roommate] = list(range(-1, length - 1))
+            self._length[roommate] = length
+            if length > 0:
+                self._first[roommate] = 0
+                self._last[roommate] = length - 1
                 self.unassigned_roommates.add(roommate)
+            else:
+                self._first[roommate] = NONE
+                self._last[roommate] = NONE
+                self._empty_lists += 1
             self.M[roommate] = {"assigned": None}
 
     def _delete_pair(self, r_a, r_b):
-        self.roommates[r_a]["list"].remove(r_b)
-        self.roommates[r_b]["list"].remove(r_a)
-
-        if len(self.roommates[r_a]["list"]) == 0:
-            self.unassigned_roommates.discard(r_a)
-        if len(self.roommates[r_b]["list"]) == 0:
-            self.unassigned_roommates.discard(r_b)
+        for r, other in ((r_a, r_b), (r_b, r_a)):
+            # unlink other from the reduced list of r
+            rank = self._rank[r]
+            next_ = self._next[r]
+            prev = self._prev[r]
+            k = rank[other]
+            rank[other] = NONE
+            prev_k = prev[k]
+            next_k = next_[k]
+            if prev_k == NONE:
+                self._first[r] = next_k
+            else:
+                next_[prev_k] = next_k
+            if next_k == len(next_):
+                self._last[r] = prev_k
+            else:
+                prev[next_k] = prev_k
+
+            self._length[r] -= 1
+            if self._length[r] == 0:
+                self._first[r] = NONE
+                self._empty_lists += 1
+                self.unassigned_roommates.discard(r)
 
     def _engage(self, r_a, r_b):
         self.M[r_b]["assigned"] = r_a
 
     def _free_up(self, r):
-        if len(self.roommates[r]["list"]) > 0:
+        if self._length[r] > 0:
             self.unassigned_roommates.add(r)
 
     def proposal_phase(self):
@@ -40,17 +97,18 @@ class SRAlgorithm(SRAbstract):
         """
         while self.unassigned_roommates:
             r_a = self.unassigned_roommates.pop()
-            r_b = self.roommates[r_a]["list"][0]
+            r_b = self.roommates[r_a]["list"][self._first[r_a]]
             r_b_partner = self.M[r_b]["assigned"]
 
             if r_b_partner is not None:
                 self._free_up(r_b_partner)
             self._engage(r_a, r_b)
 
-            # using ranks might also be ok here
-            rank_r_a = self.roommates[r_b]["list"].index(r_a)
-            for reject in self.roommates[r_b]["list"][rank_r_a + 1 :]:
-                self._delete_pair(reject, r_b)
+            # r_b rejects everyone they rank below r_a, working in from the end
+            rank_r_a = self._rank[r_b][r_a]
+            r_b_list = self.roommates[r_b]["list"]
+            while self._last[r_b] != rank_r_a:
+                self._delete_pair(r_b_list[self._last[r_b]], r_b)
 
     def locate_cycle(self, p_1):
         """
@@ -59,27 +117,41 @@ class SRAlgorithm(SRAbstract):
         who holds their proposals to reject them. p_{i+1} is being held by q_i. We
         return only these q_i that need to make a rejection.
         """
+        roommates = self.roommates
         p = []
         q = []
+        # position of each roommate in p
+        seen = {}
         cur_p = p_1
-        while cur_p not in p:
+        while cur_p not in seen:
+            seen[cur_p] = len(p)
             p.append(cur_p)
-            cur_q = self.roommates[cur_p]["list"][1]
+            cur_q = roommates[cur_p]["list"][self._next[cur_p][self._first[cur_p]]]
             q.append(cur_q)
-            cur_p = self.roommates[cur_q]["list"][-1]
-        cycle_start = p.index(cur_p)
+            cur_p = roommates[cur_q]["list"][self._last[cur_q]]
+        cycle_start = seen[cur_p]
 
         if cycle_start == 0:
             return [q[-1]] + q[:-1]
         else:
             return q[cycle_start - 1 : -1]
 
+    def _first_long_list(self):
+        """
+        :return: the first roommate whose reduced list has more than one entry, or
+            None if there is none
+        """
+        names = self._names
+        cursor = self._long_list_cursor
+        while cursor < len(names) and self._length[names[cursor]] <= 1:
+            cursor += 1
+        self._long_list_cursor = cursor
+        return names[cursor] if cursor < len(names) else None
+
     def cycle_phase(self):
-        for candidate in self.roommates:
-            length = len(self.roommates[candidate]["list"])
-            if length != 1:
-                r_a = candidate
-                break
+        # the halting condition has ruled out empty lists, so this is the first
+        # roommate whose list has length != 1
+        r_a = self._first_long_list()
 
         rejecters = self.locate_cycle(r_a)
         for r_b in rejecters:
@@ -89,9 +161,9 @@ class SRAlgorithm(SRAbstract):
             self._delete_pair(r_b, partner)
 
     def halting_condition(self):
-        if any(len(self.roommates[r]["list"]) == 0 for r in self.roommates):
+        if self._empty_lists > 0:
             return False
-        elif all(len(self.roommates[r]["list"]) == 1 for r in self.roommates):
+        elif self._first_long_list() is None:
             return False
         else:
             return True
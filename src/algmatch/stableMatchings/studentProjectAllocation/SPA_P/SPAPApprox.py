@@ -0,0 +1,239 @@
+"""
+A polynomial time approximation algorithm for the SPA-P problem, finding a stable
+matching at least half the size of a maximum one, in time linear in the total
+length of the preference lists. Stores implementations of:
+- SPA-P-approx, where students apply to projects in order of preference, and
+  lecturers that are full reject from their worst non-empty project
+- An optional second chance for students left unassigned, who apply along their
+  lists again, and are only rejected while no student without one can be instead
+- Satisfying every coalition, by top trading cycles over the assigned projects
+"""
+
+import sys
+
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.fileReader import FileReader
+
+from collections import defaultdict
+
+
+class SPAPApprox:
+    def __init__(self, filename: str, improve: bool = True) -> None:
+        """
+        :param filename: str, the path to the file to read in the instance from.
+        :param improve: bool, optional, default=True, whether students left unassigned get a second chance, which usually finds a larger matching.
+        """
+        self.filename = filename
+        r = FileReader(filename)
+
+        # self._students has the form: student -> [project preferences, {project: assigned?}]
+        self._students = r.students
+        self._projects = r.projects
+        self._lecturers = r.lecturers
+        self.improve = improve
+
+        # rank of each project in the preference list of the lecturer offering it
+        self._lecturer_rank = {
+            project: rank
+            for lecturer in self._lecturers
+            for rank, project in enumerate(self._lecturers[lecturer][1])
+        }
+
+        self.matching = defaultdict(str)
+
+
+    def _reset_state(self) -> None:
+        self._assigned = {student: None for student in self._students}
+        # index of the project each student is assigned to, or will apply to next
+        self._position = {student: 0 for student in self._students}
+        self._promoted = set()
+
+        # the students assigned to each project, split into those without and with a
+        # second chance, so a student without one can always be rejected first
+        self._members = {project: ([], []) for project in self._projects}
+        self._occupancy = {project: 0 for project in self._projects}
+        self._lecturer_occupancy = {lecturer: 0 for lecturer in self._lecturers}
+
+        # index in a full lecturer's list of their worst non-empty project, where
+        # projects below it are deleted from every student's list; a full lecturer
+        # stays full, so this only moves up. -1 for a full lecturer with none
+        self._worst = {
+            lecturer: -1 if self._lecturers[lecturer][0] == 0 else None
+            for lecturer in self._lecturers
+        }
+
+
+    def _is_deleted(self, project) -> bool:
+        worst = self._worst[self._projects[project][1]]
+        return worst is not None and self._lecturer_rank[project] > worst
+
+
+    def _next_project(self, student):
+        preferences = self._students[student][0]
+        position = self._position[student]
+        while position < len(preferences) and self._is_deleted(preferences[position]):
+            position += 1
+        self._position[student] = position
+        return preferences[position] if position < len(preferences) else None
+
+
+    def _update_worst(self, lecturer) -> None:
+        # assumes the lecturer is full
+        preferences = self._lecturers[lecturer][1]
+        worst = self._worst[lecturer]
+        if worst is None:
+            worst = len(preferences) - 1
+        while worst >= 0 and self._occupancy[preferences[worst]] == 0:
+            worst -= 1
+        self._worst[lecturer] = worst
+
+
+    def _assign(self, student, project) -> None:
+        self._assigned[student] = project
+        self._members[project][student in self._promoted].append(student)
+        self._occupancy[project] += 1
+        self._lecturer_occupancy[self._projects[project][1]] += 1
+
+
+    def _reject(self, project):
+        """
+        Breaks the assignment of some student to the project, rejecting one without a
+        second chance if there is any, and moves them on to their next project.
+
+        :return: the rejected student
+        """
+        without, with_second_chance = self._members[project]
+        student = without.pop() if without else with_second_chance.pop()
+
+        self._assigned[student] = None
+        self._occupancy[project] -= 1
+        self._lecturer_occupancy[self._projects[project][1]] -= 1
+        self._position[student] += 1
+        return student
+
+
+    def _while_loop(self) -> None:
+        free = list(reversed(self._students))
+        while free:
+            student = free.pop()
+            project = self._next_project(student)
+            if project is None:
+                if self.improve and student not in self._promoted:
+                    self._promoted.add(student)
+                    self._position[student] = 0
+                    free.append(student)
+                continue
+
+            # student applies to project
+            lecturer = self._projects[project][1]
+            self._assign(student, project)
+
+            if self._occupancy[project] > self._projects[project][0]:
+                free.append(self._reject(project))
+            elif self._lecturer_occupancy[lecturer] > self._lecturers[lecturer][0]:
+                # the lecturer was full, so projects below their worst non-empty one
+                # are deleted, and the project is no worse than it
+                worst_project = self._lecturers[lecturer][1][self._worst[lecturer]]
+                free.append(self._reject(worst_project))
+
+            if self._lecturer_occupancy[lecturer] == self._lecturers[lecturer][0]:
+                self._update_worst(lecturer)
+
+
+    def _remove_coalitions(self) -> None:
+        """
+        A coalition is a cycle of assigned students, each preferring the project of
+        the next to their own. Top trading cycles reallocates the assigned projects
+        among the students holding them, so that none remains. Every student is left
+        no worse off, and every project and lecturer just as full, so the matching
+        stays stable.
+        """
+        holders = defaultdict(list)  # project -> students assigned to it
+        for student, project in self._assigned.items():
+            if project is not None:
+                holders[project].append(student)
+        next_holder = defaultdict(int)  # index in holders of the first still trading
+        pointer = {student: 0 for student in self._students}
+        traded = {}
+
+        def best_holder(student):
+            # the best project still held by a trading student, and one of them
+            preferences = self._students[student][0]
+            while True:
+                project = preferences[pointer[student]]
+                project_holders = holders[project]
+                while next_holder[project] < len(project_holders) and project_holders[next_holder[project]] in traded:
+                    next_holder[project] += 1
+                if next_holder[project] < len(project_holders):
+                    break
+                pointer[student] += 1
+
+            if project == self._assigned[student]:
+                return project, student
+            return project, project_holders[next_holder[project]]
+
+        for start in self._students:
+            if self._assigned[start] is None or start in traded:
+                continue
+            # path[i] points to path[i + 1], through the project targets[i] they hold
+            path = [start]
+            targets = []
+            on_path = {start: 0}
+            while path:
+                project, holder = best_holder(path[-1])
+                targets.append(project)
+                if holder not in on_path:
+                    on_path[holder] = len(path)
+                    path.append(holder)
+                    continue
+
+                # each student in the cycle takes the project of the one they point to
+                cycle_start = on_path[holder]
+                for student, target in zip(path[cycle_start:], targets[cycle_start:]):
+                    traded[student] = target
+                    del on_path[student]
+                # the student before the cycle now points elsewhere
+                del path[cycle_start:]
+                del targets[max(cycle_start - 1, 0):]
+
+        self._assigned.update(traded)
+
+
+    def solve(self) -> None:
+        self._reset_state()
+        self._while_loop()
+        self._remove_coalitions()
+
+        for student in self._students:
+            project = self._assigned[student]
+            if project is None:
+                continue
+            lecturer = self._projects[project][1]
+
+            self.matching[student] = project
+            self._projects[project][2] += 1
+            self._lecturers[lecturer][2] += 1
+
+            l_k_worst_project = self._lecturers[lecturer][3]
+            if l_k_worst_project is None or self._lecturer_rank[l_k_worst_project] < self._lecturer_rank[project]:
+                self._lecturers[lecturer][3] = project
+
+
+    def display_assignments(self) -> None:
+        # assumes model has been solved
+        for student, project in self.matching.items():
+            print(f"{student} -> {project}")
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python3 SPAPApprox.py <filename>")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    G = SPAPApprox(filename)
+    G.solve()
+    G.display_assignments()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,194 +1,219 @@
 """
-Using Gurobi Integer Programming to solve the SPA-P problem.
+Using Integer Programming to solve the SPA-P problem, with Gurobi or HiGHS.
 """
 
 import sys
-import gurobipy as gp
-from gurobipy import GRB
+import numpy as np
 
 from algmatch.stableMatchings.studentProjectAllocation.SPA_P.fileReader import FileReader
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.milpBackends import MILPModel
 
 from collections import defaultdict
 
 
-class GurobiSPAP:
-    def __init__(self, filename: str, output_flag=1) -> None:
+def _expand(starts: np.ndarray, lengths: np.ndarray) -> tuple:
+    """
+    :return: the runs starts[i], ..., starts[i] + lengths[i] - 1 joined into one array,
+        and alongside it the i of the run each index came from
+    """
+    owners = np.repeat(np.arange(len(lengths)), lengths)
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owners, starts[owners] + offsets
+
+
+class SPAPSolver:
+    def __init__(self, filename: str, output_flag=1, backend: str = "gurobi") -> None:
+        """
+        :param filename: str, the path to the file to read in the instance from.
+        :param output_flag: int, optional, default=1, whether the solver prints its progress.
+        :param backend: str, optional, default="gurobi", the MILP solver to use, "gurobi" or "highs", which is open source and needs no licence.
+        """
         self.filename = filename
         r = FileReader(filename)
 
-        # self._students originally has the form: student -> [project preferences, {project: assigned?}]
-        # after running _avoid_coalition, it will have the form: student -> [project preferences, {project: assigned?}, vertex label, {envy edge values}]
+        # self._students has the form: student -> [project preferences, {project: index of x_{ij}}]
         self._students = r.students
         self._projects = r.projects
         self._lecturers = r.lecturers
 
-        self.J = gp.Model("SPAP")
-        self.J.setParam('OutputFlag', output_flag)
+        self.J = MILPModel("SPAP", backend=backend, output_flag=output_flag)
 
         self.matching = defaultdict(str)
+        self._index_instance()
 
-    
-    def _assignment_constraints(self) -> None:
-        """
-        Variable constraints
-
-        x_{ij} \in {0, 1} s.t. (1 <= i <= |S|, 1 <= j <= |P|)
-        x_{ij} indicates whether s_i is assigned to p_j in a solution or not
 
-        \sum_{p_j \in A_i}(x_{ij}) <= 1 for all i in {1, 2, ..., |S|} # student can be assigned to at most one project
-        \sum_{i=1}^{|S|}(x_{ij}) <= c_j for all j in {1, 2, ..., |P|} # project does not exceed capacity
-        \sum_{i=1}^{|S|} \sum_{p_j \in P_k} x_{ij} <= d_k for all k in {1, 2, ..., |L|} # lecturer does not exceed capacity
+    def _index_instance(self) -> None:
         """
-
-        for student in self._students:
-            sum_student_variables = gp.LinExpr()
-            for project in self._students[student][0]:
-                xij = self.J.addVar(lb=0.0, ub=1.0, obj=0.0, vtype=GRB.BINARY, name=f"{student} is assigned {project}")
-                self._students[student][1][project] = xij
-                sum_student_variables += xij
-
-            # CONSTRAINT: student can be assigned to at most one project
-            self.J.addConstr(sum_student_variables <= 1, f"Constraint for {student}")
-
-        for project in self._projects:
-            total_project_capacity = gp.LinExpr()
-            for student in self._students:
-                if project in self._students[student][0]:
-                    total_project_capacity += self._students[student][1][project]
-
-            # CONSTRAINT: project does not exceed capacity
-            self.J.addConstr(total_project_capacity <= self._projects[project][0], f"Total capacity constraint for {project}")
-
-        for lecturer in self._lecturers:
-            total_lecturer_capacity = gp.LinExpr()
-            for student in self._students:
-                for project in self._students[student][0]:
-                    if lecturer == self._projects[project][1]:
-                        total_lecturer_capacity += self._students[student][1][project]
-
-            # CONSTRAINT: lecturer does not exceed capacity
-            self.J.addConstr(total_lecturer_capacity <= self._lecturers[lecturer][0], f"Total capacity constraint for {lecturer}")
+        Numbers the acceptable (student, project) pairs by student, then by the
+        student's preference, which is the order of the x_{ij} variables, so that
+        each student's pairs are consecutive. The ranks every constraint compares
+        are tabulated per pair, so the model is built from arrays, without searching
+        preference lists.
+        """
+        project_index = {project: j for j, project in enumerate(self._projects)}
+        lecturer_index = {lecturer: k for k, lecturer in enumerate(self._lecturers)}
+
+        # rank of each project in the preference list of the lecturer offering it
+        self._lecturer_rank = {
+            project: rank
+            for lecturer in self._lecturers
+            for rank, project in enumerate(self._lecturers[lecturer][1])
+        }
+        self._project_capacity = np.array([self._projects[p][0] for p in self._projects], dtype=float)
+        self._project_lecturer = np.array([lecturer_index[self._projects[p][1]] for p in self._projects], dtype=np.int64)
+        self._project_lecturer_rank = np.array([self._lecturer_rank[p] for p in self._projects], dtype=np.int64)
+        self._lecturer_capacity = np.array([self._lecturers[L][0] for L in self._lecturers], dtype=float)
+
+        self._pairs = []
+        pair_student, pair_project, pair_rank = [], [], []
+        for i, student in enumerate(self._students):
+            for rank, project in enumerate(self._students[student][0]):
+                self._students[student][1][project] = len(self._pairs)
+                self._pairs.append((student, project))
+                pair_student.append(i)
+                pair_project.append(project_index[project])
+                pair_rank.append(rank)
+
+        self._pair_student = np.array(pair_student, dtype=np.int64)
+        self._pair_project = np.array(pair_project, dtype=np.int64)
+        self._pair_rank = np.array(pair_rank, dtype=np.int64)
+        self._pair_lecturer = self._project_lecturer[self._pair_project]
+        self._pair_lecturer_rank = self._project_lecturer_rank[self._pair_project]
+
+        self._list_length = np.bincount(self._pair_student, minlength=len(self._students))
+        self._student_start = np.cumsum(self._list_length) - self._list_length
 
 
-    def _theta(self, student, project) -> gp.LinExpr:
-        """
-        theta_{ij} = 1 - (sum of x_{ij'} over projects p_{j'} equal or higher than p_j in student's preference list)    
-        theta_{ij} = 1 iff student unassigned or prefers p_j to the project she is assigned to
+    def _assignment_constraints(self) -> None:
         """
+        Variable constraints
 
-        theta_ij = gp.LinExpr()
-        sum_outranked_projects = gp.LinExpr()
-
-        student_preferences = self._students[student][0]
-        project_index = student_preferences.index(project)
+        x_{ij} \\in {0, 1} s.t. (1 <= i <= |S|, 1 <= j <= |P|)
+        x_{ij} indicates whether s_i is assigned to p_j in a solution or not
 
-        for p_jprime in student_preferences[:project_index+1]:
-            sum_outranked_projects += self._students[student][1][p_jprime]
+        \\sum_{p_j \\in A_i}(x_{ij}) <= 1 for all i in {1, 2, ..., |S|} # student can be assigned to at most one project
+        \\sum_{i=1}^{|S|}(x_{ij}) <= c_j for all j in {1, 2, ..., |P|} # project does not exceed capacity
+        \\sum_{i=1}^{|S|} \\sum_{p_j \\in P_k} x_{ij} <= d_k for all k in {1, 2, ..., |L|} # lecturer does not exceed capacity
+        """
+        self._x = self.J.add_vars(len(self._pairs))
 
-        theta_ij.addConstant(1.0)
-        theta_ij.add(sum_outranked_projects, -1.0)
+        # CONSTRAINT: student can be assigned to at most one project
+        self.J.add_constrs(self._pair_student, self._x, 1.0, upper=1.0, count=len(self._students))
+        # CONSTRAINT: project does not exceed capacity
+        self.J.add_constrs(self._pair_project, self._x, 1.0, upper=self._project_capacity, count=len(self._projects))
+        # CONSTRAINT: lecturer does not exceed capacity
+        self.J.add_constrs(self._pair_lecturer, self._x, 1.0, upper=self._lecturer_capacity, count=len(self._lecturers))
 
-        return theta_ij
-    
 
-    def _alpha(self, project) -> gp.Var:
+    def _alpha(self) -> np.ndarray:
         """
-        alpha_j \in {0, 1} s.t. (1 <= j <= |P|)
+        alpha_j \\in {0, 1} s.t. (1 <= j <= |P|)
         alpha_j indicates whether p_j is undersubscribed or not
-        """
-        alpha_j = self.J.addVar(lb=0.0, ub=1.0, obj=0.0, vtype=GRB.BINARY, name=f"{project} is undersubscribed")
-        c_j = self._projects[project][0]
-        project_occupancy = gp.LinExpr()
 
-        for student in self._students:
-            if project in self._students[student][0]:
-                project_occupancy += self._students[student][1][project]
+        Only depends on p_j, so one variable serves every student who finds p_j acceptable.
+        """
+        num_projects = len(self._projects)
+        alpha = self.J.add_vars(num_projects)
 
         # CONSTRAINT: ensures p_j is not oversubscribed
         # i.e. if undersubscribed, c_j - project_occupancy = remaining_space <= c_j
         # if not, c_j - project_occupancy = remaining_space = 0
-        self.J.addConstr(c_j * alpha_j >= c_j - project_occupancy, f"Constraint for {project}")
-        return alpha_j
-    
-
-    def _gamma(self, student, project) -> gp.LinExpr:
-        """
-        gamma_{ijk} = sum of x_{ij'} over projects p_{j'} strictly worse than p_j in lecturer's preference list
-        gamma_{ijk} = 1 implies student is assigned to a project p_j' where lecturer prefers p_j to p_j'
-        """
-        lecturer = self._projects[project][1]
-        lecturer_preferences = self._lecturers[lecturer][1]
-        student_preferences = self._students[student][0]
-
-        index_of_project = lecturer_preferences.index(project)
-        strictly_worse_projects = lecturer_preferences[index_of_project+1:]
-        intersection = set(strictly_worse_projects).intersection(set(student_preferences)) # projects that s_i has in common with l_k
-
-        gamma_ijk = gp.LinExpr()
-        gamma_ijk = gp.quicksum(self._students[student][1][p_jprime] for p_jprime in intersection)
-
-        return gamma_ijk
-    
-
-    def _beta(self, student, project) -> gp.LinExpr:
-        """
-        beta_{ik} = sum of x_{ij'} over projects p_{j'} offered by lecturer l_k
-        beta_{ik} = 1 iff s_i is assigned to a project offered by l_k
-        """
-        lecturer = self._projects[project][1]
-        lecturer_preferences = self._lecturers[lecturer][1]
-        student_preferences = self._students[student][0]
-
-        intersection = set(lecturer_preferences).intersection(set(student_preferences))
-        beta_ik = gp.LinExpr()
-        beta_ik = gp.quicksum(self._students[student][1][p_jprime] for p_jprime in intersection)
-
-        return beta_ik
-    
-
-    def _eta(self, project) -> gp.Var:
+        # written as c_j * alpha_j + project_occupancy >= c_j
+        self.J.add_constrs(
+            np.concatenate((np.arange(num_projects), self._pair_project)),
+            np.concatenate((alpha, self._x)),
+            np.concatenate((self._project_capacity, np.ones(len(self._pairs)))),
+            lower=self._project_capacity,
+            count=num_projects,
+        )
+        return alpha
+
+
+    def _eta(self) -> np.ndarray:
         """
-        eta_{jk} \in {0, 1} s.t. (1 <= j <= |P|, 1 <= k <= |L|)
+        eta_{jk} \\in {0, 1} s.t. (1 <= j <= |P|, 1 <= k <= |L|)
         eta_{jk} indicates whether l_k is undersubscribed or prefers p_j to his worst non-empty project
 
         D_{kj} = set of projects p_j' offered by l_k that are equal or higher than p_j in l_k's preference list
-        """
-        lecturer = self._projects[project][1]
-        d_k, lecturer_preferences, _, _ = self._lecturers[lecturer]
-        index_of_project = lecturer_preferences.index(project)
-        D_kj = lecturer_preferences[:index_of_project+1]
-
-        eta_jk = self.J.addVar(lb=0.0, ub=1.0, obj=0.0, vtype=GRB.BINARY, name=f"{lecturer} prefers {project} to his worst non-empty project")
-        lecturer_occupancy = gp.LinExpr()
-
-        for p_jprime in D_kj:
-            for student in self._students:
-                if p_jprime in self._students[student][0]:
-                    lecturer_occupancy += self._students[student][1][p_jprime]
 
+        Only depends on p_j, as l_k is the lecturer offering it, so one variable serves every student.
+        """
+        num_projects = len(self._projects)
+        eta = self.J.add_vars(num_projects)
+
+        # ordered by lecturer, then by the lecturer's rank of the project, the pairs
+        # with a project in D_{kj} are a run starting at the first of l_k's pairs
+        max_rank = len(self._pairs) + num_projects
+        keys = self._pair_lecturer * max_rank + self._pair_lecturer_rank
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.searchsorted(sorted_keys, self._project_lecturer * max_rank, side="left")
+        ends = np.searchsorted(sorted_keys, self._project_lecturer * max_rank + self._project_lecturer_rank, side="right")
+        projects, positions = _expand(starts, ends - starts)
+
+        d_k = self._lecturer_capacity[self._project_lecturer]
         # CONSTRAINT: ensures l_k is not oversubscribed
-        # similar logic to alpha_j
-        self.J.addConstr(d_k * eta_jk >= d_k - lecturer_occupancy, f"Constraint for {lecturer}")
-        return eta_jk
+        # similar logic to alpha_j, as d_k * eta_jk + lecturer_occupancy >= d_k
+        self.J.add_constrs(
+            np.concatenate((np.arange(num_projects), projects)),
+            np.concatenate((eta, self._x[order[positions]])),
+            np.concatenate((d_k, np.ones(len(positions)))),
+            lower=d_k,
+            count=num_projects,
+        )
+        return eta
 
 
     def _avoid_blocking_pair(self) -> None:
         """
         Blocking pair constraints
-        """
 
-        for student in self._students:
-            for project in self._students[student][0]:
-                alpha_j = self._alpha(project)
-                beta_ik = self._beta(student, project)
-                gamma_ijk = self._gamma(student, project)
-                eta_jk = self._eta(project)
-                theta_ij = self._theta(student, project)
+        theta_{ij} = 1 - (sum of x_{ij'} over projects p_{j'} equal or higher than p_j in student's preference list)
+        theta_{ij} = 1 iff student unassigned or prefers p_j to the project she is assigned to
+
+        beta_{ik} = sum of x_{ij'} over projects p_{j'} offered by lecturer l_k
+        beta_{ik} = 1 iff s_i is assigned to a project offered by l_k
+
+        gamma_{ijk} = sum of x_{ij'} over projects p_{j'} strictly worse than p_j in lecturer's preference list
+        gamma_{ijk} = 1 implies student is assigned to a project p_j' where lecturer prefers p_j to p_j'
 
-                # blocking pair 3a
-                self.J.addConstr(theta_ij + alpha_j + gamma_ijk <= 2, "Avoid blocking pair 3a")
-                # blocking pair 3b and 3c
-                self.J.addConstr(theta_ij + alpha_j + (1 - beta_ik) + eta_jk <= 3, "Avoid blocking pair 3b and 3c")
+        theta_{ij} + alpha_j + gamma_{ijk} <= 2 # blocking pair 3a
+        theta_{ij} + alpha_j + (1 - beta_{ik}) + eta_{jk} <= 3 # blocking pair 3b and 3c
+
+        with the constants moved to the right, and one of each constraint per pair
+        """
+        alpha = self._alpha()
+        eta = self._eta()
+        num_pairs = len(self._pairs)
+
+        # each pair against every pair of the same student, including itself
+        students = self._pair_student
+        owners, others = _expand(self._student_start[students], self._list_length[students])
+
+        prefix = self._pair_rank[others] <= self._pair_rank[owners]
+        same_lecturer = self._pair_lecturer[others] == self._pair_lecturer[owners]
+        worse_for_lecturer = same_lecturer & (self._pair_lecturer_rank[others] > self._pair_lecturer_rank[owners])
+
+        pairs = np.arange(num_pairs)
+        alpha_j = alpha[self._pair_project]
+        eta_j = eta[self._pair_project]
+
+        # blocking pair 3a, as -theta sum + alpha_j + gamma_{ijk} <= 1
+        self.J.add_constrs(
+            np.concatenate((owners[prefix], pairs, owners[worse_for_lecturer])),
+            np.concatenate((self._x[others[prefix]], alpha_j, self._x[others[worse_for_lecturer]])),
+            np.concatenate((-np.ones(prefix.sum()), np.ones(num_pairs), np.ones(worse_for_lecturer.sum()))),
+            upper=1.0,
+            count=num_pairs,
+        )
+        # blocking pair 3b and 3c, as -theta sum + alpha_j - beta_{ik} + eta_{jk} <= 1
+        self.J.add_constrs(
+            np.concatenate((owners[prefix], pairs, owners[same_lecturer], pairs)),
+            np.concatenate((self._x[others[prefix]], alpha_j, self._x[others[same_lecturer]], eta_j)),
+            np.concatenate((-np.ones(prefix.sum()), np.ones(num_pairs), -np.ones(same_lecturer.sum()), np.ones(num_pairs))),
+            upper=1.0,
+            count=num_pairs,
+        )
 
 
     def _avoid_coalition(self) -> None:
@@ -202,44 +227,63 @@ class GurobiSPAP:
         hence, we add constraints to ensure J admits a topological ordering
 
         e_{i i'} = 1 iff (s_i, s_i') in envy graph for s_i != s_i'
+
+        Only the pairs of students where s_i' finds acceptable a project s_i ranks
+        above another can envy, so only their e_{i i'} are needed.
         """
-        
-        # construct vertex labels for students
-        for student in self._students:
-            label = self.J.addVar(lb=1.0, ub=len(self._students), obj=0.0, vtype=GRB.INTEGER, name=f"Vertex label for {student}")
-            self._students[student].append(label)
-
-        for s1 in self._students:
-            self._students[s1].append(dict()) # entries for envy edge values
-            s1_preferences = self._students[s1][0]
-            for s2 in self._students:
-                if s1 != s2:
-                    envy_edge = self.J.addVar(lb=0.0, ub=1.0, obj=0.0, vtype=GRB.BINARY, name=f"{s1} envies {s2}")
-                    self._students[s1][3][s2] = envy_edge
-
-                    s2_preferences = self._students[s2][0]
-                    # for every p_jprime that s1 prefers to p_j s.t. s2 finds p_jprime acceptable
-                    for p_j in s1_preferences:
-                        index_of_p_j = s1_preferences.index(p_j)
-                        acceptable_projects = s1_preferences[:index_of_p_j]
-                        intersection = set(acceptable_projects).intersection(set(s2_preferences))
-
-                        for p_jprime in intersection:
-                            # CONSTRAINT: if s_i envies s_i', then e_{i i'} = 1
-                            self.J.addConstr(self._students[s1][3][s2] + 1 >= (self._students[s1][1][p_j] + self._students[s2][1][p_jprime]), "Construct envy arc")
-
-                    # construct integer variable v_i to label topological ordering
-                    # if e_{i i'} = 1, then v_i < v_i'
-                    topological_ordering_LHS = gp.LinExpr() # v_i corresponding to s1
-                    topological_ordering_LHS.add(self._students[s1][2], 1.0)
-
-                    topological_ordering_RHS = gp.LinExpr() # v_i' corresponding to s2
-                    topological_ordering_RHS.add(self._students[s2][2], 1.0)
-
-                    # CONSTRAINT: following inequality is true iff graph does not admit a directed cycle
-                    # v_i < v_i' + |S| ( 1 - e_{i i'} )
-                    self.J.addConstr(topological_ordering_LHS + 1 <= topological_ordering_RHS + len(self._students) * (1 - self._students[s1][3][s2]), "Avoid coalition")
-                    # gurobi does not support strict inequalities, hence the +1 and +|S|
+        num_students = len(self._students)
+        num_projects = len(self._projects)
+
+        # construct integer variable v_i to label topological ordering
+        labels = self.J.add_vars(num_students, lb=1.0, ub=num_students)
+
+        # s_i can only envy over a project p_j' they rank above some other project
+        can_envy = np.flatnonzero(self._pair_rank < self._list_length[self._pair_student] - 1)
+
+        # every other student s_i' who finds p_j' acceptable
+        by_project = np.argsort(self._pair_project, kind="stable")
+        project_count = np.bincount(self._pair_project, minlength=num_projects)
+        project_start = np.cumsum(project_count) - project_count
+        owners, positions = _expand(project_start[self._pair_project[can_envy]], project_count[self._pair_project[can_envy]])
+        envier_pairs = can_envy[owners]
+        envied_pairs = by_project[positions]
+        distinct = self._pair_student[envier_pairs] != self._pair_student[envied_pairs]
+        envier_pairs = envier_pairs[distinct]
+        envied_pairs = envied_pairs[distinct]
+
+        arcs, arc_of = np.unique(
+            self._pair_student[envier_pairs] * num_students + self._pair_student[envied_pairs],
+            return_inverse=True,
+        )
+        envy_edges = self.J.add_vars(len(arcs))
+
+        # CONSTRAINT: if s_i envies s_i', then e_{i i'} = 1
+        # for each p_j' that s_i prefers to p_j s.t. s_i' finds p_j' acceptable:
+        #   e_{i i'} + 1 >= x_{ij} + x_{i'j'}
+        # s_i is assigned at most one project, so the constraints for every p_j that
+        # s_i ranks below p_j' are summed into one, with the same integer solutions
+        student_end = self._student_start + self._list_length
+        num_envies = len(envier_pairs)
+        envies, worse = _expand(envier_pairs + 1, student_end[self._pair_student[envier_pairs]] - envier_pairs - 1)
+        self.J.add_constrs(
+            np.concatenate((np.arange(num_envies), np.arange(num_envies), envies)),
+            np.concatenate((envy_edges[arc_of], self._x[envied_pairs], self._x[worse])),
+            np.concatenate((np.ones(num_envies), -np.ones(num_envies), -np.ones(len(worse)))),
+            lower=-1.0,
+            count=num_envies,
+        )
+
+        # CONSTRAINT: following inequality is true iff graph does not admit a directed cycle
+        # v_i < v_i' + |S| ( 1 - e_{i i'} ), as v_i - v_i' + |S| e_{i i'} <= |S| - 1
+        # MILP solvers do not support strict inequalities, hence the +1 and +|S|
+        num_arcs = len(arcs)
+        self.J.add_constrs(
+            np.tile(np.arange(num_arcs), 3),
+            np.concatenate((labels[arcs // num_students], labels[arcs % num_students], envy_edges)),
+            np.concatenate((np.ones(num_arcs), -np.ones(num_arcs), np.full(num_arcs, float(num_students)))),
+            upper=num_students - 1.0,
+            count=num_arcs,
+        )
 
 
     def _objective_function(self) -> None:
@@ -247,59 +291,57 @@ class GurobiSPAP:
         Objective function
         Maximise number of matched student-project pairs
         """
-        total_x_ij_variables = gp.LinExpr()
-        for student in self._students:
-            for project in self._students[student][0]:
-                total_x_ij_variables += self._students[student][1][project]
-
-        self.J.setObjective(total_x_ij_variables, GRB.MAXIMIZE)
+        self.J.set_objective(self._x, np.ones(len(self._x)), maximise=True)
 
 
-    def solve(self) -> None:
+    def build_model(self) -> None:
         self._assignment_constraints()
         self._avoid_blocking_pair()
         self._avoid_coalition()
         self._objective_function()
 
+
+    def solve(self) -> None:
+        self.build_model()
         self.J.optimize()
-        
-        for student in self._students:
-            for project in self._students[student][0]:
-                if self.J.getVarByName(f"{student} is assigned {project}").x == 1.0:
-                    lecturer = self._projects[project][1]
 
-                    self.matching[student] = project
-                    self._projects[project][2] += 1
-                    self._lecturers[lecturer][2] += 1
+        # solvers may return integer values with a small error
+        for pair in np.flatnonzero(self.J.values[self._x] > 0.5):
+            student, project = self._pairs[pair]
+            lecturer = self._projects[project][1]
 
-                    l_k_worst_project = self._lecturers[lecturer][3]
-                    if l_k_worst_project is None:
-                        self._lecturers[lecturer][3] = project
-                    else:
-                        if self._lecturers[lecturer][1].index(l_k_worst_project) < self._lecturers[lecturer][1].index(project):
-                            self._lecturers[lecturer][3] = project
+            self.matching[student] = project
+            self._projects[project][2] += 1
+            self._lecturers[lecturer][2] += 1
 
-                    break
+            l_k_worst_project = self._lecturers[lecturer][3]
+            if l_k_worst_project is None or self._lecturer_rank[l_k_worst_project] < self._lecturer_rank[project]:
+                self._lecturers[lecturer][3] = project
 
 
     def display_assignments(self) -> None:
         # assumes model has been solved
-        for student in self._students:
-            for project in self._students[student][0]:
-                if self._students[student][1][project].x == 1: 
-                    print(f"{student} -> {project}")
+        for pair in np.flatnonzero(self.J.values[self._x] > 0.5):
+            student, project = self._pairs[pair]
+            print(f"{student} -> {project}")
+
+
+class GurobiSPAP(SPAPSolver):
+    def __init__(self, filename: str, output_flag=1) -> None:
+        super().__init__(filename, output_flag=output_flag, backend="gurobi")
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 GurobiSPAP.py <filename>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python3 SPAPSolver.py <filename> [gurobi | highs]")
         sys.exit(1)
 
     filename = sys.argv[1]
-    G = GurobiSPAP(filename)
+    backend = sys.argv[2] if len(sys.argv) == 3 else "gurobi"
+    G = SPAPSolver(filename, backend=backend)
     G.solve()
     G.display_assignments()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,11 +2,13 @@
 Given a solved instance of a SPA-P problem, check for blocking pairs and coalitions.
 """
 
-from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import GurobiSPAP
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import SPAPSolver
+
+from collections import defaultdict
 
 
 class StabilityChecker:
-    def __init__(self, solver: GurobiSPAP) -> None:
+    def __init__(self, solver: SPAPSolver) -> None:
         self.G = solver
 
         self._students = {student: self.G._students[student][0] for student in self.G._students}
@@ -46,13 +48,17 @@ class StabilityChecker:
         """
         lecturer = self._projects[project][1]
         worst_project = self._lecturers[lecturer][3]
+        if worst_project is None: # only when the lecturer has no capacity
+            return
+
         preference = self._lecturers[lecturer][1]
         if preference.index(project) < preference.index(worst_project):
             self.blocking_pair = True
 
 
     def check_blocking_pairs(self) -> None:
-        for student in self.G.matching:
+        # the matching only holds assigned students until it is looked up for the rest
+        for student in self._students:
             current_project = self.G.matching[student]
             # blocking pair (i)
             if current_project == '':
@@ -64,7 +70,7 @@ class StabilityChecker:
                         if self.blocking_pair:
                             break
 
-                        self._typec(student, project)
+                        self._typec(project)
                         if self.blocking_pair:
                             break
 
@@ -95,49 +101,57 @@ class StabilityChecker:
                 break
 
 
-    def _dfs(self, u, colour, found_cycle) -> None:
-        if found_cycle[0]:
-            return
-        
-        colour[u] = "grey" # nodes in current path are grey
-        for v in self._directed_graph[u]:
-            if colour[v] == "grey": # cycle exists
-                found_cycle[0] = True
-                return
-            
-            if colour[v] == "white":
-                self._dfs(v, colour, found_cycle)
+    def _dfs(self, root, colour) -> bool:
+        """
+        Searches from root with an explicit stack, so long paths cannot exceed the
+        recursion limit.
 
-        colour[u] = "black" # nodes is completely visited
+        :return: whether a cycle is reachable from root
+        """
+        colour[root] = "grey" # nodes in current path are grey
+        stack = [(root, iter(self._directed_graph[root]))]
+        while stack:
+            u, neighbours = stack[-1]
+            for v in neighbours:
+                if colour[v] == "grey": # cycle exists
+                    return True
+
+                if colour[v] == "white":
+                    colour[v] = "grey"
+                    stack.append((v, iter(self._directed_graph[v])))
+                    break
+            else:
+                colour[u] = "black" # nodes is completely visited
+                stack.pop()
+
+        return False
 
 
     def _check_cycle(self) -> bool:
         # source -- https://algocoding.wordpress.com/2015/04/02/detecting-cycles-in-a-directed-graph-with-dfs-python/
         
         colour = {u: "white" for u in self._directed_graph} # all nodes initially white (unvisited)
-        found_cycle = [False]
-
-        for u in self._directed_graph:
-            if colour[u] == "white":
-                self._dfs(u, colour, found_cycle)
-            if found_cycle[0]:
-                break
-
-        return found_cycle[0]
+        return any(colour[u] == "white" and self._dfs(u, colour) for u in self._directed_graph)
 
 
     def check_coalitions(self) -> None:
-        for s1 in self._students:
-            self._directed_graph[s1] = []
-            for s2 in self._students:
-                if s1 != s2 and self.G.matching[s1] != '' and self.G.matching[s2] != '':
-                    current_project = self.G.matching[s1]
-                    preferred_project = self.G.matching[s2]
-                    prefence = self._students[s1]
-
-                    if preferred_project in prefence and (prefence.index(preferred_project) < prefence.index(current_project)):
-                        self._directed_graph[s1].append(s2)
+        # students point to the projects they prefer to their own, and projects to the
+        # students assigned to them, so a cycle is a coalition, found without
+        # comparing every pair of students
+        holders = defaultdict(list)
+        for student in self._students:
+            if self.G.matching[student] != '':
+                holders[self.G.matching[student]].append(student)
+
+        for student in self._students:
+            current_project = self.G.matching[student]
+            if current_project == '':
+                continue
+            prefence = self._students[student]
+            preferred_projects = prefence[:prefence.index(current_project)]
+            self._directed_graph[student] = [project for project in preferred_projects if project in holders]
 
+        self._directed_graph.update(holders)
         self.coalition = self._check_cycle()
 
     
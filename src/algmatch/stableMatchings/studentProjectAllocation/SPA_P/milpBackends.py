@@ -0,0 +1,210 @@
+"""
+A mixed integer linear program, built independently of the solver that solves it.
+Stores implementations of:
+- Blocks of variables, and of constraints given as sparse coordinate arrays
+- Backends that hand the finished model to Gurobi, or to HiGHS through SciPy
+"""
+
+import numpy as np
+
+
+class MILPModel:
+    def __init__(
+        self, name: str, backend: str = "gurobi", output_flag: int = 1
+    ) -> None:
+        """
+        :param name: str, the name of the model, as shown by the solver
+        :param backend: str, optional, default="gurobi", the solver to use, "gurobi" or "highs"
+        :param output_flag: int, optional, default=1, whether the solver prints its progress
+        """
+        assert backend in BACKENDS, (
+            f"Backend must be one of {', '.join(map(repr, BACKENDS))}"
+        )
+        self.name = name
+        self.backend = BACKENDS[backend]()
+        self.output_flag = output_flag
+
+        # each block holds arrays for a run of variables, or of constraints, and the
+        # empty first blocks let them be concatenated even before any are added
+        self.num_vars = 0
+        self._var_blocks = [(np.zeros(0), np.zeros(0), np.zeros(0, dtype=bool))]
+
+        # constraint r has row_lower[r] <= sum of A[r, i] x_i <= row_upper[r], where
+        # A is given by its nonzero entries; repeated entries are summed
+        self.num_rows = 0
+        self._entry_blocks = [(np.zeros(0, dtype=np.int64),) * 2 + (np.zeros(0),)]
+        self._bound_blocks = [(np.zeros(0), np.zeros(0))]
+
+        self._objective = (np.zeros(0, dtype=np.int64), np.zeros(0))
+        self.maximise = True
+        self.values = None
+
+    def add_vars(self, count: int, lb=0.0, ub=1.0, integer: bool = True) -> np.ndarray:
+        """
+        :param lb: float or array, the lower bound of each variable
+        :param ub: float or array, the upper bound of each variable
+        :return: array, the indices of the new variables
+        """
+        indices = np.arange(self.num_vars, self.num_vars + count)
+        self._var_blocks.append(
+            (
+                np.broadcast_to(np.asarray(lb, dtype=float), (count,)),
+                np.broadcast_to(np.asarray(ub, dtype=float), (count,)),
+                np.full(count, integer),
+            )
+        )
+        self.num_vars += count
+        return indices
+
+    def add_constrs(
+        self, rows, cols, coefficients, lower=-np.inf, upper=np.inf, count=None
+    ) -> None:
+        """
+        Adds a block of constraints, numbered from 0 within the block.
+
+        :param rows: array, the constraint of each nonzero entry
+        :param cols: array, the variable of each nonzero entry
+        :param coefficients: float or array, the value of each nonzero entry
+        :param lower: float or array, the lower bound of each constraint
+        :param upper: float or array, the upper bound of each constraint
+        :param count: int, optional, the number of constraints, if some rows are empty
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if count is None:
+            count = int(rows.max()) + 1 if len(rows) else 0
+        cols = np.asarray(cols, dtype=np.int64)
+        coefficients = np.broadcast_to(
+            np.asarray(coefficients, dtype=float), cols.shape
+        )
+
+        self._entry_blocks.append((rows + self.num_rows, cols, coefficients))
+        self._bound_blocks.append(
+            (
+                np.broadcast_to(np.asarray(lower, dtype=float), (count,)),
+                np.broadcast_to(np.asarray(upper, dtype=float), (count,)),
+            )
+        )
+        self.num_rows += count
+
+    def set_objective(self, cols, coefficients, maximise: bool = True) -> None:
+        self._objective = (np.asarray(cols, dtype=np.int64), coefficients)
+        self.maximise = maximise
+
+    def objective(self) -> np.ndarray:
+        """
+        :return: array, the objective coefficient of every variable
+        """
+        c = np.zeros(self.num_vars)
+        np.add.at(c, *self._objective)
+        return c
+
+    def variable_bounds(self) -> tuple:
+        """
+        :return: tuple of arrays, the lower and upper bounds, and integrality, of every variable
+        """
+        return tuple(np.concatenate(arrays) for arrays in zip(*self._var_blocks))
+
+    def constraint_entries(self) -> tuple:
+        """
+        :return: tuple of arrays, the rows, columns and coefficients of the nonzero
+            entries of the constraint matrix, then the lower and upper bounds of its rows
+        """
+        rows, cols, coefficients = (
+            np.concatenate(arrays) for arrays in zip(*self._entry_blocks)
+        )
+        lower, upper = (np.concatenate(arrays) for arrays in zip(*self._bound_blocks))
+        return rows, cols, coefficients, lower, upper
+
+    def optimize(self) -> None:
+        self.values = self.backend.solve(self)
+
+
+class AbstractMILPBackend:
+    def solve(self, model: MILPModel) -> np.ndarray:
+        """
+        :param model: MILPModel, the model to solve
+        :return: array, the optimal value of each variable
+        """
+        raise NotImplementedError("No method for solving the model")
+
+
+class GurobiBackend(AbstractMILPBackend):
+    def solve(self, model: MILPModel) -> np.ndarray:
+        try:
+            import gurobipy as gp
+            from gurobipy import GRB
+            from scipy.sparse import csr_array
+        except ImportError as e:
+            raise ImportError(
+                "The Gurobi backend requires gurobipy and SciPy, which can be installed with: pip install algmatch[gurobi]"
+            ) from e
+
+        J = gp.Model(model.name)
+        J.setParam("OutputFlag", model.output_flag)
+
+        lb, ub, integer = model.variable_bounds()
+        binary = integer & (lb == 0) & (ub == 1)
+        vtype = np.where(
+            binary, GRB.BINARY, np.where(integer, GRB.INTEGER, GRB.CONTINUOUS)
+        )
+        x = J.addMVar(model.num_vars, lb=lb, ub=ub, vtype=vtype)
+
+        rows, cols, coefficients, lower, upper = model.constraint_entries()
+        # summing repeated entries, as the conversion to compressed rows does
+        A = csr_array(
+            (coefficients, (rows, cols)), shape=(model.num_rows, model.num_vars)
+        )
+        for bounds, sense in ((upper, GRB.LESS_EQUAL), (lower, GRB.GREATER_EQUAL)):
+            finite = np.flatnonzero(np.isfinite(bounds))
+            if len(finite):
+                J.addMConstr(A[finite], x, sense, bounds[finite])
+
+        J.setObjective(
+            model.objective() @ x, GRB.MAXIMIZE if model.maximise else GRB.MINIMIZE
+        )
+
+        J.optimize()
+        if J.SolCount == 0:
+            raise RuntimeError(f"Gurobi found no solution for {model.name}")
+        return x.X
+
+
+class HiGHSBackend(AbstractMILPBackend):
+    def solve(self, model: MILPModel) -> np.ndarray:
+        try:
+            from scipy.optimize import Bounds, LinearConstraint, milp
+            from scipy.sparse import csr_array
+        except ImportError as e:
+            raise ImportError(
+                "The HiGHS backend requires SciPy, which can be installed with: pip install algmatch[highs]"
+            ) from e
+
+        lb, ub, integer = model.variable_bounds()
+        rows, cols, coefficients, lower, upper = model.constraint_entries()
+        A = csr_array(
+            (coefficients, (rows, cols)), shape=(model.num_rows, model.num_vars)
+        )
+
+        constraints = []
+        if model.num_rows:
+            constraints.append(LinearConstraint(A, lower, upper))
+        # milp only minimises
+        c = -model.objective() if model.maximise else model.objective()
+        result = milp(
+            c,
+            integrality=integer.astype(int),
+            bounds=Bounds(lb, ub),
+            constraints=constraints,
+            options={"disp": bool(model.output_flag)},
+        )
+        if result.x is None:
+            raise RuntimeError(
+                f"HiGHS found no solution for {model.name}: {result.message}"
+            )
+        return result.x
+
+
+BACKENDS = {
+    "gurobi": GurobiBackend,
+    "highs": HiGHSBackend,
+}
@@ -2,7 +2,9 @@
 Class to read in a file of preferences for the Student Project Allocation stable matching algorithm.
 """
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from itertools import islice
+
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     ParticipantQuantityError,
     CapacityError,
@@ -27,88 +29,85 @@ class FileReader(AbstractReader):
         self.lecturers = {}
         cur_line = 1
 
+        student_names = NameTable("s")
+        project_names = NameTable("p")
+        lecturer_names = NameTable("l")
+
+        # the file is streamed a line at a time, so it is never held in memory whole
         with open(self.data, "r") as file:
-            file = file.read().splitlines()
-
-        try:
-            self.no_students, self.no_projects, self.no_lecturers = map(
-                int, file[0].split()
-            )
-        except (ValueError, IndexError):
-            raise ParticipantQuantityError()
-
-        # build students dictionary
-        for elt in file[1 : self.no_students + 1]:
-            cur_line += 1
-            entry = elt.split()
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("student", cur_line, line=True)
-            student = f"s{entry[0]}"
-            if student in self.students:
-                raise RepeatIDError("student", cur_line, line=True)
-
-            for i in entry[1:]:
-                if not i.isdigit():
-                    raise PrefListMisformatError("student", cur_line, i, line=True)
-            preferences = [f"p{k}" for k in entry[1:]]
-
-            rank = {proj: idx for idx, proj in enumerate(preferences)}
-            self.students[student] = {"list": preferences, "rank": rank}
-
-        # build projects dictionary
-        for elt in file[self.no_students + 1 : self.no_students + self.no_projects + 1]:
-            cur_line += 1
-            entry = elt.split()
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("project", cur_line, line=True)
-            project = f"p{entry[0]}"
-            if project in self.projects:
-                raise RepeatIDError("project", cur_line, line=True)
-
-            if not entry[1].isdigit():
-                raise CapacityError("project", cur_line, line=True)
-            capacity = int(entry[1])
-
-            if not entry[2].isdigit():
-                raise OffererError("project", "lecturer", cur_line, line=True)
-            offerer = f"l{entry[2]}"
-
-            self.projects[project] = {
-                "lower_quota": 0,
-                "upper_quota": capacity,
-                "lecturer": offerer,
-            }
-
-        # build lecturers dictionary
-        for elt in file[
-            self.no_students + self.no_projects + 1 : self.no_students
-            + self.no_projects
-            + self.no_lecturers
-            + 1
-        ]:
-            cur_line += 1
-            entry = elt.split()
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("lecturer", cur_line, line=True)
-            lecturer = f"l{entry[0]}"
-            if lecturer in self.lecturers:
-                raise RepeatIDError("lecturer", cur_line, line=True)
-
-            if not entry[1].isdigit():
-                raise CapacityError("lecturer", cur_line, line=True)
-            capacity = int(entry[1])
-
-            for i in entry[2:]:
-                if not i.isdigit():
-                    raise PrefListMisformatError("lecturer", cur_line, i, line=True)
-            preferences = [f"s{i}" for i in entry[2:]]
-
-            self.lecturers[lecturer] = {
-                "upper_quota": capacity,
-                "projects": set(),
-                "list": preferences,
-                "rank": rank,
-            }
+            try:
+                self.no_students, self.no_projects, self.no_lecturers = map(
+                    int, file.readline().split()
+                )
+            except ValueError:
+                raise ParticipantQuantityError()
+
+            # build students dictionary
+            for elt in islice(file, self.no_students):
+                cur_line += 1
+                entry = elt.split()
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("student", cur_line, line=True)
+                student = student_names[entry[0]]
+                if student in self.students:
+                    raise RepeatIDError("student", cur_line, line=True)
+
+                for i in entry[1:]:
+                    if not i.isdigit():
+                        raise PrefListMisformatError("student", cur_line, i, line=True)
+                preferences = [project_names[k] for k in entry[1:]]
+
+                self.students[student] = {"list": preferences, "rank": {}}
+
+            # build projects dictionary
+            for elt in islice(file, self.no_projects):
+                cur_line += 1
+                entry = elt.split()
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("project", cur_line, line=True)
+                project = project_names[entry[0]]
+                if project in self.projects:
+                    raise RepeatIDError("project", cur_line, line=True)
+
+                if not entry[1].isdigit():
+                    raise CapacityError("project", cur_line, line=True)
+                capacity = int(entry[1])
+
+                if not entry[2].isdigit():
+                    raise OffererError("project", "lecturer", cur_line, line=True)
+                offerer = lecturer_names[entry[2]]
+
+                self.projects[project] = {
+                    "lower_quota": 0,
+                    "upper_quota": capacity,
+                    "lecturer": offerer,
+                }
+
+            # build lecturers dictionary
+            for elt in islice(file, self.no_lecturers):
+                cur_line += 1
+                entry = elt.split()
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("lecturer", cur_line, line=True)
+                lecturer = lecturer_names[entry[0]]
+                if lecturer in self.lecturers:
+                    raise RepeatIDError("lecturer", cur_line, line=True)
+
+                if not entry[1].isdigit():
+                    raise CapacityError("lecturer", cur_line, line=True)
+                capacity = int(entry[1])
+
+                for i in entry[2:]:
+                    if not i.isdigit():
+                        raise PrefListMisformatError("lecturer", cur_line, i, line=True)
+                preferences = [student_names[i] for i in entry[2:]]
+
+                self.lecturers[lecturer] = {
+                    "upper_quota": capacity,
+                    "projects": set(),
+                    "list": preferences,
+                    "rank": {},
+                }
@@ -2,6 +2,9 @@
 Student Project Allocation - Lecturer Optimal version
 """
 
+from collections import deque
+from heapq import heappop, heappush
+
 from algmatch.stableMatchings.studentProjectAllocation.noTies.spaAbstract import SPAAbstract
 
 
@@ -11,89 +14,132 @@ class SPALecturerOptimal(SPAAbstract):
     ) -> None:
         super().__init__(filename=filename, dictionary=dictionary)
 
-        self.under_subscribed_lecturers = list(self.lecturers.keys())
+        # lecturers that may be under-subscribed with a pair left to offer
+        self.under_subscribed_lecturers = deque(self.lecturers)
+        self._queued = {lecturer: True for lecturer in self.lecturers}
+
+        # rank of the best project each student has been assigned; every project
+        # they rank no better has, in effect, been deleted from their list
+        self._best_rank = {}
+        # index of the first student on each project's list who may still be
+        # offered it; those before have been offered it, or have since been
+        # assigned a project they prefer, so never need considering again
+        self._cursor = {project: 0 for project in self.projects}
+        # per lecturer, heap of (lecturer's rank of the student at the cursor,
+        # student's rank of the project, project) over their under-subscribed
+        # projects; keys only grow, so stale ones are fixed when they reach the top
+        self._offers = {lecturer: [] for lecturer in self.lecturers}
+        self._in_offers = {project: False for project in self.projects}
 
         for student in self.students:
             self.M[student] = {"assigned": None}
+            self._best_rank[student] = len(self.students[student]["list"])
 
         for project in self.projects:
             self.M[project] = {"assigned": set()}
+            if self.projects[project]["upper_quota"] > 0:
+                self._push_offer(project)
 
         for lecturer in self.lecturers:
             self.M[lecturer] = {"assigned": set()}
 
-    def _delete(self, student, project):
-        self.students[student]["list"].remove(project)
-        self.projects[project]["list"].remove(student)
-
-    def _check_pair_conditions(self, s_i, p_j, L_k):
-        # s_i is not provisionally assigned to p_j
-        # and p_j in P_k is under subscribed
-        # and s_i in L_k^j
-
+    def _is_valid(self, student, project):
+        # the student has neither been assigned the project nor something better
+        return self.students[student]["rank"][project] < self._best_rank[student]
+
+    def _cursor_student(self, project):
+        """
+        Moves the project's cursor past the students who can no longer be offered it.
+
+        :return: the first student on the project's list who can, or None
+        """
+        p_list = self.projects[project]["list"]
+        idx = self._cursor[project]
+        while idx < len(p_list) and not self._is_valid(p_list[idx], project):
+            idx += 1
+        self._cursor[project] = idx
+        return p_list[idx] if idx < len(p_list) else None
+
+    def _offer_key(self, project):
+        student = self._cursor_student(project)
+        if student is None:
+            return None
+        lecturer = self.projects[project]["lecturer"]
         return (
-            self.M[s_i]["assigned"] != p_j
-            and p_j in self.lecturers[L_k]["projects"]
-            and len(self.M[p_j]["assigned"]) < self.projects[p_j]["upper_quota"]
+            self.lecturers[lecturer]["rank"][student],
+            self.students[student]["rank"][project],
+            project,
         )
 
+    def _push_offer(self, project):
+        key = self._offer_key(project)
+        if key is not None:
+            lecturer = self.projects[project]["lecturer"]
+            heappush(self._offers[lecturer], key)
+            self._in_offers[project] = True
+
+    def _is_under_subscribed(self, project):
+        return len(self.M[project]["assigned"]) < self.projects[project]["upper_quota"]
+
     def _find_valid_pair(self, L_k):
-        # s_i is first valid on L_k list
-        # p_j is first valid on s_i list
+        # s_i is the first student on L_k's list who can be offered some
+        # under-subscribed project of L_k, and p_j is the first such on s_i's list
+        offers = self._offers[L_k]
+        while offers:
+            key = heappop(offers)
+            p_j = key[2]
+            if not self._is_under_subscribed(p_j):
+                self._in_offers[p_j] = False
+                continue
 
-        for s_i in self.lecturers[L_k]["list"]:
-            for p_j in self.students[s_i]["list"]:
-                if self._check_pair_conditions(s_i, p_j, L_k):
-                    return (s_i, p_j)
+            current_key = self._offer_key(p_j)
+            if current_key is None:
+                self._in_offers[p_j] = False
+            elif current_key != key:
+                heappush(offers, current_key)
+            else:
+                # stays in the heap, to be looked at again once s_i is assigned it
+                heappush(offers, key)
+                return (self.projects[p_j]["list"][self._cursor[p_j]], p_j)
+        return None
 
     def _break_assignment(self, student):
         p = self.M[student]["assigned"]
         L = self.projects[p]["lecturer"]
         self.M[student]["assigned"] = None
         self.M[p]["assigned"].remove(student)
-
-        # add under-subscribed lecturer to under_subscribed_lecturers
-        if len(self.M[p]["assigned"]) == self.projects[p]["lower_quota"]:
-            self.under_subscribed_lecturers.insert(int(L[1:]) - 1, L)
-
         self.M[L]["assigned"].remove(student)
 
+        # p and L may now have room for students they passed over while full
+        if not self._in_offers[p]:
+            self._push_offer(p)
+        if not self._queued[L]:
+            self.under_subscribed_lecturers.append(L)
+            self._queued[L] = True
+
     def _provisionally_assign(self, student, project, lecturer):
         self.M[student]["assigned"] = project
         self.M[project]["assigned"].add(student)
         self.M[lecturer]["assigned"].add(student)
 
+        # deletes (s_i, p) for each successor p of p_j on s_i's list
+        self._best_rank[student] = self.students[student]["rank"][project]
+
     def _while_loop(self):
         while len(self.under_subscribed_lecturers) > 0:
-            L_k = self.under_subscribed_lecturers[0]
-            pair = self._find_valid_pair(L_k)
-
-            if pair is not None:
+            L_k = self.under_subscribed_lecturers.popleft()
+            self._queued[L_k] = False
+
+            while len(self.M[L_k]["assigned"]) < self.lecturers[L_k]["upper_quota"]:
+                pair = self._find_valid_pair(L_k)
+                if pair is None:
+                    # L_k has nothing to offer until one of its students leaves
+                    break
                 s_i, p_j = pair
-            else:
-                # cannot find a valid pair, continue to next lecturer
-                self.under_subscribed_lecturers.remove(L_k)
-                continue
-
-            # if s_i is provisionally assigned to some project p, break assignment
-            if self.M[s_i]["assigned"] is not None:
-                self._break_assignment(s_i)
-
-            # provisionally assign s_i to p_j and to L_k
-            self._provisionally_assign(s_i, p_j, L_k)
-
-            # for each successor p of p_j on s_i's list, delete (s_i, p)
-            p_j_pos = self.students[s_i]["list"].index(p_j)
-            for p in self.students[s_i]["list"][p_j_pos + 1 :]:
-                self._delete(s_i, p)
 
-            # check if lecturer is still under subscribed
-            # TODO: check is this necessary since we are re-building list anyway?
-            if len(self.M[L_k]["assigned"]) == self.lecturers[L_k]["upper_quota"]:
-                self.under_subscribed_lecturers.remove(L_k)
+                # if s_i is provisionally assigned to some project p, break assignment
+                if self.M[s_i]["assigned"] is not None:
+                    self._break_assignment(s_i)
 
-            # build under subscribed list
-            self.under_subscribed_lecturers = []
-            for L in self.lecturers:
-                if len(self.M[L]["assigned"]) < self.lecturers[L]["upper_quota"]:
-                    self.under_subscribed_lecturers.append(L)
+                # provisionally assign s_i to p_j and to L_k
+                self._provisionally_assign(s_i, p_j, L_k)
@@ -2,9 +2,10 @@
 Class to read in a dictionary of preferences for the SPAST stable matching algorithms.
 """
 
+from itertools import islice
 from re import findall
 
-from algmatch.abstractClasses.abstractReader import AbstractReader
+from algmatch.abstractClasses.abstractReader import AbstractReader, NameTable
 from algmatch.errors.ReaderErrors import (
     CapacityError,
     IDMisformatError,
@@ -26,7 +27,7 @@ class FileReader(AbstractReader):
     def regex_split(self, line):
         return findall(r"\d+|[\(\)]", line)
 
-    def _scan_preference_tokens(self, token_list, side, pref_char):
+    def _scan_preference_tokens(self, token_list, side, pref_names):
         preferences = []
         in_tie = False
         cur_set = set()
@@ -40,13 +41,12 @@ class FileReader(AbstractReader):
                 if not in_tie:
                     raise UnopenedTieError(side, self.cur_line)
                 in_tie = False
-                preferences.append(cur_set.copy())
-                cur_set.clear()
+                preferences.append(cur_set)
+                cur_set = set()
+            elif in_tie:
+                cur_set.add(pref_names[token])
             else:
-                cur_set.add(pref_char + token)
-                if not in_tie:
-                    preferences.append(cur_set.copy())
-                    cur_set.clear()
+                preferences.append({pref_names[token]})
         if in_tie:
             raise UnclosedTieError(side, self.cur_line)
         return preferences
@@ -60,73 +60,77 @@ class FileReader(AbstractReader):
         self.lecturers = {}  # assume number of lecturers <= number of projects
         self.cur_line = 1
 
+        student_names = NameTable("s")
+        project_names = NameTable("p")
+        lecturer_names = NameTable("l")
+
+        # the file is streamed a line at a time, so it is never held in memory whole
         with open(self.data, "r") as file:
-            file = file.read().splitlines()
-
-        try:
-            self.no_students, self.no_projects, self.no_lecturers = map(
-                int, file[0].split()
-            )
-        except ValueError:
-            raise ParticipantQuantityError()
-
-        # build student dictionary
-        for elt in file[1 : self.no_residents + 1]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("student", self.cur_line, line=True)
-            student = f"s{entry[0]}"
-            if student in self.students:
-                raise RepeatIDError("student", self.cur_line, line=True)
-
-            preferences = self._scan_preference_tokens(entry[1:], "student", "p")
-            self.students[student] = {"list": preferences, "rank": {}}
-
-        # build projects dictionary
-        projects_start = self.no_students + 1
-        projects_end = projects_start + self.no_projects
-        for elt in file[projects_start:projects_end]:
-            self.cur_line += 1
-            entry = elt.split()
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("project", self.cur_line, line=True)
-            project = f"p{entry[0]}"
-            if project in self.projects:
-                raise RepeatIDError("project", self.cur_line, line=True)
-
-            if not entry[1].isdigit():
-                raise CapacityError("project", self.cur_line, line=True)
-            capacity = int(entry[1])
-
-            if not entry[2].isdigit():
-                raise OffererError("project", "lecturer", self.cur_line, line=True)
-            offerer = f"l{entry[2]}"
-
-            self.projects[project] = {"capacity": capacity, "lecturer": offerer}
-
-        # build lecturers dictionary
-        lecturers_end = projects_end + self.no_lecturers
-        for elt in file[projects_end:lecturers_end]:
-            self.cur_line += 1
-            entry = self.regex_split(elt)
-
-            if not entry or not entry[0].isdigit():
-                raise IDMisformatError("lecturer", self.cur_line, line=True)
-            lecturer = f"l{entry[0]}"
-            if lecturer in self.lecturer:
-                raise RepeatIDError("lecturer", self.cur_line, line=True)
-
-            if not entry[1].isdigit():
-                raise CapacityError("lecturer", self.cur_line, line=True)
-            capacity = int(entry[1])
-
-            preferences = self._scan_preference_tokens(entry[2:], "lecturer", "s")
-            self.lecturers[lecturer] = {
-                "capacity": capacity,
-                "projects": set(),
-                "list": preferences,
-                "rank": {},
-            }
+            try:
+                self.no_students, self.no_projects, self.no_lecturers = map(
+                    int, file.readline().split()
+                )
+            except ValueError:
+                raise ParticipantQuantityError()
+
+            # build student dictionary
+            for elt in islice(file, self.no_students):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("student", self.cur_line, line=True)
+                student = student_names[entry[0]]
+                if student in self.students:
+                    raise RepeatIDError("student", self.cur_line, line=True)
+
+                preferences = self._scan_preference_tokens(
+                    entry[1:], "student", project_names
+                )
+                self.students[student] = {"list": preferences, "rank": {}}
+
+            # build projects dictionary
+            for elt in islice(file, self.no_projects):
+                self.cur_line += 1
+                entry = elt.split()
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("project", self.cur_line, line=True)
+                project = project_names[entry[0]]
+                if project in self.projects:
+                    raise RepeatIDError("project", self.cur_line, line=True)
+
+                if not entry[1].isdigit():
+                    raise CapacityError("project", self.cur_line, line=True)
+                capacity = int(entry[1])
+
+                if not entry[2].isdigit():
+                    raise OffererError("project", "lecturer", self.cur_line, line=True)
+                offerer = lecturer_names[entry[2]]
+
+                self.projects[project] = {"capacity": capacity, "lecturer": offerer}
+
+            # build lecturers dictionary
+            for elt in islice(file, self.no_lecturers):
+                self.cur_line += 1
+                entry = self.regex_split(elt)
+
+                if not entry or not entry[0].isdigit():
+                    raise IDMisformatError("lecturer", self.cur_line, line=True)
+                lecturer = lecturer_names[entry[0]]
+                if lecturer in self.lecturers:
+                    raise RepeatIDError("lecturer", self.cur_line, line=True)
+
+                if not entry[1].isdigit():
+                    raise CapacityError("lecturer", self.cur_line, line=True)
+                capacity = int(entry[1])
+
+                preferences = self._scan_preference_tokens(
+                    entry[2:], "lecturer", student_names
+                )
+                self.lecturers[lecturer] = {
+                    "capacity": capacity,
+                    "projects": set(),
+                    "list": preferences,
+                    "rank": {},
+                }
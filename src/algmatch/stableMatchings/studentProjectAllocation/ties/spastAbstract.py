@@ -4,9 +4,11 @@ Student Project Allocation With Lecturer Preferences Over Students
 - Abstract class
 """
 
-from copy import deepcopy
+from heapq import heappop, heappush
 import os
 
+from algmatch.abstractClasses.tiedPreferenceList import TiedPreferenceList
+from algmatch.stabilityCheckers.spaStabilityChecker import SPAStabilityChecker
 from algmatch.stableMatchings.studentProjectAllocation.ties.spastPreferenceInstance import (
     SPASTPreferenceInstance,
 )
@@ -39,22 +41,27 @@ class SPASTAbstract:
         self.students = self._reader.students
         self.projects = self._reader.projects
         self.lecturers = self._reader.lecturers
-
-        # we need original copies of the preference lists to check the stability of solutions
-        self.original_students = deepcopy(self.students)
-        self.original_lecturers = deepcopy(self.lecturers)
+        for prefs in (
+            *self.students.values(),
+            *self.projects.values(),
+            *self.lecturers.values(),
+        ):
+            prefs["list"] = TiedPreferenceList(prefs["list"], prefs["rank"])
 
         self.M = {}  # provisional matching
+        # kept up to date by _assign and _break_assignment, so that the solvers need
+        # not recount them on every proposal
+        self._lecturer_occupancy = {lecturer: 0 for lecturer in self.lecturers}
+        # number of the lecturer's projects the student is assigned to, by pair
+        self._lecturer_links = {}
+        # heaps of (-rank, student), so the worst student assigned comes first;
+        # students who have since left are only removed when they reach the top
+        self._worst_heaps = {p: [] for p in self.projects}
+        self._worst_heaps |= {lecturer: [] for lecturer in self.lecturers}
         self.stable_matching = {
             "student_sided": {student: "" for student in self.students},
             "lecturer_sided": {lecturer: set() for lecturer in self.lecturers},
         }
-
-        self.super_blocking_conditions = (
-            self._blocking_pair_bi,
-            self._blocking_pair_bii,
-            self._blocking_pair_biii,
-        )
         self.is_stable = False
 
     @staticmethod
@@ -65,96 +72,25 @@ class SPASTAbstract:
             "Stability type must be either 'super' or 'strong'"
         )
 
-    def _get_lecturer_worst_existing_student(self, lecturer):
-        existing_students = self.M[lecturer]["assigned"]
-
-        if len(existing_students) == 0:
-            return None
-
-        def rank_comparator(x):
-            return -self.lecturers[lecturer]["rank"][x]
+    def _get_worst_existing_student(self, participant):
+        assigned = self.M[participant]["assigned"]
+        heap = self._worst_heaps[participant]
+        while heap and heap[0][1] not in assigned:
+            heappop(heap)
+        return heap[0][1] if heap else None
 
-        return min(existing_students, key=rank_comparator)
+    def _get_lecturer_worst_existing_student(self, lecturer):
+        return self._get_worst_existing_student(lecturer)
 
     def _get_project_worst_existing_student(self, project):
-        existing_students = self.M[project]["assigned"]
-
-        if len(existing_students) == 0:
-            return None
-
-        def rank_comparator(x):
-            return -self.projects[project]["rank"][x]
-
-        return min(existing_students, key=rank_comparator)
-
-    def _blocking_pair_bi(self, _, project, lecturer):
-        cj = self.projects[project]["capacity"]
-        dk = self.original_lecturers[lecturer]["capacity"]
-
-        project_occupancy = len(self.M[project]["assigned"])
-        lecturer_occupancy = len(self.M[lecturer]["assigned"])
-
-        if project_occupancy < cj and lecturer_occupancy < dk:
-            return True
-        return False
-
-    def _blocking_pair_bii(self, student, project, lecturer):
-        cj = self.projects[project]["capacity"]
-        dk = self.original_lecturers[lecturer]["capacity"]
-
-        project_occupancy = len(self.M[project]["assigned"])
-        lecturer_occupancy = len(self.M[lecturer]["assigned"])
-
-        if project_occupancy < cj and lecturer_occupancy == dk:
-            Mlk_students = self.M[lecturer]["assigned"]
-            if student in Mlk_students:  # s_i \in M(lk)
-                return True
-
-            lk_rankings = self.original_lecturers[lecturer]["rank"]
-            student_rank = lk_rankings[student]
-            worst_student = self._get_lecturer_worst_existing_student(lecturer)
-            worst_student_rank = lk_rankings[worst_student]
-            if student_rank <= worst_student_rank:
-                return True
-        return False
-
-    def _blocking_pair_biii(self, student, project, _):
-        cj = self.projects[project]["capacity"]
-        project_occupancy = len(self.M[project]["assigned"])
-
-        if project_occupancy == cj:
-            lkj_rankings = self.projects[project]["rank"]
-            student_rank = lkj_rankings[student]
-            worst_student = self._get_project_worst_existing_student(project)
-            worst_student_rank = lkj_rankings[worst_student]
-            if student_rank <= worst_student_rank:
-                return True
-        return False
+        return self._get_worst_existing_student(project)
 
     def _check_super_stability(self) -> bool:
-        # stability must be checked with regards to the original lists prior to deletions
-        for student, s_prefs in self.original_students.items():
-            matched_project = self.M[student]["assigned"]
-
-            if matched_project is None:
-                preferred_projects = s_prefs["list"]
-            else:
-                rank_matched_project = s_prefs["rank"][matched_project]
-                # every project that s_i prefers to her matched project
-                # or is indifferent between them
-                preferred_projects = s_prefs["list"][: rank_matched_project + 1]
-
-            for p_tie in preferred_projects:
-                for project in p_tie:
-                    if project == matched_project:
-                        continue
-
-                    lecturer = self.projects[project]["lecturer"]
-                    for condition in self.super_blocking_conditions:
-                        if condition(student, project, lecturer):
-                            return False
-
-        return True
+        # solvers only delete from the lists, so the ranks are still the originals
+        checker = SPAStabilityChecker(stability_type="super", instance=self._reader)
+        return checker.is_stable(
+            {student: self.M[student]["assigned"] for student in self.students}
+        )
 
     def _check_strong_stability(self) -> bool:
         raise NotImplementedError(
@@ -178,77 +114,79 @@ class SPASTAbstract:
         return self._get_prefs(participant)["rank"]
 
     def _get_pref_length(self, person) -> int:
-        pref_list = self._get_pref_list(person)
-        total = sum([len(tie) for tie in pref_list])
-        return total
+        return self._get_pref_list(person).size
 
     def _get_head(self, person) -> set:
         pref_list = self._get_pref_list(person)
-        idx = 0
-        while idx < len(pref_list):
-            head = pref_list[idx]
-            if len(head) > 0:
-                return head.copy()
-            idx += 1
-        return set()
+        if pref_list.size == 0:
+            return set()
+        return pref_list.head
 
     def _get_tail(self, person, return_idx=False) -> set:
         pref_list = self._get_pref_list(person)
-        idx = len(pref_list) - 1
-        while idx >= 0:
-            tail = pref_list[idx]
-            if len(tail) > 0:
-                if return_idx:
-                    return idx
-                else:
-                    return tail.copy()
-            idx -= 1
-
         if return_idx:
-            return -1
-        raise ValueError("Pref_list empty")
+            return pref_list.tail_idx
+        # callers delete from the tail while iterating over it
+        return pref_list.tail.copy()
 
     def _get_lecturer_occupancy(self, lecturer):
-        return sum(
-            len(self.M[p]["assigned"]) for p in self.lecturers[lecturer]["projects"]
-        )
+        return self._lecturer_occupancy[lecturer]
 
     def _assign(self, student, project, lecturer) -> None:
+        if project in self.M[student]["assigned"]:
+            return
         self.M[student]["assigned"].add(project)
         self.M[project]["assigned"].add(student)
-        self.M[lecturer]["assigned"].add(student)
+        self._lecturer_occupancy[lecturer] += 1
+        heappush(
+            self._worst_heaps[project],
+            (-self.projects[project]["rank"][student], student),
+        )
+
+        links = self._lecturer_links.get((student, lecturer), 0)
+        self._lecturer_links[student, lecturer] = links + 1
+        if links == 0:
+            self.M[lecturer]["assigned"].add(student)
+            heappush(
+                self._worst_heaps[lecturer],
+                (-self.lecturers[lecturer]["rank"][student], student),
+            )
 
     def _break_assignment(self, student, project, lecturer) -> None:
-        self.M[student]["assigned"].discard(project)
-        self.M[project]["assigned"].discard(student)
-
-        student_still_assigned = any(
-            [
-                self.projects[p]["lecturer"] == lecturer
-                for p in self.M[student]["assigned"]
-            ]
-        )
-        if not student_still_assigned:
+        if project not in self.M[student]["assigned"]:
+            return
+        self.M[student]["assigned"].remove(project)
+        self.M[project]["assigned"].remove(student)
+        self._lecturer_occupancy[lecturer] -= 1
+
+        self._lecturer_links[student, lecturer] -= 1
+        if self._lecturer_links[student, lecturer] == 0:
             self.M[lecturer]["assigned"].discard(student)
 
     def _delete_triple(self, student, project, lecturer) -> None:
-        s_prefs = self._get_prefs(student)
-        s_rank_p = s_prefs["rank"][project]
-        s_prefs["list"][s_rank_p].remove(project)
+        self.students[student]["list"].discard(project)
 
-        p_prefs = self._get_prefs(project)
+        p_prefs = self.projects[project]
         p_rank_s = p_prefs["rank"][student]
-        p_prefs["list"][p_rank_s].remove(student)
+        p_prefs["list"].discard(student)
 
         best_reject = self.projects[project]["best_reject"]
         if best_reject is None or p_rank_s < p_prefs["rank"][best_reject]:
             self.projects[project]["best_reject"] = student
 
-        l_prefs = self._get_prefs(lecturer)
+        l_prefs = self.lecturers[lecturer]
         l_prefs["times_ranked"][student] -= 1
         if l_prefs["times_ranked"][student] == 0:
-            l_rank_s = l_prefs["rank"][student]
-            l_prefs["list"][l_rank_s].remove(student)
+            l_prefs["list"].discard(student)
+
+    def _delete_lecturer_pair(self, student, lecturer) -> None:
+        # the lecturer's projects are looked up in the student's list, rather than
+        # the student's whole list being searched for the lecturer's projects
+        s_list = self.students[student]["list"]
+        for project in self.lecturers[lecturer]["projects"]:
+            if project in s_list:
+                self._break_assignment(student, project, lecturer)
+                self._delete_triple(student, project, lecturer)
 
     def _delete_tail_project(self, project) -> None:
         tail = self._get_tail(project)
@@ -260,30 +198,20 @@ class SPASTAbstract:
     def _delete_tail_lecturer(self, lecturer) -> None:
         tail = self._get_tail(lecturer)
         for student in tail:
-            for project_tie in self._get_pref_list(student):
-                for project in project_tie.copy():
-                    if self.projects[project]["lecturer"] == lecturer:
-                        self._break_assignment(student, project, lecturer)
-                        self._delete_triple(student, project, lecturer)
+            self._delete_lecturer_pair(student, lecturer)
 
     def _reject_project_lower_ranks(self, worst, project, lecturer) -> None:
-        p_prefs = self._get_prefs(project)
-        rank_worst = p_prefs["rank"][worst]
-        for reject_tie in p_prefs["list"][rank_worst + 1 :]:
-            for reject in reject_tie.copy():
+        p_list = self.projects[project]["list"]
+        for idx in p_list.ties_after(p_list.rank[worst]):
+            for reject in p_list[idx].copy():
                 self._break_assignment(reject, project, lecturer)
                 self._delete_triple(reject, project, lecturer)
 
     def _reject_lecturer_lower_ranks(self, worst, lecturer) -> None:
-        l_prefs = self._get_prefs(lecturer)
-        rank_worst = l_prefs["rank"][worst]
-        for reject_tie in l_prefs["list"][rank_worst + 1 :]:
-            for student in reject_tie.copy():
-                for project_tie in self._get_pref_list(student):
-                    for project in project_tie.copy():
-                        if self.projects[project]["lecturer"] == lecturer:
-                            self._break_assignment(student, project, lecturer)
-                            self._delete_triple(student, project, lecturer)
+        l_list = self.lecturers[lecturer]["list"]
+        for idx in l_list.ties_after(l_list.rank[worst]):
+            for student in l_list[idx].copy():
+                self._delete_lecturer_pair(student, lecturer)
 
     def _while_loop(self) -> bool:
         raise NotImplementedError("Method _while_loop must be implemented in subclass")
@@ -2,9 +2,6 @@
 Store preference lists for the SPAST stable matching algorithm.
 """
 
-from copy import deepcopy
-from itertools import product
-
 from algmatch.abstractClasses.abstractPreferenceInstanceWithTies import (
     AbstractPreferenceInstanceWithTies,
 )
@@ -40,7 +37,8 @@ class SPASTPreferenceInstance(AbstractPreferenceInstanceWithTies):
             self.lecturers[lec]["projects"].add(project)
             lecturer_list = self.lecturers[lec]["list"]
 
-            self.projects[project]["list"] = deepcopy(lecturer_list)
+            # the ties only hold names, so copying each set is a deep enough copy
+            self.projects[project]["list"] = [set(tie) for tie in lecturer_list]
             self.projects[project]["best_reject"] = None
 
     def check_preference_lists(self) -> None:
@@ -52,24 +50,7 @@ class SPASTPreferenceInstance(AbstractPreferenceInstanceWithTies):
         )
 
     def clean_unacceptable_pairs(self) -> None:
-        for s, p in product(self.students, self.projects):
-            s_list = self.students[s]["list"]
-            p_list = self.projects[p]["list"]
-
-            s_found = any([s in tie for tie in p_list])
-            p_found = any([p in tie for tie in s_list])
-
-            if not (s_found and p_found):
-                for tie in s_list:
-                    tie.discard(p)
-                for tie in p_list:
-                    tie.discard(s)
-                # clean empty sets
-                # we've produced at most one per side in this loop
-                if set() in s_list:
-                    s_list.remove(set())
-                if set() in p_list:
-                    p_list.remove(set())
+        super().clean_unacceptable_pairs(self.students, self.projects)
 
         for L in self.lecturers:
             proj_pref_set = set()
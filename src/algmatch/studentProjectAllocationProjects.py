@@ -18,16 +18,27 @@ from algmatch.stableMatchings.studentProjectAllocation.SPA_P.instanceGenerators
     SPAPIG_FameEuclideanExtended,
 )
 
-from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import GurobiSPAP
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import SPAPSolver
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPApprox import SPAPApprox
 from algmatch.stableMatchings.studentProjectAllocation.SPA_P.checkStability import StabilityChecker
 
 
+def _make_solver(filename: str, output_flag: int, backend: str, mode: str, improve: bool) -> SPAPSolver | SPAPApprox:
+    assert mode in ("exact", "approximate"), "Mode must be either 'exact' or 'approximate'."
+    if mode == "exact":
+        return SPAPSolver(filename=filename, output_flag=output_flag, backend=backend)
+    return SPAPApprox(filename=filename, improve=improve)
+
+
 class StudentProjectAllocationProjectsSingle:
     def __init__(
             self, 
             filename: str | None = None, 
             output: str | None = None,
-            output_flag: bool = True
+            output_flag: bool = True,
+            backend: str = "gurobi",
+            mode: str = "exact",
+            improve: bool = True,
     ) -> None:
         """
         Initialise the SPA-P algorithm.
@@ -35,7 +46,10 @@ class StudentProjectAllocationProjectsSingle:
         :param filename: str, optional, default=None, the path to the file to read in the preferences from.      
         :param output: str, optional, default=None, the path to the file to write the output to. Will print to console if None.
 
-        :param output_flag: boolean, optional, default=True, the flag to determine whether to output the Gurobi solver output.
+        :param output_flag: boolean, optional, default=True, the flag to determine whether to output the solver output.
+        :param backend: str, optional, default="gurobi", the MILP solver to use, "gurobi" or "highs". HiGHS is open source, so needs no licence.
+        :param mode: str, optional, default="exact", "exact" to find a maximum stable matching with the MILP, or "approximate" to find a stable matching at least half its size in linear time, for instances too large for the MILP.
+        :param improve: bool, optional, default=True, in approximate mode, whether students left unassigned get a second chance, which usually finds a larger matching.
         """
         assert filename is not None, "Filename must be provided"
 
@@ -48,7 +62,7 @@ class StudentProjectAllocationProjectsSingle:
         else:
             self.delim = ',' # assume csv
 
-        self.solver = GurobiSPAP(filename=filename, output_flag=int(output_flag))
+        self.solver = _make_solver(filename, int(output_flag), backend, mode, improve)
 
 
     def get_stable_matching(self) -> dict | str:
@@ -85,6 +99,9 @@ class StudentProjectAllocationProjectsMultiple:
             solutions_folder: str = "solutions/",
             output_flag: bool = True,
             file_extension: str = 'csv',
+            backend: str = "gurobi",
+            mode: str = "exact",
+            improve: bool = True,
     ):
         """
         Run several iterations of the SPA-P algorithm.
@@ -101,8 +118,11 @@ class StudentProjectAllocationProjectsMultiple:
         :param lecturer_capacity: int, optional, default=0, the capacity of all lecturers. If 0, capacity is random.
         :param instance_folder: str, optional, default="instances/", the folder to save the instances to.
         :param solutions_folder: str, optional, default="solutions/", the folder to save the solutions to.
-        :param output_flag: bool, optional, default=True, the flag to determine whether to output the Gurobi solver output.
+        :param output_flag: bool, optional, default=True, the flag to determine whether to output the solver output.
         :param file_extension: str, optional, default='csv', what type of file to save instances and solutions to.
+        :param backend: str, optional, default="gurobi", the MILP solver to use, "gurobi" or "highs". HiGHS is open source, so needs no licence.
+        :param mode: str, optional, default="exact", "exact" to find a maximum stable matching with the MILP, or "approximate" to find a stable matching at least half its size in linear time, for instances too large for the MILP.
+        :param improve: bool, optional, default=True, in approximate mode, whether students left unassigned get a second chance, which usually finds a larger matching.
         """
         
         assert lower_bound <= upper_bound, "Lower bound must be less than or equal to upper bound."
@@ -131,6 +151,9 @@ class StudentProjectAllocationProjectsMultiple:
 
         self.output_flag = int(output_flag)
         self.file_extension = file_extension
+        self.backend = backend
+        self.mode = mode
+        self.improve = improve
         self.delim = ',' if file_extension == "csv" else ' '
 
         if instance_generator is None:
@@ -169,7 +192,7 @@ class StudentProjectAllocationProjectsMultiple:
             filename = self.instance_folder + f"instance_{i}.{self.file_extension}"
             self._save_instance(filename)
 
-            solver = GurobiSPAP(filename=filename, output_flag=self.output_flag)
+            solver = _make_solver(filename, self.output_flag, self.backend, self.mode, self.improve)
             solver.solve()
             checker = StabilityChecker(solver)
             is_stable = checker.check_stability()
@@ -187,7 +210,7 @@ def main():
         Usage: python3 main.py [--single | --multiple] [options]
 
         Run the SPA-P algorithm for a single instance:
-            python3 studentProjectAllocationProjects.py --single --filename FILENAME --output OUTPUT --output_flag OUTPUT_FLAG
+            python3 studentProjectAllocationProjects.py --single --filename FILENAME --output OUTPUT --output_flag OUTPUT_FLAG --backend BACKEND --mode MODE
 
         Run the SPA-P algorithm for multiple instances:
             python3 studentProjectAllocationProjects.py --multiple --iters ITERS --students STUDENTS 
@@ -197,6 +220,7 @@ def main():
                             --instance_folder INSTANCE_FOLDER --solutions_folder SOLUTIONS_FOLDER 
                             --output_flag OUTPUT_FLAG --file_extension EXTENSION
                             --instance_generator GENERATOR_NAME --instance_generator_args arg1=val1 arg2=val2 ...
+                            --backend BACKEND --mode MODE
         """
     
     IG_arg_types = {'num_dimensions': int} | {elt: float for elt in [
@@ -234,7 +258,9 @@ def main():
     parser.add_argument("--force_lecturer_capacity", type=int, default=0, help="The capacity of all lecturers. If 0, capacity is random.")
     parser.add_argument("--instance_folder", type=str, default="instances/", help="The folder to save the instances to.")
     parser.add_argument("--solutions_folder", type=str, default="solutions/", help="The folder to save the solutions to.")
-    parser.add_argument("--output_flag", action="store_true", help="The flag to determine whether to output the Gurobi solver output.")
+    parser.add_argument("--output_flag", action="store_true", help="The flag to determine whether to output the solver output.")
+    parser.add_argument("--backend", type=str, default="gurobi", choices=["gurobi", "highs"], help="The MILP solver to use. HiGHS is open source, so needs no licence.")
+    parser.add_argument("--mode", type=str, default="exact", choices=["exact", "approximate"], help="Whether to find a maximum stable matching with the MILP, or one at least half its size in linear time.")
     parser.add_argument("--file_extension", type=str, default='csv', help="What type of file to write the output to.")
     parser.add_argument("--instance_generator", type=str, default='random', help="The instance generator to use.")
     parser.add_argument("--instance_generator_args", type=parse_pair, default="=", help="The keyword arguments for the instance generator.", nargs='+')
@@ -277,7 +303,9 @@ def main():
         spa = StudentProjectAllocationProjectsSingle(
             filename=args.filename,
             output=args.output,
-            output_flag=args.output_flag
+            output_flag=args.output_flag,
+            backend=args.backend,
+            mode=args.mode
         )
         spa.get_stable_matching()
 
@@ -313,7 +341,9 @@ def main():
             instance_folder=args.instance_folder,
             solutions_folder=args.solutions_folder,
             output_flag=args.output_flag,
-            file_extension=args.file_extension
+            file_extension=args.file_extension,
+            backend=args.backend,
+            mode=args.mode
         )
         spa.run()
 
@@ -1,4 +1,15 @@
+import os
+import random
+import tempfile
+
+from algmatch.binaryInstances.binaryInstanceWriter import write_binary_instance
+from algmatch.binaryInstances.binaryPreferenceInstance import (
+    BinaryPreferenceInstance,
+)
 from algmatch.hospitalResidentsProblem import HospitalResidentsProblem
+from algmatch.stableMatchings.hospitalResidentsProblem.noTies.hrPreferenceInstance import (
+    HRPreferenceInstance,
+)
 
 from tests.abstractTestClasses.abstractVerifier import AbstractVerifier
 from tests.HRTests.utils.noTies.hrInstanceGenerator import HRInstanceGenerator
@@ -29,4 +40,83 @@ class HRVerifier(AbstractVerifier):
             HRInstanceGenerator,
             generator_args,
             HREnumerator,
+            instance_type=HRPreferenceInstance,
         )
+
+    def verify_instance(self):
+        if not AbstractVerifier.verify_instance(self):
+            return False
+        if not self.verify_engines():
+            return False
+        if not self.verify_rank_optimal(("residents", "hospitals"), "resident_sided"):
+            return False
+        return self._verify_binary() and self._verify_resolve()
+
+    def _verify_binary(self):
+        # the instance written in the binary format and mapped back must give the
+        # same matchings, and closing it must leave the solvers still using it working
+        expected = [
+            self.Problem(
+                dictionary=self.current_instance, optimised_side=side
+            ).get_stable_matching()
+            for side in self.sides
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "instance.bin")
+            write_binary_instance(
+                HRPreferenceInstance(dictionary=self.current_instance), filename
+            )
+            with BinaryPreferenceInstance(filename) as binary:
+                optimal_solver, pessimal_solver = (
+                    self.Problem(instance=binary, optimised_side=side, engine="array")
+                    for side in self.sides
+                )
+                m_0 = optimal_solver.get_stable_matching()
+            m_z = pessimal_solver.get_stable_matching()
+        return [m_0, m_z] == expected
+
+    def _resolve_agrees(self, solver, delta, changed):
+        # the matching kept up to date must agree with solving the changed instance
+        matching, _ = solver.resolve(delta)
+        return matching == self.Problem(dictionary=changed).get_stable_matching()
+
+    def _verify_resolve(self):
+        # a withdrawal, a preference edit that may add hospitals the resident did not
+        # list, and a capacity change, each applied on top of the ones before
+        residents = self.current_instance["residents"]
+        hospitals = self.current_instance["hospitals"]
+        if len(residents) < 2 or not hospitals:
+            return True
+        changed = {
+            "residents": {r: list(r_list) for r, r_list in residents.items()},
+            "hospitals": {
+                h: {
+                    "capacity": h_info["capacity"],
+                    "preferences": list(h_info["preferences"]),
+                }
+                for h, h_info in hospitals.items()
+            },
+        }
+        solver = self.Problem(dictionary=self.current_instance)
+
+        withdrawn = random.choice(list(residents))
+        del changed["residents"][withdrawn]
+        for h_info in changed["hospitals"].values():
+            h_info["preferences"] = [r for r in h_info["preferences"] if r != withdrawn]
+        if not self._resolve_agrees(solver, {"withdrawn": [f"r{withdrawn}"]}, changed):
+            return False
+
+        edited = random.choice(list(changed["residents"]))
+        new_list = random.sample(list(hospitals), random.randint(0, len(hospitals)))
+        changed["residents"][edited] = new_list
+        delta = {"preferences": {f"r{edited}": [f"h{h}" for h in new_list]}}
+        if not self._resolve_agrees(solver, delta, changed):
+            return False
+
+        hospital = random.choice(list(hospitals))
+        capacity = changed["hospitals"][hospital]["capacity"]
+        # the solvers take hospitals with at least one seat
+        change = random.randint(1 - capacity, 2)
+        changed["hospitals"][hospital]["capacity"] += change
+        delta = {"capacities": {f"h{hospital}": change}}
+        return self._resolve_agrees(solver, delta, changed)
@@ -0,0 +1,92 @@
+"""
+Cases that once made strongly stable HRT solving fail, which random instances
+rarely reach. The maximum matching search could loop forever, depending on the
+order sets of residents were iterated in, so each case is run in a fresh process
+under a fixed hash seed and a time limit.
+"""
+
+from array import array
+import os
+import subprocess
+import sys
+
+from algmatch.stableMatchings.hospitalResidentsProblem.ties.hrtStrongResidentOptimal import (
+    HRTStrongResidentOptimal,
+)
+
+from tests.HRTests.HRTStrong.hrtStrongVerifier import HRTStrongVerifier
+
+TIME_LIMIT = 20  # seconds
+
+
+def maximum_matching_with_full_hospital():
+    """
+    A full hospital whose first partner on the next layer is a dead end, where the
+    augmenting path goes through its other partner.
+    """
+    solver = HRTStrongResidentOptimal(
+        dictionary={
+            "residents": {1: [[1]], 2: [[1, 2]], 3: [[1]]},
+            "hospitals": {
+                1: {"capacity": 2, "preferences": [[1, 2, 3]]},
+                2: {"capacity": 1, "preferences": [[2]]},
+            },
+        }
+    )
+    # nothing is touched yet, so forming the graph keeps the state set here
+    solver._adjacency = [[0], [0, 1], [0]]
+    solver._quota = array("i", [2, 1])
+    solver._mate_of_resident = array("i", [0, 0, -1])
+    solver._matched = [{0, 1}, set()]
+    solver._get_maximum_matching()
+    return sum(len(matched) for matched in solver._matched) == 3
+
+
+def instance_with_full_hospital():
+    # the instance as the generator printed it, which hung with PYTHONHASHSEED=0
+    verifier = HRTStrongVerifier(5, 3, 0, 3)
+    verifier.current_instance = {
+        "residents": {1: [[1]], 2: [[3, 1, 2]], 3: [[2]], 4: [[1, 2, 3]], 5: [[1]]},
+        "hospitals": {
+            1: {"capacity": 2, "preferences": [[4, 1, 5, 3, 2]]},
+            2: {"capacity": 2, "preferences": [[5, 4, 2, 1, 3]]},
+            3: {"capacity": 1, "preferences": [[1, 4, 5, 2, 3]]},
+        },
+    }
+    return verifier.verify_instance()
+
+
+CASES = {
+    case.__name__: case
+    for case in (maximum_matching_with_full_hospital, instance_with_full_hospital)
+}
+
+
+def run_case(name):
+    """
+    :return: whether the case passed in a fresh process within the time limit
+    """
+    try:
+        process = subprocess.run(
+            [sys.executable, "-m", __spec__.name, name],
+            env=dict(os.environ, PYTHONHASHSEED="0"),
+            timeout=TIME_LIMIT,
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return process.returncode == 0
+
+
+def main():
+    if len(sys.argv) == 2:
+        sys.exit(0 if CASES[sys.argv[1]]() else 1)
+
+    incorrect = [name for name in CASES if not run_case(name)]
+    print(f"Correct: {len(CASES) - len(incorrect)}")
+    print(f"Incorrect: {len(incorrect)}")
+    for name in incorrect:
+        print(f"    {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,8 @@ from tests.HRTests.utils.generic.hrGenericEnumerator import HRGenericEnumerator
 
 
 class HREnumerator(HRAbstract, HRGenericEnumerator):
-    def __init__(self, dictionary):
-        HRAbstract.__init__(self, dictionary=dictionary)
+    def __init__(self, dictionary=None, instance=None):
+        HRAbstract.__init__(self, dictionary=dictionary, instance=instance)
         HRGenericEnumerator.__init__(self)
 
     def has_stability(self) -> bool:
@@ -1,4 +1,7 @@
 from algmatch.stableMarriageProblem import StableMarriageProblem
+from algmatch.stableMatchings.stableMarriageProblem.noTies.smPreferenceInstance import (
+    SMPreferenceInstance,
+)
 
 from tests.abstractTestClasses.abstractVerifier import AbstractVerifier
 from tests.SMTests.utils.noTies.smInstanceGenerator import SMInstanceGenerator
@@ -29,4 +32,12 @@ class SMVerifier(AbstractVerifier):
             SMInstanceGenerator,
             generator_args,
             SMEnumerator,
+            instance_type=SMPreferenceInstance,
+        )
+
+    def verify_instance(self):
+        if not AbstractVerifier.verify_instance(self):
+            return False
+        return self.verify_engines() and self.verify_rank_optimal(
+            ("men", "women"), "man_sided"
         )
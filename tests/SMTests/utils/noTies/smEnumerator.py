@@ -3,8 +3,8 @@ from tests.SMTests.utils.generic.smGenericEnumerator import SMGenericEnumerator
 
 
 class SMEnumerator(SMAbstract, SMGenericEnumerator):
-    def __init__(self, dictionary):
-        SMAbstract.__init__(self, dictionary=dictionary)
+    def __init__(self, dictionary=None, instance=None):
+        SMAbstract.__init__(self, dictionary=dictionary, instance=instance)
         SMGenericEnumerator.__init__(self)
 
     def has_stability(self) -> bool:
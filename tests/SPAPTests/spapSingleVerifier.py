@@ -0,0 +1,59 @@
+from time import perf_counter_ns
+from tqdm import tqdm
+
+from tests.abstractTestClasses.abstractSingleVerifier import AbstractSingleVerifier
+from tests.SPAPTests.spapVerifier import SPAPVerifier
+
+
+class SPAPSingleVerifier(SPAPVerifier, AbstractSingleVerifier):
+    def __init__(
+        self, total_students, total_projects, total_lecturers, lower_bound, upper_bound
+    ):
+        SPAPVerifier.__init__(
+            self,
+            total_students,
+            total_projects,
+            total_lecturers,
+            lower_bound,
+            upper_bound,
+        )
+        AbstractSingleVerifier.__init__(self)
+
+    def show_results(self):
+        print(f"""
+            Total students: {self._total_students}
+            Total projects: {self._total_projects}
+            Total lecturers: {self._total_lecturers}
+            Lower list bound: {self._lower_bound}
+            Upper list bound: {self._upper_bound}
+            Repetitions: {self._total_count}
+
+            Correct: {self._correct_count}
+            Incorrect: {self._incorrect_count}
+              """)
+
+
+def main():
+    TOTAL_STUDENTS = 5
+    TOTAL_PROJECTS = 4
+    TOTAL_LECTURERS = 2
+    LOWER_BOUND = 1
+    UPPER_BOUND = 3
+    REPETITIONS = 2_000
+
+    start = perf_counter_ns()
+
+    verifier = SPAPSingleVerifier(
+        TOTAL_STUDENTS, TOTAL_PROJECTS, TOTAL_LECTURERS, LOWER_BOUND, UPPER_BOUND
+    )
+    for _ in tqdm(range(REPETITIONS)):
+        verifier.run()
+
+    end = perf_counter_ns()
+    print(f"\nFinal Runtime: {(end - start) / 1000**3}s")
+
+    verifier.show_results()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import os
+import tempfile
+from itertools import product
+from types import SimpleNamespace
+
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.checkStability import (
+    StabilityChecker,
+)
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.fileReader import (
+    FileReader,
+)
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.instanceGenerators.random import (
+    SPAPIG_Random,
+)
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPApprox import (
+    SPAPApprox,
+)
+from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import (
+    SPAPSolver,
+)
+
+
+class SPAPVerifier:
+    def __init__(
+        self, total_students, total_projects, total_lecturers, lower_bound, upper_bound
+    ):
+        """
+        It takes argument as follows (set in init):
+            number of students
+            number of projects
+            number of lecturers
+            lower bound of the students' preference list length
+            upper bound of the students' preference list length
+
+        SPA-P has no enumerator of stable matchings, so every matching of the
+        instance is checked by brute force instead, which needs small instances.
+        """
+
+        self._total_students = total_students
+        self._total_projects = total_projects
+        self._total_lecturers = total_lecturers
+        self._lower_bound = lower_bound
+        self._upper_bound = upper_bound
+
+        self._generator = SPAPIG_Random(
+            total_students, lower_bound, upper_bound, total_projects, total_lecturers
+        )
+
+    def generate_instance(self):
+        self._generator.generate_instance()
+
+    def _solved(self, reader, matching):
+        # the state a solver is left in after finding the matching
+        projects = {p: [c, L, 0] for p, (c, L, _) in reader.projects.items()}
+        lecturers = {
+            L: [c, prefs, 0, None] for L, (c, prefs, *_) in reader.lecturers.items()
+        }
+        for project in matching.values():
+            lecturer = projects[project][1]
+            projects[project][2] += 1
+            lecturers[lecturer][2] += 1
+            preferences = lecturers[lecturer][1]
+            worst = lecturers[lecturer][3]
+            if worst is None or preferences.index(worst) < preferences.index(project):
+                lecturers[lecturer][3] = project
+        return SimpleNamespace(
+            _students=reader.students,
+            _projects=projects,
+            _lecturers=lecturers,
+            matching={s: matching.get(s, "") for s in reader.students},
+        )
+
+    def _within_capacities(self, solved):
+        return all(
+            load <= capacity for capacity, _, load in solved._projects.values()
+        ) and all(
+            load <= capacity for capacity, _, load, _ in solved._lecturers.values()
+        )
+
+    def _is_stable(self, reader, matching):
+        """
+        Whether a matching, of each assigned student to their project, is within
+        capacities, and admits no blocking pair or coalition.
+        """
+        solved = self._solved(reader, matching)
+        if not self._within_capacities(solved):
+            return False
+        projects, lecturers = solved._projects, solved._lecturers
+
+        def lecturer_prefers(lecturer, project, other):
+            # other is None when the lecturer has no students
+            if other is None:
+                return False
+            preferences = lecturers[lecturer][1]
+            return preferences.index(project) < preferences.index(other)
+
+        for student, (preferences, _) in reader.students.items():
+            current = matching.get(student)
+            better = (
+                preferences
+                if current is None
+                else preferences[: preferences.index(current)]
+            )
+            for project in better:
+                capacity, lecturer, load = projects[project]
+                if load == capacity:
+                    continue
+                if current is not None and projects[current][1] == lecturer:
+                    if lecturer_prefers(lecturer, project, current):
+                        return False
+                elif lecturers[lecturer][2] < lecturers[lecturer][0]:
+                    return False
+                elif lecturer_prefers(lecturer, project, lecturers[lecturer][3]):
+                    return False
+
+        # a coalition is a cycle of students, each preferring the project of the next
+        # to their own, so removing students that envy no one must remove them all
+        envies = {}
+        for student, project in matching.items():
+            preferences = reader.students[student][0]
+            better = preferences[: preferences.index(project)]
+            envies[student] = {t for t, p in matching.items() if p in better}
+        while envies:
+            satisfied = [
+                s for s, targets in envies.items() if not targets & envies.keys()
+            ]
+            if not satisfied:
+                return False
+            for student in satisfied:
+                del envies[student]
+        return True
+
+    def _verify_solver(self, reader, solver, size):
+        matching = {s: p for s, p in solver.matching.items() if p != ""}
+        if not self._is_stable(reader, matching):
+            return False
+        if not StabilityChecker(solver).check_stability():
+            return False
+        return size(len(matching))
+
+    def verify_instance(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "instance.txt")
+            self._generator.write_instance_to_file(filename)
+            reader = FileReader(filename)
+
+            # every matching, where the stability checker must agree with the one here
+            maximum = 0
+            students = list(reader.students)
+            options = ([None] + reader.students[s][0] for s in students)
+            for choice in product(*options):
+                matching = {s: p for s, p in zip(students, choice) if p is not None}
+                stable = self._is_stable(reader, matching)
+                solved = self._solved(reader, matching)
+                if not self._within_capacities(solved):
+                    continue
+                if StabilityChecker(solved).check_stability() != stable:
+                    return False
+                if stable:
+                    maximum = max(maximum, len(matching))
+
+            for improve in (False, True):
+                approx = SPAPApprox(filename, improve=improve)
+                approx.solve()
+                if not self._verify_solver(reader, approx, lambda n: 2 * n >= maximum):
+                    return False
+
+            exact = SPAPSolver(filename, output_flag=0, backend="highs")
+            exact.solve()
+            return self._verify_solver(reader, exact, lambda n: n == maximum)
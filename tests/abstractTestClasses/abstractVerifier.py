@@ -1,9 +1,20 @@
 class AbstractVerifier:
-    def __init__(self, problem, sides, gen, gen_args, brute_force, stability_type=None):
+    def __init__(
+        self,
+        problem,
+        sides,
+        gen,
+        gen_args,
+        brute_force,
+        stability_type=None,
+        instance_type=None,
+    ):
         self.Problem = problem
         self.sides = sides
         self.BruteForce = brute_force
         self.stability_type = stability_type
+        # problems that accept a compiled instance only validate each one once
+        self.InstanceType = instance_type
         self.gen = gen(*gen_args)
         self.current_instance = {}
 
@@ -26,6 +37,15 @@ class AbstractVerifier:
                 optimised_side=self.sides[1],
                 stability_type=self.stability_type,
             )
+        elif self.InstanceType is not None:
+            instance = self.InstanceType(dictionary=self.current_instance)
+            bruteforcer = self.BruteForce(instance=instance)
+            optimal_solver = self.Problem(
+                instance=instance, optimised_side=self.sides[0]
+            )
+            pessimal_solver = self.Problem(
+                instance=instance, optimised_side=self.sides[1]
+            )
         else:
             bruteforcer = self.BruteForce(dictionary=self.current_instance)
             optimal_solver = self.Problem(
@@ -36,6 +56,8 @@ class AbstractVerifier:
             )
 
         bruteforcer.find_stable_matchings()
+        # kept for the checks that subclasses make on top of these
+        self.stable_matchings = bruteforcer.stable_matching_list
         m_0 = optimal_solver.get_stable_matching()
         m_z = pessimal_solver.get_stable_matching()
 
@@ -49,6 +71,71 @@ class AbstractVerifier:
             return False
         if m_0 not in bruteforcer.stable_matching_list:
             return False
+
+        # problems that enumerate every stable matching must find exactly these
+        if hasattr(optimal_solver, "get_all_stable_matchings"):
+            all_matchings = list(optimal_solver.get_all_stable_matchings())
+            if len(all_matchings) != len(bruteforcer.stable_matching_list):
+                return False
+            if any(m not in all_matchings for m in bruteforcer.stable_matching_list):
+                return False
+        return True
+
+    def verify_engines(self):
+        """
+        Checks that the "array" engine finds the same stable matching as the "dict"
+        engine for both sides, and the same again when solving a second time.
+        """
+        for side in self.sides:
+            expected = self.Problem(
+                dictionary=self.current_instance, optimised_side=side
+            ).get_stable_matching()
+            solver = self.Problem(
+                dictionary=self.current_instance, optimised_side=side, engine="array"
+            )
+            matchings = [solver.get_stable_matching() for _ in range(2)]
+            if any(matching != expected for matching in matchings):
+                return False
+            if expected not in self.stable_matchings:
+                return False
+        return True
+
+    def verify_rank_optimal(self, groups, sided_key):
+        """
+        Checks that the "egalitarian" and "minimum_regret" matchings are stable and
+        have the least rank sum, and least worst rank, of all stable matchings.
+
+        :param groups: tuple of str, the proposing and receiving groups of the instance, e.g. ("men", "women")
+        :param sided_key: str, the key of the proposers' side of a matching, e.g. "man_sided"
+        """
+        # the solvers rank from the lists once unacceptable pairs are removed
+        instance = self.InstanceType(dictionary=self.current_instance)
+        proposers, receivers = (getattr(instance, group) for group in groups)
+
+        def ranks(matching):
+            return [
+                rank
+                for proposer, receiver in matching[sided_key].items()
+                if receiver
+                for rank in (
+                    proposers[proposer]["rank"][receiver],
+                    receivers[receiver]["rank"][proposer],
+                )
+            ]
+
+        profiles = [ranks(matching) for matching in self.stable_matchings]
+        costs = {
+            "egalitarian": sum,
+            "minimum_regret": lambda profile: max(profile, default=0),
+        }
+        for side, cost in costs.items():
+            matching = self.Problem(
+                dictionary=self.current_instance, optimised_side=side
+            ).get_stable_matching()
+            if matching not in self.stable_matchings:
+                return False
+            if cost(ranks(matching)) != min(map(cost, profiles)):
+                return False
         return True
 
     def run(self):
@@ -0,0 +1,63 @@
+import random
+from tqdm import tqdm
+
+from algmatch import BatchSolver
+from algmatch.hospitalResidentsProblem import HospitalResidentsProblem
+
+from tests.HRTests.utils.noTies.hrInstanceGenerator import HRInstanceGenerator
+
+
+def generate_batch(size, bad_share):
+    """
+    A batch of HR instances, some of which rank a hospital that does not exist,
+    and the indices of those.
+    """
+    generator = HRInstanceGenerator(5, 3, 0, 3)
+    batch, bad = [], set()
+    for index in range(size):
+        instance = generator.generate_instance()
+        if random.random() < bad_share:
+            instance["residents"][1].append(len(instance["hospitals"]) + 1)
+            bad.add(index)
+        batch.append(instance)
+    return batch, bad
+
+
+def verify_results(results, batch, bad, ordered):
+    indices = [result.index for result in results]
+    if ordered and indices != list(range(len(batch))):
+        return False
+    if sorted(indices) != list(range(len(batch))):
+        return False
+
+    for result in results:
+        if result.index in bad:
+            if result.error is None or result.matching is not None:
+                return False
+        else:
+            expected = HospitalResidentsProblem(
+                dictionary=batch[result.index]
+            ).get_stable_matching()
+            if result.error is not None or result.matching != expected:
+                return False
+    return True
+
+
+def test_batch(runs):
+    # small chunks, so a bad instance shares its chunk with good ones and every
+    # worker receives several chunks
+    incorrect = 0
+    with BatchSolver(
+        HospitalResidentsProblem, processes=2, chunksize=3
+    ) as batch_solver:
+        for _ in tqdm(range(runs)):
+            batch, bad = generate_batch(random.randint(1, 40), 0.2)
+            for ordered in (True, False):
+                results = list(batch_solver.solve(batch, ordered=ordered))
+                if not verify_results(results, batch, bad, ordered):
+                    incorrect += 1
+    print(f"Incorrect: {incorrect}")
+
+
+if __name__ == "__main__":
+    test_batch(100)
@@ -0,0 +1,154 @@
+"""
+Benchmarks every solver family, and checks the results against a stored baseline.
+
+    python -m tests.benchmarks                      run every sweep, compare to baseline
+    python -m tests.benchmarks --quick --families SM HR
+    python -m tests.benchmarks --json out.json --csv out.csv
+    python -m tests.benchmarks --save-baseline      record a new baseline and
+                                                    regenerate benchmarks.md from it
+    python -m tests.benchmarks --save-baseline --families SMT
+    python -m tests.benchmarks --load out.json --markdown out.md
+
+Exits with status 1 if any case regressed beyond the tolerances.
+"""
+
+import argparse
+import os
+import sys
+
+from tests.benchmarks.families import FAMILIES
+from tests.benchmarks.measurement import run_sweep
+from tests.benchmarks.reports import (
+    compare,
+    load_json,
+    make_report,
+    write_csv,
+    write_json,
+    write_markdown,
+)
+
+BASELINE = os.path.join("tests", "benchmarks", "baseline.json")
+MARKDOWN = "benchmarks.md"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Benchmark every solver family, and compare against a baseline.",
+    )
+    parser.add_argument(
+        "--families",
+        nargs="+",
+        choices=list(FAMILIES),
+        default=list(FAMILIES),
+        help="the families to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--reps", type=int, default=3, help="instances per sweep point (default: 3)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="runs per instance, of which the fastest is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="only run the default point of each family",
+    )
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--csv", help="write the results to this CSV file")
+    parser.add_argument(
+        "--load", help="read results from this JSON file instead of running"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE,
+        help=f"the baseline to compare against (default: {BASELINE})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"replace the baseline results of the families run, and regenerate {MARKDOWN}",
+    )
+    parser.add_argument("--markdown", help="write the results as markdown to this file")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown, as a fraction of the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.1,
+        help="allowed growth in peak memory (default: 0.1)",
+    )
+    parser.add_argument(
+        "--operations-tolerance",
+        type=float,
+        default=0.01,
+        help="allowed growth in operation counts (default: 0.01)",
+    )
+    args = parser.parse_args()
+    assert args.reps > 0, "Param reps must be a positive int"
+    assert args.repeat > 0, "Param repeat must be a positive int"
+
+    if args.load:
+        report = load_json(args.load)
+    else:
+        results = list(run_sweep(args.families, args.reps, args.repeat, args.quick))
+        report = make_report(results, args.reps, args.repeat)
+
+    if args.json:
+        write_json(report, args.json)
+    if args.csv:
+        write_csv(report, args.csv)
+    if args.markdown:
+        write_markdown(report, args.markdown, args.load or args.json or "this run")
+
+    if args.save_baseline:
+        if not args.load and os.path.isfile(args.baseline):
+            # families that were not run keep their baseline results
+            kept = [
+                result
+                for result in load_json(args.baseline)["results"]
+                if result["family"] not in args.families
+            ]
+            report["results"] = sorted(
+                kept + report["results"],
+                key=lambda result: list(FAMILIES).index(result["family"]),
+            )
+        write_json(report, args.baseline)
+        write_markdown(report, MARKDOWN, args.baseline)
+        print(f"Saved baseline to {args.baseline} and regenerated {MARKDOWN}")
+        return
+
+    if not os.path.isfile(args.baseline):
+        print(f"No baseline at {args.baseline}, so nothing to compare against")
+        return
+
+    regressions, improvements, compared_times = compare(
+        report,
+        load_json(args.baseline),
+        args.time_tolerance,
+        args.memory_tolerance,
+        args.operations_tolerance,
+    )
+    if not compared_times:
+        print("Baseline was recorded on another machine, so times are not compared")
+    for heading, lines in (
+        ("Improvements", improvements),
+        ("Regressions", regressions),
+    ):
+        print(f"\n{heading}: {len(lines)}")
+        for line in lines:
+            print(f"    {line}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
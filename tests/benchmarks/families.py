@@ -0,0 +1,494 @@
+"""
+Instance builders and sweep definitions for every solver family.
+
+Each family sweeps one parameter at a time around its defaults:
+
+    size        the number of participants on the proposing side
+    length      preference list length, as a fraction of the longest possible list
+    ties        tie density of the preference lists, for families with ties
+    capacity    how capacity is distributed, for families with capacities
+    entries     the number of projects on each student's list, for families too
+                large for lists proportional to their size
+"""
+
+from math import ceil
+import os
+import random
+
+from algmatch.stableMarriageProblem import StableMarriageProblem
+from algmatch.hospitalResidentsProblem import HospitalResidentsProblem
+from algmatch.studentProjectAllocation import StudentProjectAllocation
+from algmatch.stableMarriageProblemWithTies import StableMarriageProblemWithTies
+from algmatch.hospitalResidentsProblemWithTies import HospitalResidentsProblemWithTies
+from algmatch.studentProjectAllocationWithTies import (
+    StudentProjectAllocationWithTies,
+)
+from algmatch.stableRoommatesProblem import StableRoommatesProblem
+
+from tests.SMTests.utils.noTies.smInstanceGenerator import SMInstanceGenerator
+from tests.SMTests.utils.ties.smtInstanceGenerator import SMTInstanceGenerator
+from tests.HRTests.utils.noTies.hrInstanceGenerator import HRInstanceGenerator
+from tests.HRTests.utils.ties.hrtInstanceGenerator import HRTInstanceGenerator
+from tests.SPASTests.utils.noTies.spasInstanceGenerator import SPASInstanceGenerator
+from tests.SPASTests.utils.ties.spastInstanceGenerator import (
+    SPASTInstanceGenerator,
+)
+from tests.SRTests.utils.srInstanceGenerator import SRInstanceGenerator
+
+CAPACITY_DISTRIBUTIONS = ("random", "unit", "even", "skewed")
+
+
+def _list_length(length, longest):
+    return max(1, min(longest, round(length * longest)))
+
+
+def _set_capacities(participants, distribution, total):
+    """
+    Overwrites the capacity of each participant, so that they share roughly the
+    given total, except under "random", which keeps the generator's capacities.
+    """
+    if distribution == "random":
+        return
+    count = len(participants)
+    if distribution == "unit":
+        capacities = [1] * count
+    elif distribution == "even":
+        base, extra = divmod(total, count)
+        capacities = [base + (i < extra) for i in range(count)]
+    elif distribution == "skewed":
+        # a few large participants and a long tail of small ones, as in Zipf's law
+        weights = [1 / (i + 1) for i in range(count)]
+        scale = total / sum(weights)
+        capacities = [round(weight * scale) for weight in weights]
+        random.shuffle(capacities)
+    else:
+        raise ValueError(f"Unknown capacity distribution {distribution}")
+
+    for info, capacity in zip(participants.values(), capacities):
+        info["capacity"] = max(1, capacity)
+
+
+def _set_lecturer_capacities(instance):
+    # as in the generators, each lecturer can take their largest project, but not
+    # necessarily all of them at once
+    bounds = {L: [0, 0] for L in instance["lecturers"]}
+    for p_info in instance["projects"].values():
+        l_bounds = bounds[p_info["lecturer"]]
+        l_bounds[0] = max(l_bounds[0], p_info["capacity"])
+        l_bounds[1] += p_info["capacity"]
+    for L, l_info in instance["lecturers"].items():
+        l_info["capacity"] = random.randint(*bounds[L])
+
+
+def _generate_sm(size, length, ties=None):
+    li = _list_length(length, size)
+    if ties is None:
+        return SMInstanceGenerator(size, size, li, li).generate_instance()
+    generator = SMTInstanceGenerator(size, size, li, li)
+    generator.set_tie_density(ties)
+    return generator.generate_instance()
+
+
+def _generate_hr(size, length, capacity, ties=None):
+    hospitals = max(1, size // 10)
+    li = _list_length(length, hospitals)
+    if ties is None:
+        generator = HRInstanceGenerator(size, hospitals, li, li)
+    else:
+        generator = HRTInstanceGenerator(size, hospitals, li, li)
+        generator.set_tie_density(ties)
+    instance = generator.generate_instance()
+    _set_capacities(instance["hospitals"], capacity, size)
+    return instance
+
+
+def _generate_spa(size, length, capacity, ties=None):
+    projects = max(1, size // 2)
+    lecturers = max(1, size // 10)
+    li = _list_length(length, projects)
+    if ties is None:
+        generator = SPASInstanceGenerator(size, projects, lecturers, li, li)
+    else:
+        generator = SPASTInstanceGenerator(size, projects, lecturers, li, li)
+        generator.set_tie_density(ties)
+    instance = generator.generate_instance()
+    if capacity != "random":
+        _set_capacities(instance["projects"], capacity, size)
+        _set_lecturer_capacities(instance)
+    return instance
+
+
+def _generate_spa_sparse(size, entries, capacity):
+    """
+    As _generate_spa, but each lecturer only ranks the students who rank one of
+    their projects, as the generators' lecturers rank every student, which is
+    quadratic in size.
+    """
+    projects = max(1, size // 2)
+    lecturers = max(1, size // 10)
+    instance = {
+        "students": {
+            s: random.sample(range(1, projects + 1), min(entries, projects))
+            for s in range(1, size + 1)
+        },
+        "projects": {
+            p: {
+                "capacity": random.randint(1, size),
+                "lecturer": (p - 1) % lecturers + 1,
+            }
+            for p in range(1, projects + 1)
+        },
+        "lecturers": {
+            L: {"capacity": 0, "preferences": []} for L in range(1, lecturers + 1)
+        },
+    }
+    applicants = {L: set() for L in instance["lecturers"]}
+    for s, s_list in instance["students"].items():
+        for p in s_list:
+            applicants[instance["projects"][p]["lecturer"]].add(s)
+    for L, l_info in instance["lecturers"].items():
+        l_info["preferences"] = sorted(applicants[L])
+        random.shuffle(l_info["preferences"])
+
+    _set_capacities(instance["projects"], capacity, size)
+    _set_lecturer_capacities(instance)
+    return instance
+
+
+def _generate_sr(size, length):
+    li = _list_length(length, size - 1)
+    return SRInstanceGenerator(size, li, li).generate_instance()
+
+
+def _generate_spap(size, length, capacity, directory):
+    # imported here, so that the other families can run without Gurobi
+    from algmatch.stableMatchings.studentProjectAllocation.SPA_P.instanceGenerators import (
+        SPAPIG_Random,
+    )
+
+    projects = max(1, size // 2)
+    li = _list_length(length, projects)
+    if capacity == "random":
+        force_project_capacity = 0
+    elif capacity == "even":
+        force_project_capacity = ceil(1.1 * size / projects)
+    else:
+        raise ValueError(f"Unknown SPA-P capacity distribution {capacity}")
+
+    generator = SPAPIG_Random(
+        num_students=size,
+        lower_bound=li,
+        upper_bound=li,
+        num_projects=projects,
+        num_lecturers=max(1, size // 10),
+        force_project_capacity=force_project_capacity,
+    )
+    generator.generate_instance()
+    filename = os.path.join(directory, f"spap_{size}_{li}_{capacity}.txt")
+    generator.write_instance_to_file(filename)
+    return filename
+
+
+def _generate_spap_sparse(size, entries, capacity, directory):
+    """
+    As _generate_spap, but each student ranks a fixed number of projects, as the
+    generator's lists are proportional to size, and copying them is quadratic.
+    """
+    projects = max(1, size // 2)
+    lecturers = max(1, size // 10)
+    # the generator's random capacities also share 1.1 places per student
+    mean_capacity = ceil(1.1 * size / projects)
+    instance = {
+        "projects": {
+            p: {
+                "capacity": random.randint(1, 2 * mean_capacity - 1),
+                "lecturer": (p - 1) % lecturers + 1,
+            }
+            for p in range(1, projects + 1)
+        },
+        "lecturers": {L: {"capacity": 0} for L in range(1, lecturers + 1)},
+    }
+    _set_capacities(instance["projects"], capacity, ceil(1.1 * size))
+    _set_lecturer_capacities(instance)
+
+    offered = {L: [] for L in instance["lecturers"]}
+    for p, p_info in instance["projects"].items():
+        offered[p_info["lecturer"]].append(p)
+
+    filename = os.path.join(directory, f"spap_sparse_{size}_{entries}_{capacity}.txt")
+    with open(filename, "w") as f:
+        f.write(f"{size} {projects} {lecturers}\n")
+        for s in range(1, size + 1):
+            s_list = random.sample(range(1, projects + 1), min(entries, projects))
+            f.write(" ".join(map(str, [s, *s_list])) + "\n")
+        for p, p_info in instance["projects"].items():
+            f.write(f"{p} {p_info['capacity']} {p_info['lecturer']}\n")
+        for L, l_info in instance["lecturers"].items():
+            random.shuffle(offered[L])
+            f.write(" ".join(map(str, [L, l_info["capacity"], *offered[L]])) + "\n")
+    return filename
+
+
+def _spap_problem(filename, output_flag, backend="gurobi", mode="exact", improve=True):
+    from algmatch.studentProjectAllocationProjects import (
+        StudentProjectAllocationProjectsSingle,
+    )
+
+    return StudentProjectAllocationProjectsSingle(
+        filename=filename,
+        output_flag=output_flag,
+        backend=backend,
+        mode=mode,
+        improve=improve,
+    )
+
+
+class _SPAPModelBuild:
+    """
+    Builds the SPA-P model without solving it, so that instances too large for the
+    size-limited Gurobi licence can time how construction scales.
+    """
+
+    def __init__(self, filename):
+        from algmatch.stableMatchings.studentProjectAllocation.SPA_P.SPAPSolver import (
+            SPAPSolver,
+        )
+
+        self.solver = SPAPSolver(filename=filename, output_flag=0)
+
+    def get_stable_matching(self):
+        self.solver.build_model()
+
+
+# generate builds a dictionary, or writes a file into the given directory when the
+# family's solvers take a filename; solvers map labels to a problem and its arguments;
+# reps and repeat, if given, override those of the run for the family
+FAMILIES = {
+    "SM": {
+        "generate": _generate_sm,
+        "source": "dictionary",
+        "solvers": {
+            "men": (StableMarriageProblem, {"optimised_side": "men"}),
+            "women": (StableMarriageProblem, {"optimised_side": "women"}),
+            "men/array": (
+                StableMarriageProblem,
+                {"optimised_side": "men", "engine": "array"},
+            ),
+            "women/array": (
+                StableMarriageProblem,
+                {"optimised_side": "women", "engine": "array"},
+            ),
+            "egalitarian": (StableMarriageProblem, {"optimised_side": "egalitarian"}),
+            "minimum_regret": (
+                StableMarriageProblem,
+                {"optimised_side": "minimum_regret"},
+            ),
+        },
+        "defaults": {"size": 100, "length": 1.0},
+        "sweeps": {
+            "size": [50, 100, 200, 400],
+            "length": [0.1, 0.25, 0.5, 1.0],
+        },
+    },
+    "SMT": {
+        "generate": _generate_sm,
+        "source": "dictionary",
+        "solvers": {
+            f"{stability}/{side}": (
+                StableMarriageProblemWithTies,
+                {"optimised_side": side, "stability_type": stability},
+            )
+            for stability in ("super", "strong")
+            for side in ("men", "women")
+        },
+        "defaults": {"size": 50, "length": 1.0, "ties": 0.25},
+        "sweeps": {
+            "size": [25, 50, 100, 200],
+            "length": [0.25, 0.5, 1.0],
+            "ties": [0.0, 0.25, 0.5, 0.75, 1.0],
+        },
+    },
+    "HR": {
+        "generate": _generate_hr,
+        "source": "dictionary",
+        "solvers": {
+            "residents": (HospitalResidentsProblem, {"optimised_side": "residents"}),
+            "hospitals": (HospitalResidentsProblem, {"optimised_side": "hospitals"}),
+            "residents/array": (
+                HospitalResidentsProblem,
+                {"optimised_side": "residents", "engine": "array"},
+            ),
+            "hospitals/array": (
+                HospitalResidentsProblem,
+                {"optimised_side": "hospitals", "engine": "array"},
+            ),
+            "egalitarian": (
+                HospitalResidentsProblem,
+                {"optimised_side": "egalitarian"},
+            ),
+            "minimum_regret": (
+                HospitalResidentsProblem,
+                {"optimised_side": "minimum_regret"},
+            ),
+        },
+        "defaults": {"size": 500, "length": 0.2, "capacity": "even"},
+        "sweeps": {
+            "size": [250, 500, 1000, 2000],
+            "length": [0.1, 0.2, 0.5, 1.0],
+            "capacity": list(CAPACITY_DISTRIBUTIONS),
+        },
+    },
+    "HRT": {
+        "generate": _generate_hr,
+        "source": "dictionary",
+        "solvers": {
+            f"super/{side}": (
+                HospitalResidentsProblemWithTies,
+                {"optimised_side": side, "stability_type": "super"},
+            )
+            for side in ("residents", "hospitals")
+        },
+        "defaults": {"size": 250, "length": 0.2, "capacity": "even", "ties": 0.25},
+        "sweeps": {
+            "size": [100, 250, 500, 1000],
+            "length": [0.1, 0.2, 0.5, 1.0],
+            "capacity": list(CAPACITY_DISTRIBUTIONS),
+            "ties": [0.0, 0.25, 0.5, 0.75, 1.0],
+        },
+    },
+    "SPA": {
+        "generate": _generate_spa,
+        "source": "dictionary",
+        "solvers": {
+            "students": (StudentProjectAllocation, {"optimised_side": "students"}),
+            "lecturers": (StudentProjectAllocation, {"optimised_side": "lecturers"}),
+        },
+        "defaults": {"size": 100, "length": 0.1, "capacity": "even"},
+        "sweeps": {
+            "size": [50, 100, 200, 400],
+            "length": [0.05, 0.1, 0.25, 0.5],
+            "capacity": list(CAPACITY_DISTRIBUTIONS),
+        },
+    },
+    "SPA-large": {
+        "generate": _generate_spa_sparse,
+        "source": "dictionary",
+        "solvers": {
+            "students": (StudentProjectAllocation, {"optimised_side": "students"}),
+            "lecturers": (StudentProjectAllocation, {"optimised_side": "lecturers"}),
+        },
+        # each instance takes seconds at the largest size, so is only solved once
+        "reps": 1,
+        "repeat": 1,
+        "defaults": {"size": 10000, "entries": 10, "capacity": "even"},
+        "sweeps": {
+            "size": [5000, 10000, 20000, 50000],
+        },
+    },
+    "SPAST": {
+        "generate": _generate_spa,
+        "source": "dictionary",
+        "solvers": {
+            "super/students": (
+                StudentProjectAllocationWithTies,
+                {"optimised_side": "students", "stability_type": "super"},
+            ),
+        },
+        "defaults": {"size": 100, "length": 0.1, "capacity": "even", "ties": 0.25},
+        "sweeps": {
+            "size": [50, 100, 200, 400],
+            "length": [0.05, 0.1, 0.25, 0.5],
+            "capacity": list(CAPACITY_DISTRIBUTIONS),
+            "ties": [0.0, 0.25, 0.5, 0.75, 1.0],
+        },
+    },
+    "SR": {
+        "generate": _generate_sr,
+        "source": "dictionary",
+        "solvers": {
+            "roommates": (StableRoommatesProblem, {}),
+        },
+        "defaults": {"size": 100, "length": 1.0},
+        "sweeps": {
+            "size": [50, 100, 200, 400],
+            "length": [0.1, 0.25, 0.5, 1.0],
+        },
+    },
+    "SPA-P": {
+        "generate": _generate_spap,
+        "source": "filename",
+        "solvers": {
+            "single": (_spap_problem, {"output_flag": False, "backend": "gurobi"}),
+            "single/highs": (
+                _spap_problem,
+                {"output_flag": False, "backend": "highs"},
+            ),
+            "single/approximate": (
+                _spap_problem,
+                {"output_flag": False, "mode": "approximate"},
+            ),
+        },
+        # kept small, as the size-limited Gurobi licence only solves small models
+        "defaults": {"size": 20, "length": 0.2, "capacity": "random"},
+        "sweeps": {
+            "size": [10, 20, 30],
+            "length": [0.1, 0.2, 0.4],
+            "capacity": ["random", "even"],
+        },
+    },
+    "SPA-P-build": {
+        "generate": _generate_spap,
+        "source": "filename",
+        "solvers": {
+            "build": (_SPAPModelBuild, {}),
+        },
+        # each instance takes seconds at the largest size, so is only built once
+        "reps": 1,
+        "repeat": 1,
+        "defaults": {"size": 100, "length": 0.1, "capacity": "random"},
+        "sweeps": {
+            "size": [50, 100, 200, 400],
+            "length": [0.05, 0.1, 0.2],
+        },
+    },
+    "SPA-P-large": {
+        "generate": _generate_spap_sparse,
+        "source": "filename",
+        "solvers": {
+            "approximate": (
+                _spap_problem,
+                {"output_flag": False, "mode": "approximate"},
+            ),
+            "approximate/basic": (
+                _spap_problem,
+                {"output_flag": False, "mode": "approximate", "improve": False},
+            ),
+        },
+        # far beyond what the MILP can solve, and each instance takes seconds at
+        # the largest size, so is only solved once
+        "reps": 1,
+        "repeat": 1,
+        "defaults": {"size": 10000, "entries": 10, "capacity": "random"},
+        "sweeps": {
+            "size": [5000, 10000, 20000, 50000],
+            "capacity": ["random", "even", "skewed"],
+        },
+    },
+}
+
+
+def sweep_points(family: str) -> list:
+    """
+    :param family: e.g. "HR"
+    :return: the parameters of every instance in the family's sweep, varying one
+        parameter at a time from its defaults, which come first
+    """
+    definition = FAMILIES[family]
+    defaults = definition["defaults"]
+    points = [dict(defaults)]
+    for parameter, values in definition["sweeps"].items():
+        for value in values:
+            point = {**defaults, parameter: value}
+            if point not in points:
+                points.append(point)
+    return points
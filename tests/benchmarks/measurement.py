@@ -0,0 +1,209 @@
+"""
+Measures the time, peak memory and operation count of every solver in a sweep.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import gc
+import io
+import multiprocessing
+import os
+import random
+from statistics import mean, median, stdev
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+import tracemalloc
+import zlib
+
+import algmatch
+from tests.benchmarks.families import FAMILIES, sweep_points
+
+ALGMATCH_DIR = os.path.dirname(algmatch.__file__)
+
+
+def case_id(family: str, solver: str, params: dict) -> str:
+    """
+    :return: a key identifying the case across runs, e.g. "HR/residents/size=500,..."
+    """
+    parameters = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"{family}/{solver}/{parameters}"
+
+
+def _seed(family: str, params: dict, rep: int) -> int:
+    # the same instances are generated on every run, whatever the hash seed
+    return zlib.crc32(case_id(family, "", params).encode()) + rep
+
+
+def _count_operations(function):
+    """
+    Counts the calls made to algmatch functions while running the given function,
+    which unlike time does not depend on the machine.
+    """
+    calls = 0
+
+    def profiler(frame, event, arg):
+        nonlocal calls
+        if event == "call" and frame.f_code.co_filename.startswith(ALGMATCH_DIR):
+            calls += 1
+
+    sys.setprofile(profiler)
+    try:
+        result = function()
+    finally:
+        sys.setprofile(None)
+    return result, calls
+
+
+def _run_solver(problem, source, kwargs):
+    # SPA-P prints its matching, which would drown out the benchmark's output
+    with redirect_stdout(io.StringIO()):
+        problem(**source, **kwargs).get_stable_matching()
+
+
+def _time_solver(problem, source, kwargs, repeat):
+    # as with timeit, the fastest of several runs is the least disturbed by the
+    # rest of the machine
+    setup_time = solve_time = None
+    for _ in range(repeat):
+        gc.collect()
+        with redirect_stdout(io.StringIO()):
+            start = perf_counter_ns()
+            solver = problem(**source, **kwargs)
+            setup_end = perf_counter_ns()
+            solver.get_stable_matching()
+            solve_end = perf_counter_ns()
+        del solver
+
+        if setup_time is None or setup_end - start < setup_time:
+            setup_time = setup_end - start
+        if solve_time is None or solve_end - setup_end < solve_time:
+            solve_time = solve_end - setup_end
+    return setup_time, solve_time
+
+
+def _measure_solver(problem, kwargs, sources, repeat):
+    # the first run pays for imports and cold caches, so it is not timed
+    _run_solver(problem, sources[0], kwargs)
+
+    setup_times = []
+    solve_times = []
+    for source in sources:
+        setup_time, solve_time = _time_solver(problem, source, kwargs, repeat)
+        setup_times.append(setup_time)
+        solve_times.append(solve_time)
+
+    # memory and operations are measured apart from time, as both slow it down
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _run_solver(problem, sources[0], kwargs)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    _, operations = _count_operations(lambda: _run_solver(problem, sources[0], kwargs))
+
+    return {
+        "setup_ms": _summarise(setup_times),
+        "solve_ms": _summarise(solve_times),
+        "peak_memory_kb": peak_memory / 1024,
+        "operations": operations,
+    }
+
+
+def _summarise(times_ns):
+    times_ms = [time / 1_000_000 for time in times_ns]
+    return {
+        "mean": mean(times_ms),
+        "median": median(times_ms),
+        "stdev": stdev(times_ms) if len(times_ms) > 1 else 0.0,
+    }
+
+
+def run_point(family: str, params: dict, reps: int, repeat: int) -> list:
+    """
+    Solves the same instances with every solver of a family.
+
+    :param family: e.g. "HR"
+    :param params: the sweep point, e.g. {"size": 500, "length": 0.2, ...}
+    :param reps: the number of instances to time each solver on
+    :param repeat: the number of times each instance is solved, keeping the fastest
+    :return: one result per solver
+    """
+    definition = FAMILIES[family]
+    results = []
+    with TemporaryDirectory() as directory:
+        sources = []
+        for rep in range(reps):
+            random.seed(_seed(family, params, rep))
+            if definition["source"] == "filename":
+                sources.append(
+                    {"filename": definition["generate"](**params, directory=directory)}
+                )
+            else:
+                sources.append({"dictionary": definition["generate"](**params)})
+
+        for solver, (problem, kwargs) in definition["solvers"].items():
+            result = {
+                "id": case_id(family, solver, params),
+                "family": family,
+                "solver": solver,
+                "params": params,
+                "reps": reps,
+                "repeat": repeat,
+            }
+            try:
+                result.update(_measure_solver(problem, kwargs, sources, repeat))
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+            results.append(result)
+    return results
+
+
+def run_sweep(families, reps: int, repeat: int, quick: bool = False, log=sys.stderr):
+    """
+    Runs the sweep points in a worker process started with a fixed hash seed, so that
+    set iteration order, and with it the operation counts, is the same on every run.
+
+    :param families: e.g. ["SM", "HR"]
+    :param reps: the number of instances per sweep point, unless the family sets
+        its own, as the largest families do to keep the run short
+    :param repeat: the number of times each instance is solved, keeping the
+        fastest, unless the family sets its own
+    :param quick: whether to run only each family's default point
+    :return: iterator of results, one per solver and sweep point
+    """
+    points = [
+        (family, params)
+        for family in families
+        for params in (
+            [FAMILIES[family]["defaults"]] if quick else sweep_points(family)
+        )
+    ]
+
+    hash_seed = os.environ.get("PYTHONHASHSEED")
+    os.environ["PYTHONHASHSEED"] = "0"
+    try:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    run_point,
+                    family,
+                    params,
+                    FAMILIES[family].get("reps", reps),
+                    FAMILIES[family].get("repeat", repeat),
+                )
+                for family, params in points
+            ]
+            for i, ((family, params), future) in enumerate(zip(points, futures)):
+                print(
+                    f"[{i + 1}/{len(points)}] {case_id(family, '*', params)}", file=log
+                )
+                yield from future.result()
+    finally:
+        if hash_seed is None:
+            del os.environ["PYTHONHASHSEED"]
+        else:
+            os.environ["PYTHONHASHSEED"] = hash_seed
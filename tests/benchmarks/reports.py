@@ -0,0 +1,245 @@
+"""
+Writes benchmark results as JSON, CSV and markdown, and compares them to a baseline.
+"""
+
+import csv
+from datetime import datetime, timezone
+import json
+import os
+import platform
+
+from tests.benchmarks.families import FAMILIES
+
+CSV_FIELDS = [
+    "id",
+    "family",
+    "solver",
+    "size",
+    "length",
+    "ties",
+    "capacity",
+    "reps",
+    "repeat",
+    "setup_ms_mean",
+    "setup_ms_median",
+    "setup_ms_stdev",
+    "solve_ms_mean",
+    "solve_ms_median",
+    "solve_ms_stdev",
+    "peak_memory_kb",
+    "operations",
+    "error",
+]
+
+
+def machine_info() -> dict:
+    """
+    :return: a description of this machine, stored alongside its results
+    """
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def make_report(results: list, reps: int, repeat: int) -> dict:
+    return {
+        "machine": machine_info(),
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        "reps": reps,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def write_json(report: dict, filename: str) -> None:
+    with open(filename, "w") as file:
+        json.dump(report, file, indent=1)
+        file.write("\n")
+
+
+def load_json(filename: str) -> dict:
+    with open(filename) as file:
+        return json.load(file)
+
+
+def write_csv(report: dict, filename: str) -> None:
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for result in report["results"]:
+            row = {key: result.get(key) for key in ("id", "family", "solver")}
+            row.update(result["params"])
+            row["reps"] = result["reps"]
+            row["repeat"] = result["repeat"]
+            if "error" in result:
+                row["error"] = result["error"]
+            else:
+                for timing in ("setup_ms", "solve_ms"):
+                    for statistic in ("mean", "median", "stdev"):
+                        value = result[timing][statistic]
+                        row[f"{timing}_{statistic}"] = f"{value:.4f}"
+                row["peak_memory_kb"] = f"{result['peak_memory_kb']:.1f}"
+                row["operations"] = result["operations"]
+            writer.writerow(row)
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.1,
+    operations_tolerance: float = 0.01,
+) -> tuple:
+    """
+    Finds the cases that got worse than the baseline by more than a tolerance, as a
+    fraction of the baseline, or that improved by as much.
+
+    Times are only compared when the baseline was recorded on the same machine, as
+    they are meaningless across machines; operation counts and peak memory are.
+    Times are compared by their median, and differences under a millisecond are
+    noise, so are never flagged.
+
+    :return: lists of regressions and improvements, each a readable line, and
+        whether times were compared
+    """
+    compare_times = report["machine"] == baseline["machine"]
+    tolerances = {
+        "peak_memory_kb": memory_tolerance,
+        "operations": operations_tolerance,
+    }
+    if compare_times:
+        tolerances["setup_ms"] = time_tolerance
+        tolerances["solve_ms"] = time_tolerance
+
+    baseline_results = {result["id"]: result for result in baseline["results"]}
+    regressions = []
+    improvements = []
+    for result in report["results"]:
+        old = baseline_results.get(result["id"])
+        if old is None or "error" in old:
+            continue
+        if "error" in result:
+            regressions.append(f"{result['id']}: {result['error']}")
+            continue
+
+        for metric, tolerance in tolerances.items():
+            new_value, old_value = result[metric], old[metric]
+            if metric.endswith("_ms"):
+                new_value, old_value = new_value["median"], old_value["median"]
+                if abs(new_value - old_value) < 1:
+                    continue
+            if old_value == 0:
+                continue
+
+            change = (new_value - old_value) / old_value
+            line = f"{result['id']}: {metric} {old_value:.6g} -> {new_value:.6g} ({change:+.0%})"
+            if change > tolerance:
+                regressions.append(line)
+            elif change < -tolerance:
+                improvements.append(line)
+
+    return regressions, improvements, compare_times
+
+
+def _format_time(timing: dict) -> str:
+    return f"{timing['mean']:.2f} ± {timing['stdev']:.2f}"
+
+
+def _result_row(value, result) -> str:
+    if "error" in result:
+        return f"| {value} | {result['solver']} | {result['error']} | | | |"
+    return (
+        f"| {value} | {result['solver']} | {_format_time(result['setup_ms'])} "
+        f"| {_format_time(result['solve_ms'])} "
+        f"| {result['peak_memory_kb'] / 1024:.2f} | {result['operations']:,} |"
+    )
+
+
+def write_markdown(report: dict, filename: str, source: str) -> None:
+    """
+    Writes one table per family and swept parameter.
+
+    :param source: the results file the markdown is generated from, named in its header
+    """
+    machine = report["machine"]
+    lines = [
+        "# Benchmarks",
+        "",
+        f"Generated by `python -m tests.benchmarks` from `{source}`; do not edit by hand.",
+        "",
+        "Each solver is timed on the same randomly generated instances, and its peak",
+        "memory (traced Python allocations) and operation count (calls to algmatch",
+        "functions) are measured on the first of them. Times are split into",
+        "constructing the solver, which includes reading the instance, and finding",
+        f"the matching. Each is the mean ± standard deviation over {report['reps']} instances,",
+        f"taking the fastest of {report['repeat']} runs on each.",
+        "",
+        "## Machine",
+        "",
+        f"Platform: {machine['platform']}",
+        f"Processor: {machine['processor']} ({machine['cpus']} CPUs)",
+        f"Python: {machine['python']}",
+        f"Date: {report['date']}",
+    ]
+
+    results = {}
+    for result in report["results"]:
+        results.setdefault(result["family"], []).append(result)
+
+    for family, definition in FAMILIES.items():
+        if family not in results:
+            continue
+        defaults = definition["defaults"]
+        lines += [
+            "",
+            f"## {family}",
+            "",
+            "Defaults: "
+            + ", ".join(f"{key} {value}" for key, value in defaults.items())
+            + ".",
+        ]
+        first = results[family][0]
+        if (first["reps"], first["repeat"]) != (report["reps"], report["repeat"]):
+            instances = "instance" if first["reps"] == 1 else "instances"
+            runs = "run" if first["repeat"] == 1 else "runs"
+            lines[-1] += (
+                f" Timed on {first['reps']} {instances} per point, taking the"
+                f" fastest of {first['repeat']} {runs} on each."
+            )
+
+        tables = []
+        for parameter, values in definition["sweeps"].items():
+            rows = [
+                result
+                for result in results[family]
+                if all(
+                    result["params"][key] == value
+                    for key, value in defaults.items()
+                    if key != parameter
+                )
+            ]
+            if len({str(result["params"][parameter]) for result in rows}) > 1:
+                rows.sort(key=lambda result: values.index(result["params"][parameter]))
+                tables.append((parameter, rows))
+        if not tables:
+            # only the default point was run
+            parameter = next(iter(defaults))
+            tables.append((parameter, results[family]))
+
+        for parameter, rows in tables:
+            lines += [
+                "",
+                f"### {family} by {parameter}",
+                "",
+                f"| {parameter} | solver | setup (ms) | solve (ms) | peak memory (MB) | operations |",
+                "| --- | --- | --- | --- | --- | --- |",
+            ]
+            lines += [
+                _result_row(result["params"][parameter], result) for result in rows
+            ]
+
+    with open(filename, "w") as file:
+        file.write("\n".join(lines) + "\n")
@@ -0,0 +1,106 @@
+"""
+Measures how long a fresh process takes to import algmatch and solve a small
+Hospital/Residents instance, against loading every lazily imported export as well,
+which is what importing the package used to cost.
+
+    python -m tests.benchmarks.startup
+    python -m tests.benchmarks.startup --runs 20 --size 200
+"""
+
+import argparse
+import json
+import random
+from statistics import median
+import subprocess
+import sys
+
+from tests.HRTests.utils.noTies.hrInstanceGenerator import HRInstanceGenerator
+
+# each snippet runs in its own interpreter, and prints the milliseconds it spent
+# importing and solving, as measured from inside the process
+SNIPPETS = {
+    "import": "",
+    "import + HR solve": "algmatch.HR(dictionary=INSTANCE).get_stable_matching()",
+    "import + every export": "[getattr(algmatch, name) for name in algmatch._LAZY_EXPORTS]",
+}
+
+TEMPLATE = """
+from time import perf_counter_ns
+start = perf_counter_ns()
+import algmatch
+imported = perf_counter_ns()
+INSTANCE = {instance}
+{snippet}
+end = perf_counter_ns()
+print((imported - start) / 1e6, (end - imported) / 1e6)
+"""
+
+
+def _time_process(code: str) -> tuple[float, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    import_ms, rest_ms = result.stdout.split()
+    return float(import_ms), float(rest_ms)
+
+
+def measure(runs: int, instance: dict) -> dict:
+    """
+    :param runs: the number of fresh processes to time for each snippet
+    :param instance: the Hospital/Residents instance to solve
+    :return: for each snippet, the median milliseconds spent importing, and spent
+        importing and then running the snippet
+    """
+    results = {}
+    for label, snippet in SNIPPETS.items():
+        code = TEMPLATE.format(instance=repr(instance), snippet=snippet)
+        try:
+            times = [_time_process(code) for _ in range(runs)]
+        except subprocess.CalledProcessError as e:
+            # every export includes SPA-P, which cannot load without Gurobi
+            results[label] = {"error": e.stderr.strip().splitlines()[-1]}
+            continue
+        results[label] = {
+            "import_ms": median(import_ms for import_ms, _ in times),
+            "total_ms": median(import_ms + rest_ms for import_ms, rest_ms in times),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.startup",
+        description="Time importing algmatch and solving in a fresh process.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="processes per snippet (default: 10)"
+    )
+    parser.add_argument(
+        "--size", type=int, default=100, help="residents in the instance (default: 100)"
+    )
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+    assert args.runs > 0, "Param runs must be a positive int"
+    assert args.size > 0, "Param size must be a positive int"
+
+    random.seed(0)
+    hospitals = max(1, args.size // 10)
+    instance = HRInstanceGenerator(
+        args.size, hospitals, 1, min(5, hospitals)
+    ).generate_instance()
+    results = measure(args.runs, instance)
+
+    print(f"{'':<24}{'import (ms)':>14}{'total (ms)':>14}")
+    for label, result in results.items():
+        if "error" in result:
+            print(f"{label:<24}{result['error']}")
+        else:
+            print(f"{label:<24}{result['import_ms']:>14.1f}{result['total_ms']:>14.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()